@@ -0,0 +1,36 @@
+import { test, expect } from '@playwright/test';
+import { readFileSync } from 'fs';
+
+// Reference rankings from the Python engine (python scripts/search_index.py parity)
+const parity: { source: { hash: string }; limit: number; queries: Record<string, string[]> } = JSON.parse(
+  readFileSync(new URL('./fixtures/search-parity.json', import.meta.url), 'utf-8')
+);
+
+test.describe('Search index parity', () => {
+  test('searchIndex.ts ranks like scripts/search_index.py', async ({ page }) => {
+    await page.goto('/iso20022');
+    await page.waitForLoadState('networkidle');
+
+    // Run the engine module from the dev server against the deployed index
+    const { hash, results } = await page.evaluate(async ({ queries, limit }) => {
+      const { ErrorSearchIndex } = await import('/iso20022/src/utils/searchIndex.ts');
+      const data = await fetch('/iso20022/data/search/errors_index.json').then((res) => res.json());
+      const engine = new ErrorSearchIndex(data);
+      return {
+        hash: data.source.hash,
+        results: Object.fromEntries(queries.map((query: string) => [query, engine.search(query).slice(0, limit)])),
+      };
+    }, { queries: Object.keys(parity.queries), limit: parity.limit });
+
+    expect(hash, 'fixture is stale: run python scripts/search_index.py parity').toBe(parity.source.hash);
+    expect(results).toEqual(parity.queries);
+  });
+
+  test('plural queries find the singular matches', async () => {
+    // "charges" must not lose what "charge" finds
+    for (const code of ['CHG04', 'CHG05', 'CHG10', 'FRAUD13']) {
+      expect(parity.queries['charge']).toContain(code);
+      expect(parity.queries['charges']).toContain(code);
+    }
+  });
+});
@@ -0,0 +1,153 @@
+/**
+ * Post-build data stage: precompression, cache headers and size report
+ *
+ * Runs after post-build.js. For everything under dist/iso20022/data/ it:
+ *   1. writes .br (quality 11) and .gz (level 9) siblings, for hosts that
+ *      serve precompressed files (Cloudflare compresses on the fly, but
+ *      the sizes here are what clients actually download)
+ *   2. appends _headers rules: directories of content-hashed files
+ *      (name.<hash>.json and Vite's assets/) are immutable for a year,
+ *      everything else in data/ (manifests, indexes, the source datasets)
+ *      must revalidate
+ *   3. prints raw / gzip / brotli sizes per directory
+ */
+
+import { existsSync, readdirSync, readFileSync, statSync, writeFileSync } from 'fs';
+import { join, dirname, relative, posix } from 'path';
+import { fileURLToPath } from 'url';
+import { brotliCompressSync, gzipSync, constants } from 'zlib';
+
+const __dirname = dirname(fileURLToPath(import.meta.url));
+const distRoot = join(__dirname, '../dist');
+const basePath = '/iso20022';
+const dataDir = join(distRoot, 'iso20022', 'data');
+const headersFile = join(distRoot, '_headers');
+
+const HASHED_FILE = /^(.+)\.[0-9a-f]{8,}\.json$/;
+const COMPRESSIBLE = /\.(json|txt|xml)$/;
+const IMMUTABLE = 'public, max-age=31536000, immutable';
+const REVALIDATE = 'public, max-age=0, must-revalidate';
+const BEGIN_MARK = '# BEGIN generated by scripts/compress-data.js';
+const END_MARK = '# END generated by scripts/compress-data.js';
+const MAX_RULES = 100;
+
+function walk(dir) {
+  return readdirSync(dir).flatMap((name) => {
+    const path = join(dir, name);
+    return statSync(path).isDirectory() ? walk(path) : [path];
+  });
+}
+
+function compress(path) {
+  const raw = readFileSync(path);
+  const br = brotliCompressSync(raw, {
+    params: {
+      [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY,
+      [constants.BROTLI_PARAM_MODE]: constants.BROTLI_MODE_TEXT,
+      [constants.BROTLI_PARAM_SIZE_HINT]: raw.length,
+    },
+  });
+  const gz = gzipSync(raw, { level: constants.Z_BEST_COMPRESSION });
+  writeFileSync(`${path}.br`, br);
+  writeFileSync(`${path}.gz`, gz);
+  return { raw: raw.length, gz: gz.length, br: br.length };
+}
+
+/**
+ * One wildcard rule per directory holding content-hashed files, e.g.
+ * /iso20022/data/chunks/*, plus a revalidating rule for each unhashed file
+ * in such a directory (its index.json or manifest.json). Cloudflare Pages
+ * only honours the first 100 rules, so the count must not grow with the
+ * number of hashed files.
+ */
+function headerRules(files) {
+  const hashedDirs = new Set();
+  const unhashed = new Map();
+  for (const file of files) {
+    const rel = relative(dataDir, file).split('\\').join('/');
+    const dir = posix.dirname(rel);
+    if (HASHED_FILE.test(posix.basename(rel))) {
+      hashedDirs.add(dir);
+    } else {
+      unhashed.set(rel, dir);
+    }
+  }
+
+  // Later matching rules add to earlier ones, so each rule first detaches
+  // the Cache-Control set by the broader rule before it.
+  const rules = [
+    BEGIN_MARK,
+    `${basePath}/data/*`,
+    `  Cache-Control: ${REVALIDATE}`,
+    '',
+    `${basePath}/assets/*`,
+    `  Cache-Control: ${IMMUTABLE}`,
+  ];
+  for (const dir of [...hashedDirs].sort()) {
+    rules.push('', `${basePath}/data/${dir}/*`, '  ! Cache-Control', `  Cache-Control: ${IMMUTABLE}`);
+  }
+  const revalidated = [...unhashed].filter(([, dir]) => hashedDirs.has(dir)).map(([rel]) => rel).sort();
+  for (const rel of revalidated) {
+    rules.push('', `${basePath}/data/${rel}`, '  ! Cache-Control', `  Cache-Control: ${REVALIDATE}`);
+  }
+  rules.push(END_MARK);
+  const count = 2 + hashedDirs.size + revalidated.length;
+  if (count > MAX_RULES) {
+    console.warn(`⚠ ${count} _headers rules; Cloudflare Pages ignores all after the first ${MAX_RULES}`);
+  }
+  return { text: rules.join('\n'), hashed: hashedDirs.size, revalidated: revalidated.length };
+}
+
+function writeHeaders(rules) {
+  let current = existsSync(headersFile) ? readFileSync(headersFile, 'utf8') : '';
+  const begin = current.indexOf(BEGIN_MARK);
+  if (begin !== -1) {
+    const end = current.indexOf(END_MARK, begin);
+    current = current.slice(0, begin) + current.slice(end === -1 ? current.length : end + END_MARK.length + 1);
+  }
+  writeFileSync(headersFile, `${current.trimEnd()}\n\n${rules}\n`);
+}
+
+function kb(bytes) {
+  return `${(bytes / 1024).toFixed(1)} KB`.padStart(10);
+}
+
+if (!existsSync(dataDir)) {
+  console.log(`⚠ ${relative(process.cwd(), dataDir)} not found; run the Vite build first`);
+  process.exit(1);
+}
+
+console.log('🗜️  Data stage: precompressing data/ and writing cache headers...');
+
+const files = walk(dataDir).filter((file) => COMPRESSIBLE.test(file));
+const byDir = new Map();
+const totals = { files: 0, raw: 0, gz: 0, br: 0, hashed: 0 };
+
+for (const file of files) {
+  const sizes = compress(file);
+  const dir = relative(dataDir, dirname(file)) || '.';
+  const entry = byDir.get(dir) ?? { files: 0, raw: 0, gz: 0, br: 0 };
+  for (const key of ['raw', 'gz', 'br']) {
+    entry[key] += sizes[key];
+    totals[key] += sizes[key];
+  }
+  entry.files += 1;
+  totals.files += 1;
+  if (HASHED_FILE.test(file.split(/[\\/]/).pop())) totals.hashed += sizes.br;
+  byDir.set(dir, entry);
+}
+
+const { text, hashed, revalidated } = headerRules(files);
+writeHeaders(text);
+console.log(`  ✓ _headers: ${hashed} immutable hashed-directory rules, ${revalidated} revalidated indexes + data/*`);
+
+console.log('');
+console.log(`  ${'data/'.padEnd(14)}${'files'.padStart(6)}${'raw'.padStart(10)}${'gzip'.padStart(10)}${'brotli'.padStart(10)}`);
+for (const [dir, entry] of [...byDir.entries()].sort()) {
+  console.log(`  ${dir.padEnd(14)}${String(entry.files).padStart(6)}${kb(entry.raw)}${kb(entry.gz)}${kb(entry.br)}`);
+}
+console.log(`  ${'total'.padEnd(14)}${String(totals.files).padStart(6)}${kb(totals.raw)}${kb(totals.gz)}${kb(totals.br)}`);
+console.log('');
+console.log(`  Brotli saves ${(100 - (totals.br / totals.raw) * 100).toFixed(0)}% of data/ transfer;`);
+console.log(`  ${kb(totals.hashed).trim()} of it is content-hashed and never refetched once cached.`);
+console.log('✅ Data stage complete!\n');
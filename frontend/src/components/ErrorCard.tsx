@@ -2,11 +2,11 @@ import { memo } from 'react';
 import type { FC } from 'react';
 import { Card, CardContent, Typography, Chip, Box, Stack } from '@mui/material';
 import { motion } from 'framer-motion';
-import type { PaymentError } from '../types/error';
+import type { PaymentErrorSummary } from '../types/error';
 
 interface ErrorCardProps {
-  error: PaymentError;
-  onClick: (error: PaymentError) => void;
+  error: PaymentErrorSummary;
+  onClick: (error: PaymentErrorSummary) => void;
 }
 
 // Linear Aesthetic spring animation config
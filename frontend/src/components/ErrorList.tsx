@@ -5,7 +5,7 @@ import { motion, AnimatePresence } from 'framer-motion';
 import ViewModuleIcon from '@mui/icons-material/ViewModule';
 import ViewListIcon from '@mui/icons-material/ViewList';
 import { ErrorCard } from './ErrorCard';
-import type { PaymentError } from '../types/error';
+import type { PaymentErrorSummary } from '../types/error';
 
 // Linear Aesthetic animation config
 // Note: staggerChildren is set dynamically based on item count
@@ -36,8 +36,8 @@ const itemVariants = {
 };
 
 interface ErrorListProps {
-  errors: PaymentError[];
-  onErrorClick: (error: PaymentError) => void;
+  errors: PaymentErrorSummary[];
+  onErrorClick: (error: PaymentErrorSummary) => void;
 }
 
 const ITEMS_PER_PAGE = 12;
@@ -0,0 +1,33 @@
+import { Fragment, memo } from 'react';
+import type { FC } from 'react';
+import { TermWithHelp } from './HelpIcon';
+import { splitAnnotated } from '../utils/glossaryAnnotations';
+
+interface GlossaryTextProps {
+  /** The text to render */
+  text: string;
+  /** Precomputed spans for this field (from loadAnnotations) */
+  spans?: number[];
+  /** Term ids the spans index into */
+  terms: string[];
+}
+
+/**
+ * Renders text with glossary help icons on the terms found at build time.
+ * Usage: <GlossaryText text={error.description.short} spans={fields?.['description.short']} terms={terms} />
+ */
+export const GlossaryText: FC<GlossaryTextProps> = memo(({ text, spans, terms }) => (
+  <>
+    {splitAnnotated(text, spans, terms).map((segment, i) =>
+      segment.termId ? (
+        <TermWithHelp key={i} term={segment.termId}>
+          {segment.text}
+        </TermWithHelp>
+      ) : (
+        <Fragment key={i}>{segment.text}</Fragment>
+      )
+    )}
+  </>
+));
+
+GlossaryText.displayName = 'GlossaryText';
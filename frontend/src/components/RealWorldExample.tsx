@@ -1,4 +1,4 @@
-import { useState, useCallback, useRef } from 'react';
+import { useState, useCallback, useRef, useEffect } from 'react';
 import type { FC } from 'react';
 import html2canvas from 'html2canvas';
 import {
@@ -24,6 +24,7 @@ import {
   Button,
   Tabs,
   Tab,
+  CircularProgress,
 } from '@mui/material';
 import {
   ExpandMore as ExpandMoreIcon,
@@ -70,7 +71,8 @@ import { motion, AnimatePresence } from 'framer-motion';
 import { TermWithHelp } from './HelpIcon';
 import { ReactFlowGraph } from './flow/ReactFlowGraph';
 import { QuizMode } from './flow/QuizMode';
-import type { RealWorldExample as RealWorldExampleType, Step as StepType, PossibleError, Character } from '../hooks/useRealWorldExamples';
+import { useExampleDetail } from '../hooks/useRealWorldExamples';
+import type { ExampleSummary, Step as StepType, PossibleError, Character } from '../hooks/useRealWorldExamples';
 import type { MessageDefinition } from '../hooks/useMessageDefinitions';
 
 // Category colors for message types
@@ -96,7 +98,7 @@ const getTimingEstimate = (messageType: string): string => {
 };
 
 interface RealWorldExampleProps {
-  example: RealWorldExampleType;
+  example: ExampleSummary;
   defaultExpanded?: boolean;
   messageMap?: Map<string, MessageDefinition>;
 }
@@ -1669,6 +1671,39 @@ const GraphView: FC<GraphViewProps> = ({ steps, messageMap, possibleErrors = [],
   );
 };
 
+/**
+ * Loads the next window of steps when it scrolls into view (with a button
+ * for browsers without IntersectionObserver).
+ */
+const StepWindowSentinel: FC<{ onVisible: () => void; loading: boolean }> = ({ onVisible, loading }) => {
+  const ref = useRef<HTMLDivElement>(null);
+
+  useEffect(() => {
+    const node = ref.current;
+    if (!node || loading || typeof IntersectionObserver === 'undefined') return;
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) onVisible();
+      },
+      { rootMargin: '400px 0px' }
+    );
+    observer.observe(node);
+    return () => observer.disconnect();
+  }, [onVisible, loading]);
+
+  return (
+    <Box ref={ref} sx={{ py: 2, display: 'flex', justifyContent: 'center' }}>
+      {loading ? (
+        <CircularProgress size={20} />
+      ) : (
+        <Button size="small" onClick={onVisible}>
+          Load more steps
+        </Button>
+      )}
+    </Box>
+  );
+};
+
 export const RealWorldExample: FC<RealWorldExampleProps> = ({
   example,
   defaultExpanded = false,
@@ -1676,6 +1711,20 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
 }) => {
   const [expanded, setExpanded] = useState(defaultExpanded);
   const [viewMode, setViewMode] = useState<'normal' | 'tree' | 'graph' | 'sequence' | 'quiz'>('normal');
+  const {
+    example: full,
+    outline,
+    hasMore,
+    loadingMore,
+    loadMore,
+    loadAll,
+    error: detailError,
+  } = useExampleDetail(example, expanded);
+
+  // Only the list view pages through steps; the other views draw them all.
+  useEffect(() => {
+    if (expanded && viewMode !== 'normal') loadAll();
+  }, [expanded, viewMode, loadAll]);
 
   const handleExpandClick = () => {
     setExpanded(!expanded);
@@ -1740,7 +1789,7 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                 sx={{ fontSize: '0.7rem', height: 20 }}
               />
               <Chip
-                label={`${example.steps.length} steps`}
+                label={`${example.step_count} steps`}
                 size="small"
                 sx={{ fontSize: '0.7rem', height: 20, bgcolor: 'action.hover' }}
               />
@@ -1776,6 +1825,15 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
               transition={{ duration: 0.2, ease: 'easeInOut' }}
             >
               <Collapse in={expanded} timeout="auto">
+                {!full ? (
+                  <Box sx={{ mt: 2, py: 3, display: 'flex', justifyContent: 'center' }}>
+                    {detailError ? (
+                      <Alert severity="error">{detailError}</Alert>
+                    ) : (
+                      <CircularProgress size={24} />
+                    )}
+                  </Box>
+                ) : (
                 <Box sx={{ mt: 2 }}>
                   {/* View Toggle */}
                   <Stack direction="row" justifyContent="flex-end" sx={{ mb: 2 }}>
@@ -1823,7 +1881,7 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                       </Typography>
                     </Stack>
                     <Stack direction="row" spacing={2} flexWrap="wrap" useFlexGap>
-                      {Object.entries(example.characters).map(([key, character]) => (
+                      {Object.entries(full.characters).map(([key, character]) => (
                         <Paper
                           key={key}
                           sx={{
@@ -1861,8 +1919,9 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                     </Stack>
 
                     {viewMode === 'normal' ? (
+                      <>
                       <Stepper orientation="vertical" sx={{ pl: 0 }}>
-                        {example.steps.map((step, index) => {
+                        {full.steps.map((step, index) => {
                           const msgDef = messageMap?.get(step.message_type);
                           return (
                           <Step key={step.step} active expanded>
@@ -1878,7 +1937,7 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                             </StepLabel>
                             <StepContent
                               sx={{
-                                borderLeft: index === example.steps.length - 1 ? 'none' : undefined,
+                                borderLeft: index === full.steps.length - 1 ? 'none' : undefined,
                               }}
                             >
                               <Box sx={{ pb: 2 }}>
@@ -1976,32 +2035,39 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                           </Step>
                         )})}
                       </Stepper>
+                      {hasMore && <StepWindowSentinel onVisible={loadMore} loading={loadingMore} />}
+                      </>
+                    ) : hasMore ? (
+                      // Graph, sequence, tree and quiz views need every step
+                      <Box sx={{ py: 3, display: 'flex', justifyContent: 'center' }}>
+                        <CircularProgress size={24} />
+                      </Box>
                     ) : viewMode === 'tree' ? (
                       // Tree/Flow View
                       <Box sx={{ display: 'flex', flexDirection: 'column', alignItems: 'center', py: 2 }}>
-                        {example.steps.map((step, index) => (
+                        {full.steps.map((step, index) => (
                           <TreeViewStep 
                             key={step.step} 
                             step={step} 
-                            isLast={index === example.steps.length - 1}
+                            isLast={index === full.steps.length - 1}
                             messageMap={messageMap}
                           />
                         ))}
                       </Box>
                     ) : viewMode === 'graph' ? (
                       // Graph View
-                      <GraphView steps={example.steps} messageMap={messageMap} possibleErrors={example.possible_errors} exampleId={example.id} characters={example.characters} />
+                      <GraphView steps={full.steps} messageMap={messageMap} possibleErrors={full.possible_errors} exampleId={full.id} characters={full.characters} />
                     ) : viewMode === 'sequence' ? (
                       // Sequence View
-                      <SequenceView steps={example.steps} messageMap={messageMap} />
+                      <SequenceView steps={full.steps} messageMap={messageMap} />
                     ) : (
                       // Quiz Mode
                       <QuizMode
-                        steps={example.steps}
-                        messageMap={messageMap}
-                        characters={example.characters}
-                        exampleTitle={example.title}
-                        scenario={example.scenario}
+                        steps={full.steps}
+                        characters={full.characters}
+                        exampleId={full.id}
+                        exampleTitle={full.title}
+                        scenario={full.scenario}
                       />
                     )}
                   </Box>
@@ -2025,7 +2091,7 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                         </Typography>
                         {(() => {
                           const actors: string[] = [];
-                          example.steps.forEach((step) => {
+                          outline.forEach((step) => {
                             if (!actors.includes(step.actor)) actors.push(step.actor);
                             if (step.target && !actors.includes(step.target)) actors.push(step.target);
                           });
@@ -2047,11 +2113,11 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                         <Typography variant="caption" fontWeight={700} sx={{ minWidth: 55 }}>
                           Messages:
                         </Typography>
-                        {example.steps.map((step, i) => {
+                        {outline.map((step, i) => {
                           const msgDef = messageMap?.get(step.message_type);
                           const shortName = msgDef?.name?.split(' ')[0] || '';
                           return (
-                            <Stack key={`${step.step}-${step.message_type}`} direction="row" alignItems="center" spacing={0.5}>
+                            <Stack key={i} direction="row" alignItems="center" spacing={0.5}>
                               <Typography
                                 variant="caption"
                                 sx={{
@@ -2068,7 +2134,7 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                                   </Typography>
                                 )}
                               </Typography>
-                              {i < example.steps.length - 1 && (
+                              {i < outline.length - 1 && (
                                 <Typography variant="caption" color="text.secondary">→</Typography>
                               )}
                             </Stack>
@@ -2078,7 +2144,7 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
 
                       {/* Legacy MT Equivalents */}
                       {(() => {
-                        const allMt = example.steps
+                        const allMt = outline
                           .map((step) => messageMap?.get(step.message_type)?.mt_equivalent)
                           .filter((mt): mt is string[] => !!mt && mt.length > 0)
                           .flat()
@@ -2113,7 +2179,7 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                   <Divider sx={{ my: 2 }} />
 
                   {/* Possible Errors */}
-                  {example.possible_errors.length > 0 && (
+                  {full.possible_errors.length > 0 && (
                     <>
                       <Box sx={{ mb: 3 }}>
                         <Stack direction="row" spacing={0.5} alignItems="center" sx={{ mb: 1.5 }}>
@@ -2127,7 +2193,7 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                         </Stack>
 
                         <Stack spacing={1}>
-                          {example.possible_errors.map((err, idx) => (
+                          {full.possible_errors.map((err, idx) => (
                             <Alert
                               key={idx}
                               severity="error"
@@ -2197,7 +2263,7 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                         },
                       }}
                     >
-                      {example.key_takeaways.map((takeaway, idx) => (
+                      {full.key_takeaways.map((takeaway, idx) => (
                         <li key={idx}>{takeaway}</li>
                       ))}
                     </Box>
@@ -2212,7 +2278,7 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                       Related Messages:
                     </Typography>
                     <Stack direction="row" spacing={0.5} flexWrap="wrap" useFlexGap sx={{ mb: 2 }}>
-                      {example.related_messages.map((msg) => (
+                      {full.related_messages.map((msg) => (
                         <Chip
                           key={msg}
                           label={msg}
@@ -2234,7 +2300,7 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                       Learn More:
                     </Typography>
                     <Stack direction="row" spacing={1} flexWrap="wrap" useFlexGap>
-                      {example.related_terms.map((term) => (
+                      {full.related_terms.map((term) => (
                         <TermWithHelp key={term} term={term}>
                           <Typography
                             variant="caption"
@@ -2254,6 +2320,7 @@ export const RealWorldExample: FC<RealWorldExampleProps> = ({
                     </Stack>
                   </Box>
                 </Box>
+                )}
               </Collapse>
             </motion.div>
           )}
@@ -1,4 +1,4 @@
-import { useState, useCallback, useMemo } from 'react';
+import { useState, useCallback, useMemo, useEffect } from 'react';
 import type { FC } from 'react';
 import {
   Box,
@@ -11,6 +11,7 @@ import {
   Alert,
   IconButton,
   Tooltip,
+  CircularProgress,
 } from '@mui/material';
 import {
   PlayArrow as StartIcon,
@@ -25,12 +26,14 @@ import {
 } from '@mui/icons-material';
 import { motion, AnimatePresence } from 'framer-motion';
 import type { Step as StepType, Character } from '../../hooks/useRealWorldExamples';
-import type { MessageDefinition } from '../../hooks/useMessageDefinitions';
+import { useProgressTracking } from '../../hooks/useProgressTracking';
+import { drawQuestions, loadAreaBank, loadFlowQuiz, loadQuizIndex } from '../../utils/quizBanks';
+import type { BankQuestion, FlowQuiz, QuizDifficulty, QuizIndex } from '../../utils/quizBanks';
 
 interface QuizModeProps {
   steps: StepType[];
-  messageMap?: Map<string, MessageDefinition>;
   characters?: Record<string, Character>;
+  exampleId: string;
   exampleTitle: string;
   scenario?: string;
 }
@@ -45,89 +48,149 @@ interface QuizState {
   showHint: boolean;
 }
 
-// Get all unique message types from the example for generating wrong answers
-const getAllMessageTypes = (): string[] => [
-  'pain.001', 'pain.002', 'pain.008', 'pain.013',
-  'pacs.002', 'pacs.003', 'pacs.004', 'pacs.008', 'pacs.009', 'pacs.010',
-  'camt.052', 'camt.053', 'camt.054', 'camt.055', 'camt.056', 'camt.057', 'camt.060',
-  'acmt.001', 'acmt.002', 'acmt.003', 'acmt.007', 'acmt.022',
-  'sese.023', 'sese.024', 'sese.025', 'sese.026',
-  'semt.002', 'semt.003', 'semt.017', 'semt.020',
-];
-
-// Generate quiz questions from steps - now includes step 1
-const generateQuestions = (steps: StepType[]) => {
-  return steps.map((step, index) => {
-    const prevSteps = steps.slice(0, index); // Steps before this one
-    const correctAnswer = step.message_type;
-
-    // Generate wrong answers (different message types)
-    const allTypes = getAllMessageTypes();
-    const wrongAnswers = allTypes
-      .filter(t => t !== correctAnswer && !steps.some(s => s.message_type === t && s.step <= step.step))
-      .sort(() => Math.random() - 0.5)
-      .slice(0, 3);
-
-    // Shuffle all options
-    const options = [correctAnswer, ...wrongAnswers].sort(() => Math.random() - 0.5);
-
-    // Hint varies based on whether this is the first step
-    const hint = index === 0
-      ? `This is the first message in the flow, initiated by ${step.actor}.`
-      : `This message is sent from ${step.actor} to ${step.target || 'the next party'} after ${prevSteps[index - 1]?.action?.toLowerCase() || 'the previous step'}.`;
-
-    return {
-      questionIndex: index,
-      prevSteps,
-      currentStep: step,
-      correctAnswer,
-      options,
-      hint,
-      isFirstStep: index === 0,
-    };
-  });
+/** A flow or practice question, in the shape the quiz screens render. */
+interface Question {
+  id: string;
+  prompt: string;
+  options: string[];
+  /** Secondary line per option (message names) */
+  details: Array<string | undefined>;
+  correctAnswer: string;
+  hint?: string;
+  explanation?: string;
+  /** Flow questions only: the step being asked about and the steps before it */
+  currentStep?: StepType;
+  prevSteps: StepType[];
+  isFirstStep: boolean;
+}
+
+interface Practice {
+  area: string;
+  areaName: string;
+  difficulty: QuizDifficulty;
+}
+
+const PRACTICE_QUESTIONS = 10;
+const PRACTICE_AREAS = 3;
+const DIFFICULTY_LABELS: Record<QuizDifficulty, string> = { easy: 'Easy', medium: 'Medium', hard: 'Hard' };
+
+const initialState: QuizState = {
+  currentQuestionIndex: 0,
+  score: 0,
+  totalQuestions: 0,
+  answered: false,
+  selectedAnswer: null,
+  isCorrect: null,
+  showHint: false,
 };
 
-export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}, exampleTitle, scenario }) => {
+// Flow questions come prebuilt from data/quiz (scripts/build_quiz_banks.py);
+// steps supply the context shown above each question.
+const flowQuestions = (quiz: FlowQuiz, steps: StepType[]): Question[] =>
+  quiz.questions
+    .filter((q) => q.step < steps.length)
+    .map((q) => ({
+      id: `${quiz.example}:${q.step}`,
+      prompt: q.step === 0 ? 'What message type starts this flow?' : 'What message comes next?',
+      options: q.options,
+      details: q.options.map((option) => quiz.names[option]),
+      correctAnswer: q.options[q.answer],
+      hint: q.hint,
+      explanation: steps[q.step].description,
+      currentStep: steps[q.step],
+      prevSteps: steps.slice(0, q.step),
+      isFirstStep: q.step === 0,
+    }));
+
+const practiceQuestion = (q: BankQuestion): Question => ({
+  id: q.id,
+  prompt: q.prompt,
+  options: q.options,
+  details: q.details ?? [],
+  correctAnswer: q.options[q.answer],
+  explanation: q.explanation,
+  prevSteps: [],
+  isFirstStep: false,
+});
+
+export const QuizMode: FC<QuizModeProps> = ({ steps, characters = {}, exampleId, exampleTitle, scenario }) => {
   const [quizStarted, setQuizStarted] = useState(false);
-  const [quizState, setQuizState] = useState<QuizState>({
-    currentQuestionIndex: 0,
-    score: 0,
-    totalQuestions: 0,
-    answered: false,
-    selectedAnswer: null,
-    isCorrect: null,
-    showHint: false,
-  });
-
-  // Generate questions once
-  const questions = useMemo(() => generateQuestions(steps), [steps]);
+  const [quizState, setQuizState] = useState<QuizState>(initialState);
+  const [flowQuiz, setFlowQuiz] = useState<FlowQuiz | null>(null);
+  const [quizIndex, setQuizIndex] = useState<QuizIndex | null>(null);
+  const [loadError, setLoadError] = useState<string | null>(null);
+  const [practice, setPractice] = useState<Practice | null>(null);
+  const [practiceQuestions, setPracticeQuestions] = useState<Question[]>([]);
+  const [loadingPractice, setLoadingPractice] = useState(false);
+  const { saveQuizScore, recordBankAnswers, getBankAnswers } = useProgressTracking();
+
+  useEffect(() => {
+    let cancelled = false;
+    Promise.all([loadFlowQuiz(exampleId), loadQuizIndex()])
+      .then(([quiz, index]) => {
+        if (cancelled) return;
+        setFlowQuiz(quiz);
+        setQuizIndex(index);
+      })
+      .catch((err) => {
+        if (!cancelled) setLoadError('Failed to load quiz questions');
+        console.error(err);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [exampleId]);
+
+  const questions = useMemo(
+    () => (practice ? practiceQuestions : flowQuiz ? flowQuestions(flowQuiz, steps) : []),
+    [practice, practiceQuestions, flowQuiz, steps]
+  );
+
+  // Business areas this flow uses most, for practice questions afterwards
+  const practiceAreas = useMemo(() => {
+    if (!quizIndex) return [];
+    const counts = new Map<string, number>();
+    steps.forEach((step) => {
+      const area = step.message_type.split('.')[0];
+      if (quizIndex.areas[area]) counts.set(area, (counts.get(area) || 0) + 1);
+    });
+    return [...counts.entries()]
+      .sort((a, b) => b[1] - a[1])
+      .slice(0, PRACTICE_AREAS)
+      .map(([area]) => ({ area, name: quizIndex.areas[area].name, banks: quizIndex.areas[area].banks }));
+  }, [quizIndex, steps]);
 
   // Initialize quiz
   const startQuiz = useCallback(() => {
+    setPractice(null);
     setQuizStarted(true);
-    setQuizState({
-      currentQuestionIndex: 0,
-      score: 0,
-      totalQuestions: questions.length,
-      answered: false,
-      selectedAnswer: null,
-      isCorrect: null,
-      showHint: false,
-    });
-  }, [questions.length]);
+    setQuizState({ ...initialState, totalQuestions: flowQuiz ? flowQuestions(flowQuiz, steps).length : 0 });
+  }, [flowQuiz, steps]);
+
+  const startPractice = useCallback(
+    (area: string, areaName: string, difficulty: QuizDifficulty) => {
+      setLoadingPractice(true);
+      loadAreaBank(area, difficulty)
+        .then((bank) => {
+          const drawn = drawQuestions(bank, PRACTICE_QUESTIONS, getBankAnswers(`${area}.${difficulty}`));
+          setPracticeQuestions(drawn.map(practiceQuestion));
+          setPractice({ area, areaName, difficulty });
+          setQuizStarted(true);
+          setQuizState({ ...initialState, totalQuestions: drawn.length });
+        })
+        .catch((err) => {
+          setLoadError('Failed to load practice questions');
+          console.error(err);
+        })
+        .finally(() => setLoadingPractice(false));
+    },
+    [getBankAnswers]
+  );
 
   const restartQuiz = useCallback(() => {
     setQuizStarted(false);
-    setQuizState({
-      currentQuestionIndex: 0,
-      score: 0,
-      totalQuestions: 0,
-      answered: false,
-      selectedAnswer: null,
-      isCorrect: null,
-      showHint: false,
-    });
+    setPractice(null);
+    setQuizState(initialState);
   }, []);
 
   // Handle answer selection
@@ -136,6 +199,9 @@ export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}
 
     const currentQ = questions[quizState.currentQuestionIndex];
     const isCorrect = answer === currentQ.correctAnswer;
+    if (isCorrect && practice) {
+      recordBankAnswers(`${practice.area}.${practice.difficulty}`, [currentQ.id]);
+    }
 
     setQuizState(prev => ({
       ...prev,
@@ -144,7 +210,7 @@ export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}
       isCorrect,
       score: isCorrect ? prev.score + 1 : prev.score,
     }));
-  }, [quizState.answered, quizState.currentQuestionIndex, questions]);
+  }, [quizState.answered, quizState.currentQuestionIndex, questions, practice, recordBankAnswers]);
 
   // Move to next question
   const nextQuestion = useCallback(() => {
@@ -169,6 +235,42 @@ export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}
   const isQuizComplete = quizState.currentQuestionIndex >= questions.length - 1 && quizState.answered;
   const progress = ((quizState.currentQuestionIndex + (quizState.answered ? 1 : 0)) / questions.length) * 100;
 
+  useEffect(() => {
+    if (isQuizComplete && !practice) saveQuizScore(exampleId, quizState.score, quizState.totalQuestions);
+  }, [isQuizComplete, practice, exampleId, quizState.score, quizState.totalQuestions, saveQuizScore]);
+
+  // Follow-up practice from the business-area banks
+  const practicePicker = practiceAreas.length > 0 && (
+    <Box sx={{ mt: 3, textAlign: 'left' }}>
+      <Typography variant="caption" sx={{ color: '#64748b', fontWeight: 600, display: 'block', mb: 1 }}>
+        PRACTICE MESSAGE QUESTIONS
+      </Typography>
+      <Stack spacing={1}>
+        {practiceAreas.map(({ area, name, banks }) => (
+          <Stack key={area} direction="row" alignItems="center" spacing={1} flexWrap="wrap" useFlexGap>
+            <Typography variant="body2" sx={{ color: '#e2e8f0', minWidth: 160 }}>
+              {name} <span style={{ color: '#64748b', fontFamily: 'var(--font-mono)' }}>{area}</span>
+            </Typography>
+            {(Object.keys(DIFFICULTY_LABELS) as QuizDifficulty[]).map((difficulty) => {
+              const bank = banks[difficulty];
+              return bank ? (
+                <Chip
+                  key={difficulty}
+                  label={`${DIFFICULTY_LABELS[difficulty]} · ${bank.count}`}
+                  size="small"
+                  clickable
+                  disabled={loadingPractice}
+                  onClick={() => startPractice(area, name, difficulty)}
+                  sx={{ bgcolor: '#1e293b', color: '#e2e8f0', '&:hover': { bgcolor: '#334155' } }}
+                />
+              ) : null;
+            })}
+          </Stack>
+        ))}
+      </Stack>
+    </Box>
+  );
+
   // Score rating
   const getScoreRating = (score: number, total: number) => {
     const percentage = (score / total) * 100;
@@ -204,11 +306,21 @@ export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}
             "{exampleTitle}"
           </Typography>
 
-          <Stack spacing={1} sx={{ mb: 3 }}>
-            <Chip
-              label={`${questions.length} Questions`}
-              sx={{ bgcolor: '#1e293b', color: '#e2e8f0' }}
-            />
+          {loadError && (
+            <Alert severity="error" sx={{ mb: 2, textAlign: 'left' }}>
+              {loadError}
+            </Alert>
+          )}
+
+          <Stack spacing={1} sx={{ mb: 3 }} alignItems="center">
+            {quizIndex ? (
+              <Chip
+                label={`${questions.length} Questions`}
+                sx={{ bgcolor: '#1e293b', color: '#e2e8f0' }}
+              />
+            ) : (
+              !loadError && <CircularProgress size={20} />
+            )}
             <Typography variant="caption" sx={{ color: '#64748b' }}>
               Predict what message type comes next in each step
             </Typography>
@@ -219,6 +331,7 @@ export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}
             size="large"
             startIcon={<StartIcon />}
             onClick={startQuiz}
+            disabled={questions.length === 0}
             sx={{
               bgcolor: '#3b82f6',
               '&:hover': { bgcolor: '#2563eb' },
@@ -229,6 +342,8 @@ export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}
           >
             Start Quiz
           </Button>
+
+          {practicePicker}
         </Paper>
       </Box>
     );
@@ -264,6 +379,11 @@ export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}
             <Typography variant="h4" sx={{ color: rating.color, fontWeight: 700, mb: 2 }}>
               {rating.label}
             </Typography>
+            {practice && (
+              <Typography variant="body2" sx={{ color: '#94a3b8', mb: 2 }}>
+                {practice.areaName} · {DIFFICULTY_LABELS[practice.difficulty]}
+              </Typography>
+            )}
 
             <Box sx={{ bgcolor: '#1e293b', borderRadius: 2, p: 3, mb: 3 }}>
               <Typography variant="h2" sx={{ color: '#f1f5f9', fontWeight: 800 }}>
@@ -296,6 +416,8 @@ export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}
                 Try Again
               </Button>
             </Stack>
+
+            {practicePicker}
           </Paper>
         </motion.div>
       </Box>
@@ -332,7 +454,26 @@ export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}
 
       {/* Context section */}
       <Paper sx={{ bgcolor: '#1e293b', p: 2, mb: 2, borderRadius: 2 }}>
-        {currentQuestion.isFirstStep ? (
+        {practice ? (
+          // Practice questions - show the bank being drawn from
+          <>
+            <Typography variant="caption" sx={{ color: '#64748b', fontWeight: 600, display: 'block', mb: 1 }}>
+              PRACTICE
+            </Typography>
+            <Stack direction="row" spacing={1}>
+              <Chip
+                label={`${practice.areaName} (${practice.area})`}
+                size="small"
+                sx={{ bgcolor: '#334155', color: '#e2e8f0', fontSize: '0.7rem' }}
+              />
+              <Chip
+                label={DIFFICULTY_LABELS[practice.difficulty]}
+                size="small"
+                sx={{ bgcolor: '#334155', color: '#e2e8f0', fontSize: '0.7rem' }}
+              />
+            </Stack>
+          </>
+        ) : currentQuestion.isFirstStep ? (
           // First question - show scenario context
           <>
             <Typography variant="caption" sx={{ color: '#64748b', fontWeight: 600, display: 'block', mb: 1 }}>
@@ -411,21 +552,23 @@ export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}
         <Stack direction="row" justifyContent="space-between" alignItems="flex-start" sx={{ mb: 2 }}>
           <Box>
             <Typography variant="h6" sx={{ color: '#f1f5f9', fontWeight: 700, mb: 0.5 }}>
-              {currentQuestion.isFirstStep
-                ? 'What message type starts this flow?'
-                : 'What message comes next?'}
-            </Typography>
-            <Typography variant="body2" sx={{ color: '#94a3b8' }}>
-              Step {currentQuestion.currentStep.step}: <strong style={{ color: '#60a5fa' }}>{currentQuestion.currentStep.actor}</strong>
-              {currentQuestion.currentStep.target && (
-                <> → <strong style={{ color: '#34d399' }}>{currentQuestion.currentStep.target}</strong></>
-              )}
-            </Typography>
-            <Typography variant="body2" sx={{ color: '#e2e8f0', mt: 0.5 }}>
-              Action: {currentQuestion.currentStep.action}
+              {currentQuestion.prompt}
             </Typography>
+            {currentQuestion.currentStep && (
+              <>
+                <Typography variant="body2" sx={{ color: '#94a3b8' }}>
+                  Step {currentQuestion.currentStep.step}: <strong style={{ color: '#60a5fa' }}>{currentQuestion.currentStep.actor}</strong>
+                  {currentQuestion.currentStep.target && (
+                    <> → <strong style={{ color: '#34d399' }}>{currentQuestion.currentStep.target}</strong></>
+                  )}
+                </Typography>
+                <Typography variant="body2" sx={{ color: '#e2e8f0', mt: 0.5 }}>
+                  Action: {currentQuestion.currentStep.action}
+                </Typography>
+              </>
+            )}
           </Box>
-          {!quizState.answered && (
+          {!quizState.answered && currentQuestion.hint && (
             <Tooltip title={quizState.showHint ? 'Hide hint' : 'Show hint'}>
               <IconButton onClick={toggleHint} sx={{ color: '#fbbf24' }}>
                 <HintIcon />
@@ -463,7 +606,7 @@ export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}
         {/* Answer options */}
         <Stack spacing={1.5}>
           {currentQuestion.options.map((option, idx) => {
-            const msgDef = messageMap?.get(option);
+            const detail = currentQuestion.details[idx];
             const isSelected = quizState.selectedAnswer === option;
             const isCorrectOption = option === currentQuestion.correctAnswer;
             const showResult = quizState.answered;
@@ -519,9 +662,9 @@ export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}
                       >
                         {option}
                       </Typography>
-                      {msgDef && (
+                      {detail && (
                         <Typography variant="caption" sx={{ color: '#94a3b8' }}>
-                          {msgDef.name}
+                          {detail}
                         </Typography>
                       )}
                     </Box>
@@ -556,7 +699,7 @@ export const QuizMode: FC<QuizModeProps> = ({ steps, messageMap, characters = {}
                   {quizState.isCorrect ? 'Correct!' : 'Not quite right'}
                 </Typography>
                 <Typography variant="caption" sx={{ color: '#94a3b8', display: 'block' }}>
-                  {currentQuestion.currentStep.description}
+                  {currentQuestion.explanation}
                 </Typography>
               </Alert>
             </motion.div>
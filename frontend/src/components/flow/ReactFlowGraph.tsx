@@ -65,6 +65,8 @@ import {
 } from '@mui/icons-material';
 import type { Step as StepType, PossibleError, Character } from '../../hooks/useRealWorldExamples';
 import type { MessageDefinition } from '../../hooks/useMessageDefinitions';
+import { loadFlowLayout, layoutPositions } from '../../utils/flowLayouts';
+import type { FlowLayout } from '../../utils/flowLayouts';
 
 // Custom entity node component
 const EntityNode: FC<{ data: EntityNodeData }> = ({ data }) => {
@@ -331,30 +333,31 @@ const edgeTypes: EdgeTypes = {
   animated: AnimatedEdge,
 };
 
-// Layout with dagre
-const getLayoutedElements = (nodes: Node[], edges: Edge[], direction: 'TB' | 'LR' = 'TB') => {
+type Positions = Map<string, { x: number; y: number }>;
+
+const nodeSize = (node: Node) => ({
+  width: node.type === 'decision' ? 120 : node.type === 'stepNode' ? 160 : 120,
+  height: node.type === 'decision' ? 120 : node.type === 'stepNode' ? 70 : 90,
+});
+
+// Layout with dagre (fallback when no precomputed layout matches)
+const getDagrePositions = (nodes: Node[], edges: Edge[], direction: 'TB' | 'LR' = 'TB'): Positions => {
   const dagreGraph = new dagre.graphlib.Graph();
   dagreGraph.setDefaultEdgeLabel(() => ({}));
   dagreGraph.setGraph({ rankdir: direction, nodesep: 80, ranksep: 100, marginx: 50, marginy: 50 });
 
-  nodes.forEach((node) => {
-    const width = node.type === 'decision' ? 120 : node.type === 'stepNode' ? 160 : 120;
-    const height = node.type === 'decision' ? 120 : node.type === 'stepNode' ? 70 : 90;
-    dagreGraph.setNode(node.id, { width, height });
-  });
+  nodes.forEach((node) => dagreGraph.setNode(node.id, nodeSize(node)));
 
   edges.forEach((edge) => dagreGraph.setEdge(edge.source, edge.target));
   dagre.layout(dagreGraph);
 
-  return {
-    nodes: nodes.map((node) => {
-      const pos = dagreGraph.node(node.id);
-      const width = node.type === 'decision' ? 120 : node.type === 'stepNode' ? 160 : 120;
-      const height = node.type === 'decision' ? 120 : node.type === 'stepNode' ? 70 : 90;
-      return { ...node, position: { x: pos.x - width / 2, y: pos.y - height / 2 } };
-    }),
-    edges,
-  };
+  const positions: Positions = new Map();
+  nodes.forEach((node) => {
+    const pos = dagreGraph.node(node.id);
+    const { width, height } = nodeSize(node);
+    positions.set(node.id, { x: pos.x - width / 2, y: pos.y - height / 2 });
+  });
+  return positions;
 };
 
 const getEdgeColor = (messageType: string): string => {
@@ -568,10 +571,50 @@ const ReactFlowGraphInner: FC<ReactFlowGraphProps> = ({ steps, messageMap, chara
     return { initialNodes: nodes, initialEdges: edges };
   }, [steps, currentStep, hasBranches, characters, handleEntityClick, handleStepClick, messageMap, isPlaying, playSpeed]);
 
-  // Apply layout
-  const { nodes: layoutedNodes, edges: layoutedEdges } = useMemo(() => {
-    return getLayoutedElements(initialNodes, initialEdges, layout);
-  }, [initialNodes, initialEdges, layout]);
+  // Precomputed layout from scripts/build_flow_layouts.py; undefined while
+  // loading, null when none applies (dagre runs in the browser instead).
+  const [precomputed, setPrecomputed] = useState<FlowLayout | null | undefined>(exampleId ? undefined : null);
+  useEffect(() => {
+    if (!exampleId) {
+      setPrecomputed(null);
+      return;
+    }
+    setPrecomputed(undefined);
+    let cancelled = false;
+    loadFlowLayout(exampleId)
+      .then((loaded) => {
+        if (!cancelled) setPrecomputed(loaded);
+      })
+      .catch((err) => {
+        if (!cancelled) setPrecomputed(null);
+        console.error(err);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [exampleId]);
+
+  // Positions depend only on graph topology, not on playback state, so they
+  // are cached per topology and direction instead of re-laid out every step.
+  const positionCache = useRef(new Map<string, Positions>());
+  const { nodes: layoutedNodes, edges: layoutedEdges } = useMemo((): { nodes: Node[]; edges: Edge[] } => {
+    if (precomputed === undefined) return { nodes: [], edges: [] };
+    const nodeIds = initialNodes.map((node) => node.id);
+    const source = precomputed ? `layout:${exampleId}` : 'dagre';
+    const topology = `${source}|${layout}|${nodeIds.join(',')}|${initialEdges.map((e) => `${e.source}>${e.target}`).join(',')}`;
+    let positions = positionCache.current.get(topology);
+    if (!positions) {
+      positions =
+        (precomputed && layoutPositions(precomputed, layout, nodeIds)) ||
+        getDagrePositions(initialNodes, initialEdges, layout);
+      positionCache.current.set(topology, positions);
+    }
+    const placed = positions;
+    return {
+      nodes: initialNodes.map((node) => ({ ...node, position: placed.get(node.id) ?? node.position })),
+      edges: initialEdges,
+    };
+  }, [initialNodes, initialEdges, layout, precomputed, exampleId]);
 
   const [nodes, setNodes, onNodesChange] = useNodesState(layoutedNodes);
   const [edges, setEdges, onEdgesChange] = useEdgesState(layoutedEdges);
@@ -1,21 +1,38 @@
 import { useState, useEffect, useMemo } from 'react';
 import Fuse from 'fuse.js';
-import type { PaymentError, ErrorsData, FilterState } from '../types/error';
+import type { PaymentErrorSummary, ErrorsData, FilterState } from '../types/error';
 import { expandQueryWithSynonyms } from '../utils/synonyms';
+import { ErrorSearchIndex, type ErrorSearchIndexData } from '../utils/searchIndex';
+import { loadColumnGroup, decodeAll } from '../utils/columnar';
+import { fetchJson } from '../utils/fetchData';
+
+// Fallback when the prebuilt index is unavailable. List summaries carry no
+// detailed description, so only the card fields are searched.
+const FUSE_OPTIONS = {
+  keys: [
+    { name: 'code', weight: 2 },
+    { name: 'name', weight: 1.5 },
+    { name: 'description.short', weight: 1 },
+  ],
+  threshold: 0.35,
+  includeScore: true,
+};
 
 export function useErrors() {
-  const [errors, setErrors] = useState<PaymentError[]>([]);
+  const [errors, setErrors] = useState<PaymentErrorSummary[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
   useEffect(() => {
-    // Use Vite's BASE_URL to ensure correct path with base path config
-    // Ensure trailing slash for proper path concatenation
-    const baseUrl = (import.meta.env.BASE_URL || '/').replace(/\/?$/, '/');
-    fetch(`${baseUrl}data/errors.json`)
-      .then((res) => res.json())
-      .then((data: ErrorsData) => {
-        setErrors(data.errors);
+    // The list only needs card fields: load the columnar "list" group and
+    // fall back to the full errors.json if it is unavailable
+    loadColumnGroup('list')
+      .then((group) => decodeAll<PaymentErrorSummary>(group))
+      .catch(() =>
+        fetchJson<ErrorsData>('data/errors.json').then((data) => data.errors)
+      )
+      .then((summaries) => {
+        setErrors(summaries);
         setLoading(false);
       })
       .catch((err) => {
@@ -28,30 +45,38 @@ export function useErrors() {
   return { errors, loading, error };
 }
 
-export function useErrorSearch(errors: PaymentError[]) {
+export function useErrorSearch(errors: PaymentErrorSummary[]) {
   const [query, setQuery] = useState('');
   const [filters, setFilters] = useState<FilterState>({ category: '', severity: '' });
 
-  const fuse = useMemo(
-    () =>
-      new Fuse(errors, {
-        keys: [
-          { name: 'code', weight: 2 },
-          { name: 'name', weight: 1.5 },
-          { name: 'description.short', weight: 1 },
-          { name: 'description.detailed', weight: 0.8 },
-        ],
-        threshold: 0.35,
-        includeScore: true,
-      }),
-    [errors]
-  );
+  const [searchIndex, setSearchIndex] = useState<ErrorSearchIndex | null>(null);
+
+  // Prebuilt index from scripts/search_index.py; Fuse.js is only a fallback
+  useEffect(() => {
+    fetchJson<ErrorSearchIndexData>('data/search/errors_index.json')
+      .then((data) => setSearchIndex(new ErrorSearchIndex(data)))
+      .catch((err) => console.error('Search index unavailable, using Fuse.js', err));
+  }, []);
+
+  const errorsByCode = useMemo(() => new Map(errors.map((e) => [e.code, e] as const)), [errors]);
+
+  // Build the Fuse index lazily so it costs nothing when the prebuilt index is used
+  const getFuse = useMemo(() => {
+    let instance: Fuse<PaymentErrorSummary> | null = null;
+    return () => (instance ??= new Fuse(errors, FUSE_OPTIONS));
+  }, [errors]);
 
   const results = useMemo(() => {
     let filtered = errors;
 
-    // Search with synonym expansion
-    if (query.trim()) {
+    if (query.trim() && searchIndex) {
+      filtered = searchIndex
+        .search(query)
+        .map((code) => errorsByCode.get(code))
+        .filter((e): e is PaymentErrorSummary => e !== undefined);
+    } else if (query.trim()) {
+      // Search with synonym expansion
+      const fuse = getFuse();
       const searchResults = fuse.search(query);
 
       // If few results, expand with synonyms
@@ -84,7 +109,7 @@ export function useErrorSearch(errors: PaymentError[]) {
     }
 
     return filtered;
-  }, [query, filters, errors, fuse]);
+  }, [query, filters, errors, searchIndex, errorsByCode, getFuse]);
 
   return {
     query,
@@ -96,7 +121,10 @@ export function useErrorSearch(errors: PaymentError[]) {
   };
 }
 
-export function useUrlHash(errors: PaymentError[], onErrorSelect: (error: PaymentError) => void) {
+export function useUrlHash(
+  errors: PaymentErrorSummary[],
+  onErrorSelect: (error: PaymentErrorSummary) => void
+) {
   useEffect(() => {
     const handleHash = () => {
       const hash = window.location.hash.slice(1);
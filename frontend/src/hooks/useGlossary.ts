@@ -1,5 +1,6 @@
 import { useState, useEffect, useMemo, useCallback } from 'react';
 import Fuse from 'fuse.js';
+import { fetchJson } from '../utils/fetchData';
 
 export interface GlossaryTerm {
   id: string;
@@ -34,10 +35,8 @@ export function useGlossary() {
   const [error, setError] = useState<string | null>(null);
 
   useEffect(() => {
-    const baseUrl = (import.meta.env.BASE_URL || '/').replace(/\/?$/, '/');
-    fetch(`${baseUrl}data/glossary_terms.json`)
-      .then((res) => res.json())
-      .then((data: GlossaryData) => {
+    fetchJson<GlossaryData>('data/glossary_terms.json')
+      .then((data) => {
         setData(data);
         setLoading(false);
       })
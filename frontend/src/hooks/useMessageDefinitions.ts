@@ -1,14 +1,21 @@
 import { useState, useEffect, useMemo } from 'react';
 import Fuse from 'fuse.js';
+import { fetchJson } from '../utils/fetchData';
 
-export interface MessageDefinition {
+/** Catalogue fields, always loaded (cards, search, filters). */
+export interface MessageSummary {
   id: string;
   full_id: string;
   name: string;
   business_area: string;
   business_area_name: string;
   purpose: string;
+  usage?: string;
   mt_equivalent?: string[];
+}
+
+/** Full definition: summary plus the fields held in per-area detail shards. */
+export interface MessageDefinition extends MessageSummary {
   real_world_use_cases: string[];
   when_used: string;
   used_in_systems?: string[];
@@ -18,6 +25,15 @@ export interface MessageDefinition {
   documentation_url: string;
 }
 
+type MessageDetailFields = Omit<MessageDefinition, keyof MessageSummary>;
+
+interface MessageShardEntry {
+  file: string;
+  hash: string;
+  count: number;
+  bytes: number;
+}
+
 export interface BusinessArea {
   code: string;
   name: string;
@@ -66,10 +82,53 @@ interface MessageDefinitionsData {
     description: string;
   };
   business_areas: BusinessArea[];
-  messages: MessageDefinition[];
+  messages: MessageSummary[];
   payment_flows: SampleFlow[];
   payment_systems: PaymentSystem[];
   mt_to_mx_mappings: MtMapping[];
+  shards: Record<string, MessageShardEntry>;
+}
+
+interface MessageShard {
+  area: string;
+  messages: Record<string, MessageDetailFields>;
+}
+
+// Built by scripts/build_message_shards.py. The catalogue is shared by every
+// page; detail shards are content-hashed and fetched once per business area.
+let cataloguePromise: Promise<MessageDefinitionsData> | null = null;
+const shardPromises = new Map<string, Promise<MessageShard>>();
+
+function loadCatalogue(): Promise<MessageDefinitionsData> {
+  if (!cataloguePromise) {
+    cataloguePromise = fetchJson<MessageDefinitionsData>('data/messages/index.json');
+    cataloguePromise.catch(() => {
+      cataloguePromise = null;
+    });
+  }
+  return cataloguePromise;
+}
+
+function loadShard(area: string): Promise<MessageShard> {
+  let promise = shardPromises.get(area);
+  if (!promise) {
+    promise = loadCatalogue().then((catalogue) => {
+      const entry = catalogue.shards[area];
+      if (!entry) throw new Error(`No detail shard for business area ${area}`);
+      return fetchJson<MessageShard>(`data/messages/${entry.file}`);
+    });
+    promise.catch(() => shardPromises.delete(area));
+    shardPromises.set(area, promise);
+  }
+  return promise;
+}
+
+/** Resolve the full definition of a catalogue entry from its area shard. */
+export function loadMessageDetail(message: MessageSummary): Promise<MessageDefinition> {
+  return loadShard(message.business_area).then((shard) => ({
+    ...message,
+    ...shard.messages[message.id],
+  }));
 }
 
 export function useMessageDefinitions() {
@@ -78,10 +137,8 @@ export function useMessageDefinitions() {
   const [error, setError] = useState<string | null>(null);
 
   useEffect(() => {
-    const baseUrl = (import.meta.env.BASE_URL || '/').replace(/\/?$/, '/');
-    fetch(`${baseUrl}data/message_definitions.json`)
-      .then((res) => res.json())
-      .then((data: MessageDefinitionsData) => {
+    loadCatalogue()
+      .then((data) => {
         setData(data);
         setLoading(false);
       })
@@ -103,7 +160,59 @@ export function useMessageDefinitions() {
   };
 }
 
-export function useMessageSearch(messages: MessageDefinition[]) {
+/** Full definition of one message; null until its shard has loaded. */
+export function useMessageDetail(message: MessageSummary | null) {
+  const [detail, setDetail] = useState<MessageDefinition | null>(null);
+  const [error, setError] = useState<string | null>(null);
+
+  useEffect(() => {
+    setDetail(null);
+    setError(null);
+    if (!message) return;
+    let cancelled = false;
+    loadMessageDetail(message)
+      .then((loaded) => {
+        if (!cancelled) setDetail(loaded);
+      })
+      .catch((err) => {
+        if (!cancelled) setError('Failed to load message details');
+        console.error(err);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [message]);
+
+  return { detail, loading: !!message && !detail && !error, error };
+}
+
+/**
+ * Full definitions for the given message ids, keyed by id. Only the shards
+ * of the business areas involved are fetched.
+ */
+export function useMessageDetailMap(messages: MessageSummary[], ids: string[]) {
+  const [detailMap, setDetailMap] = useState<Map<string, MessageDefinition>>(new Map());
+  const idKey = [...new Set(ids)].sort().join('|');
+
+  useEffect(() => {
+    const wanted = new Set(idKey.split('|'));
+    const selected = messages.filter((message) => wanted.has(message.id));
+    if (selected.length === 0) return;
+    let cancelled = false;
+    Promise.all(selected.map(loadMessageDetail))
+      .then((loaded) => {
+        if (!cancelled) setDetailMap(new Map(loaded.map((message) => [message.id, message] as const)));
+      })
+      .catch((err) => console.error(err));
+    return () => {
+      cancelled = true;
+    };
+  }, [messages, idKey]);
+
+  return detailMap;
+}
+
+export function useMessageSearch(messages: MessageSummary[]) {
   const [query, setQuery] = useState('');
   const [selectedArea, setSelectedArea] = useState<string>('');
 
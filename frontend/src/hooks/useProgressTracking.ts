@@ -13,6 +13,7 @@ interface Progress {
   quizScores: Record<string, QuizScore>;
   lastStepPerExample: Record<string, number>;
   lastVisited: Record<string, string>; // exampleId -> ISO date string
+  bankAnswers: Record<string, string[]>; // "<area>.<difficulty>" -> ids of questions answered correctly
 }
 
 interface UseProgressTrackingReturn {
@@ -24,34 +25,35 @@ interface UseProgressTrackingReturn {
   isViewed: (exampleId: string) => boolean;
   getQuizScore: (exampleId: string) => QuizScore | undefined;
   getCompletionPercentage: (totalExamples: number) => number;
+  recordBankAnswers: (bankKey: string, questionIds: string[]) => void;
+  getBankAnswers: (bankKey: string) => Set<string>;
   clearProgress: () => void;
 }
 
+const emptyProgress = (): Progress => ({
+  viewedExamples: [],
+  quizScores: {},
+  lastStepPerExample: {},
+  lastVisited: {},
+  bankAnswers: {},
+});
+
 const getInitialProgress = (): Progress => {
   if (typeof window === 'undefined') {
-    return {
-      viewedExamples: [],
-      quizScores: {},
-      lastStepPerExample: {},
-      lastVisited: {},
-    };
+    return emptyProgress();
   }
 
   try {
     const stored = localStorage.getItem(STORAGE_KEY);
     if (stored) {
-      return JSON.parse(stored);
+      // Progress saved before a field existed lacks it.
+      return { ...emptyProgress(), ...JSON.parse(stored) };
     }
   } catch (err) {
     console.error('Failed to load progress from localStorage:', err);
   }
 
-  return {
-    viewedExamples: [],
-    quizScores: {},
-    lastStepPerExample: {},
-    lastVisited: {},
-  };
+  return emptyProgress();
 };
 
 export function useProgressTracking(): UseProgressTrackingReturn {
@@ -130,13 +132,27 @@ export function useProgressTracking(): UseProgressTrackingReturn {
     return Math.round((progress.viewedExamples.length / totalExamples) * 100);
   }, [progress.viewedExamples.length]);
 
-  const clearProgress = useCallback(() => {
-    setProgress({
-      viewedExamples: [],
-      quizScores: {},
-      lastStepPerExample: {},
-      lastVisited: {},
+  const recordBankAnswers = useCallback((bankKey: string, questionIds: string[]) => {
+    setProgress(prev => {
+      const known = prev.bankAnswers[bankKey] || [];
+      const added = questionIds.filter(id => !known.includes(id));
+      if (added.length === 0) return prev;
+      return {
+        ...prev,
+        bankAnswers: {
+          ...prev.bankAnswers,
+          [bankKey]: [...known, ...added],
+        },
+      };
     });
+  }, []);
+
+  const getBankAnswers = useCallback((bankKey: string): Set<string> => {
+    return new Set(progress.bankAnswers[bankKey] || []);
+  }, [progress.bankAnswers]);
+
+  const clearProgress = useCallback(() => {
+    setProgress(emptyProgress());
     localStorage.removeItem(STORAGE_KEY);
   }, []);
 
@@ -149,6 +165,8 @@ export function useProgressTracking(): UseProgressTrackingReturn {
     isViewed,
     getQuizScore,
     getCompletionPercentage,
+    recordBankAnswers,
+    getBankAnswers,
     clearProgress,
   };
 }
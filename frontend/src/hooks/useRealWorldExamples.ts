@@ -1,5 +1,6 @@
 import { useState, useEffect, useMemo, useCallback } from 'react';
 import Fuse from 'fuse.js';
+import { fetchJson } from '../utils/fetchData';
 
 export interface Character {
   name: string;
@@ -55,6 +56,39 @@ export interface RealWorldExample {
   has_branches?: boolean;
 }
 
+/** Listing row from data/examples/index.json (scripts/build_example_windows.py). */
+export interface ExampleSummary {
+  id: string;
+  title: string;
+  difficulty: 'beginner' | 'intermediate' | 'advanced';
+  category: string;
+  scenario: string;
+  related_messages: string[];
+  related_terms: string[];
+  key_takeaways: string[];
+  has_branches?: boolean;
+  step_count: number;
+  /** Distinct message types used by the steps, in first-use order */
+  message_types: string[];
+  file: string;
+}
+
+/** One step reduced to what the flow summary shows. */
+export interface StepOutline {
+  actor: string;
+  target?: string;
+  message_type: string;
+}
+
+interface ExampleDetailFile {
+  characters: Record<string, Character>;
+  possible_errors: PossibleError[];
+  steps: Step[];
+  step_count: number;
+  outline: { names: string[]; steps: Array<Array<number | null>> };
+  windows: Array<{ start: number; count: number; file: string }>;
+}
+
 interface ExamplesMetadata {
   version: string;
   last_updated: string;
@@ -65,7 +99,101 @@ interface ExamplesMetadata {
 
 interface ExamplesData {
   metadata: ExamplesMetadata;
-  examples: RealWorldExample[];
+  window_size: number;
+  examples: ExampleSummary[];
+}
+
+const detailPromises = new Map<string, Promise<ExampleDetailFile>>();
+const windowPromises = new Map<string, Promise<Step[]>>();
+
+/** Fetch a content-hashed example file once per session; failures are retried on next use. */
+function loadCached<T>(cache: Map<string, Promise<T>>, file: string): Promise<T> {
+  let promise = cache.get(file);
+  if (!promise) {
+    promise = fetchJson<T>(`data/examples/${file}`);
+    promise.catch(() => cache.delete(file));
+    cache.set(file, promise);
+  }
+  return promise;
+}
+
+function decodeOutline(outline: ExampleDetailFile['outline']): StepOutline[] {
+  const name = (id: number | null) => (id === null ? undefined : outline.names[id]);
+  return outline.steps.map(([actor, target, messageType]) => ({
+    actor: name(actor) ?? '',
+    target: name(target),
+    message_type: name(messageType) ?? '',
+  }));
+}
+
+/**
+ * Full example for an opened card. Steps arrive in windows: the first with
+ * the detail file, the rest as loadMore() is called (the stepper calls it
+ * on scroll) or all at once with loadAll() for views that need every step.
+ */
+export function useExampleDetail(summary: ExampleSummary, enabled: boolean) {
+  const [detail, setDetail] = useState<ExampleDetailFile | null>(null);
+  const [windows, setWindows] = useState<Step[][]>([]);
+  const [wanted, setWanted] = useState(0);
+  const [error, setError] = useState<string | null>(null);
+
+  useEffect(() => {
+    if (!enabled || detail) return;
+    let cancelled = false;
+    loadCached(detailPromises, summary.file)
+      .then((loaded) => {
+        if (!cancelled) setDetail(loaded);
+      })
+      .catch((err) => {
+        if (!cancelled) setError('Failed to load example');
+        console.error(err);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [enabled, detail, summary.file]);
+
+  useEffect(() => {
+    if (!detail || Math.min(wanted, detail.windows.length) <= windows.length) return;
+    let cancelled = false;
+    Promise.all(detail.windows.slice(0, wanted).map((w) => loadCached(windowPromises, w.file)))
+      .then((loaded) => {
+        if (!cancelled) setWindows(loaded);
+      })
+      .catch((err) => {
+        if (!cancelled) setError('Failed to load example steps');
+        console.error(err);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [detail, wanted, windows.length]);
+
+  const example = useMemo<RealWorldExample | null>(() => {
+    if (!detail) return null;
+    return {
+      ...summary,
+      characters: detail.characters,
+      possible_errors: detail.possible_errors,
+      steps: detail.steps.concat(...windows),
+    };
+  }, [summary, detail, windows]);
+
+  const outline = useMemo(() => (detail ? decodeOutline(detail.outline) : []), [detail]);
+  const windowCount = detail ? detail.windows.length : 0;
+
+  const loadMore = useCallback(() => setWanted((count) => Math.max(count, windows.length + 1)), [windows.length]);
+  const loadAll = useCallback(() => setWanted(Number.MAX_SAFE_INTEGER), []);
+
+  return {
+    example,
+    outline,
+    hasMore: !detail || windows.length < windowCount,
+    loadingMore: detail !== null && Math.min(wanted, windowCount) > windows.length,
+    loadMore,
+    loadAll,
+    error,
+  };
 }
 
 export function useRealWorldExamples() {
@@ -74,10 +202,8 @@ export function useRealWorldExamples() {
   const [error, setError] = useState<string | null>(null);
 
   useEffect(() => {
-    const baseUrl = (import.meta.env.BASE_URL || '/').replace(/\/?$/, '/');
-    fetch(`${baseUrl}data/real_world_examples.json`)
-      .then((res) => res.json())
-      .then((data: ExamplesData) => {
+    fetchJson<ExamplesData>('data/examples/index.json')
+      .then((data) => {
         setData(data);
         setLoading(false);
       })
@@ -90,7 +216,7 @@ export function useRealWorldExamples() {
 
   // Create a lookup map for quick example access by ID
   const exampleMap = useMemo(() => {
-    const map = new Map<string, RealWorldExample>();
+    const map = new Map<string, ExampleSummary>();
     data?.examples.forEach((example) => {
       map.set(example.id, example);
     });
@@ -99,7 +225,7 @@ export function useRealWorldExamples() {
 
   // Get example by ID
   const getExample = useCallback(
-    (id: string): RealWorldExample | undefined => {
+    (id: string): ExampleSummary | undefined => {
       return exampleMap.get(id);
     },
     [exampleMap]
@@ -126,7 +252,7 @@ export function useRealWorldExamples() {
   };
 }
 
-export function useExamplesSearch(examples: RealWorldExample[], pageSize = 5) {
+export function useExamplesSearch(examples: ExampleSummary[], pageSize = 5) {
   const [query, setQuery] = useState('');
   const [selectedCategory, setSelectedCategory] = useState<string>('');
   const [selectedDifficulty, setSelectedDifficulty] = useState<string>('');
@@ -177,7 +303,7 @@ export function useExamplesSearch(examples: RealWorldExample[], pageSize = 5) {
     if (selectedMessage) {
       filtered = filtered.filter((e) => 
         e.related_messages.some(m => m.toLowerCase() === selectedMessage.toLowerCase()) ||
-        e.steps.some(s => s.message_type.toLowerCase() === selectedMessage.toLowerCase())
+        e.message_types.some(m => m.toLowerCase() === selectedMessage.toLowerCase())
       );
     }
 
@@ -24,8 +24,12 @@ import InfoIcon from '@mui/icons-material/Info';
 import LinkIcon from '@mui/icons-material/Link';
 import CloseIcon from '@mui/icons-material/Close';
 import CheckIcon from '@mui/icons-material/Check';
-import type { PaymentError } from '../types/error';
+import type { PaymentError, ErrorsData } from '../types/error';
 import { useSEO, generateErrorJsonLd, generateBreadcrumbJsonLd } from '../hooks/useSEO';
+import { loadColumnGroup, decodeRow, findRow } from '../utils/columnar';
+import { fetchJson } from '../utils/fetchData';
+import { loadAnnotations, type DatasetAnnotations } from '../utils/glossaryAnnotations';
+import { GlossaryText } from '../components/GlossaryText';
 
 const BASE_URL = 'https://mx-error-guide.pages.dev';
 
@@ -54,6 +58,18 @@ const containerVariants = {
   },
 };
 
+// Decode a single error from the columnar export: the list group locates the
+// row, then only that row of the heavier groups is decoded
+const fetchFromColumns = async (code: string | undefined): Promise<PaymentError | undefined> => {
+  const list = await loadColumnGroup('list');
+  const index = code ? findRow(list, code) : -1;
+  if (index < 0) return undefined;
+  const [search, detail] = await Promise.all([loadColumnGroup('search'), loadColumnGroup('detail')]);
+  const record: Record<string, unknown> = {};
+  [list, search, detail].forEach((group) => decodeRow(group, index, record));
+  return record as unknown as PaymentError;
+};
+
 export const ErrorPage = () => {
   const { code } = useParams<{ code: string }>();
   const navigate = useNavigate();
@@ -61,6 +77,7 @@ export const ErrorPage = () => {
   const [loading, setLoading] = useState(true);
   const [notFound, setNotFound] = useState(false);
   const [copied, setCopied] = useState(false);
+  const [annotations, setAnnotations] = useState<DatasetAnnotations | null>(null);
 
   const handleCopyLink = async () => {
     const shareUrl = `${BASE_URL}/error/${code}`;
@@ -83,15 +100,10 @@ export const ErrorPage = () => {
   useEffect(() => {
     const fetchError = async () => {
       try {
-        // Use Vite's BASE_URL to ensure correct path with base path config
-        // Ensure trailing slash for proper path concatenation
-        const baseUrl = (import.meta.env.BASE_URL || '/').replace(/\/?$/, '/');
-        const response = await fetch(`${baseUrl}data/errors.json`);
-        const json = await response.json();
-        const errors: PaymentError[] = json.errors || json;
-        const found = errors.find(
-          (e) => e.code.toLowerCase() === code?.toLowerCase()
-        );
+        const found = await fetchFromColumns(code).catch(async () => {
+          const { errors } = await fetchJson<ErrorsData>('data/errors.json');
+          return errors.find((e) => e.code.toLowerCase() === code?.toLowerCase());
+        });
         if (found) {
           setError(found);
         } else {
@@ -106,6 +118,13 @@ export const ErrorPage = () => {
     fetchError();
   }, [code]);
 
+  // Glossary term spans are optional: without them the text renders plain
+  useEffect(() => {
+    loadAnnotations('errors')
+      .then(setAnnotations)
+      .catch(() => setAnnotations(null));
+  }, []);
+
   // SEO for found error
   useSEO(
     error
@@ -163,6 +182,8 @@ export const ErrorPage = () => {
   }
 
   const severityColor = error.severity === 'fatal' ? 'error' : 'warning';
+  const terms = annotations?.terms ?? [];
+  const fieldSpans = annotations?.records[error.code];
 
   return (
     <Box
@@ -259,12 +280,16 @@ export const ErrorPage = () => {
             <InfoIcon color="primary" /> What This Error Means
           </Typography>
           <Typography variant="body1" sx={{ lineHeight: 1.8, mb: 2 }}>
-            {error.description.short}
+            <GlossaryText text={error.description.short} spans={fieldSpans?.['description.short']} terms={terms} />
           </Typography>
           {error.description.detailed && (
             <Alert severity="info" sx={{ '& .MuiAlert-message': { width: '100%' } }}>
               <Typography variant="body2" sx={{ whiteSpace: 'pre-wrap' }}>
-                {error.description.detailed}
+                <GlossaryText
+                  text={error.description.detailed}
+                  spans={fieldSpans?.['description.detailed']}
+                  terms={terms}
+                />
               </Typography>
             </Alert>
           )}
@@ -285,7 +310,7 @@ export const ErrorPage = () => {
             <Box component="ul" sx={{ pl: 3, m: 0 }}>
               {error.common_causes.map((cause, i) => (
                 <Typography component="li" key={i} sx={{ mb: 1, lineHeight: 1.6 }}>
-                  {cause}
+                  <GlossaryText text={cause} spans={fieldSpans?.[`common_causes.${i}`]} terms={terms} />
                 </Typography>
               ))}
             </Box>
@@ -307,14 +332,19 @@ export const ErrorPage = () => {
             <Box component="ol" sx={{ pl: 3, m: 0 }}>
               {error.how_to_fix.steps.map((step: string, i: number) => (
                 <Typography component="li" key={i} sx={{ mb: 1, lineHeight: 1.6 }}>
-                  {step}
+                  <GlossaryText text={step} spans={fieldSpans?.[`how_to_fix.steps.${i}`]} terms={terms} />
                 </Typography>
               ))}
             </Box>
             {error.how_to_fix.prevention && (
               <Alert severity="success" sx={{ mt: 2 }}>
                 <Typography variant="body2">
-                  <strong>Prevention:</strong> {error.how_to_fix.prevention}
+                  <strong>Prevention:</strong>{' '}
+                  <GlossaryText
+                    text={error.how_to_fix.prevention}
+                    spans={fieldSpans?.['how_to_fix.prevention']}
+                    terms={terms}
+                  />
                 </Typography>
               </Alert>
             )}
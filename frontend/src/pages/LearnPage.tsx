@@ -35,7 +35,7 @@ import {
   useRealWorldExamples,
   useExamplesSearch,
 } from '../hooks/useRealWorldExamples';
-import { useMessageDefinitions } from '../hooks/useMessageDefinitions';
+import { useMessageDefinitions, useMessageDetailMap } from '../hooks/useMessageDefinitions';
 import { RealWorldExample } from '../components/RealWorldExample';
 import { useSEO } from '../hooks/useSEO';
 
@@ -141,9 +141,9 @@ export const LearnPage: FC = () => {
         case 'title-desc':
           return b.title.localeCompare(a.title);
         case 'steps-desc':
-          return b.steps.length - a.steps.length;
+          return b.step_count - a.step_count;
         case 'steps-asc':
-          return a.steps.length - b.steps.length;
+          return a.step_count - b.step_count;
         case 'difficulty-asc':
           return (difficultyOrder[a.difficulty] || 0) - (difficultyOrder[b.difficulty] || 0);
         case 'difficulty-desc':
@@ -201,16 +201,13 @@ export const LearnPage: FC = () => {
     window.scrollTo({ top: 0, behavior: 'smooth' });
   };
 
-  // Create message definition lookup map
-  const messageDefMap = useMemo(() => {
-    const map = new Map();
-    messageDefinitions.forEach(msg => {
-      // Key by short ID like "pacs.008"
-      const shortId = msg.id; 
-      map.set(shortId, msg);
-    });
-    return map;
-  }, [messageDefinitions]);
+  // Full definitions for the message types on this page, keyed by short ID
+  // like "pacs.008"; only the business-area shards involved are fetched.
+  const pageMessageIds = useMemo(
+    () => sortedPaginatedResults.flatMap((example) => example.message_types),
+    [sortedPaginatedResults]
+  );
+  const messageDefMap = useMessageDetailMap(messageDefinitions, pageMessageIds);
 
   // Group examples by difficulty (using sortedPaginatedResults)
   const examplesByDifficulty = sortedPaginatedResults.reduce((acc, example) => {
@@ -25,6 +25,7 @@ import {
   Tab,
   Pagination,
   Stack,
+  Snackbar,
 } from '@mui/material';
 import SearchIcon from '@mui/icons-material/Search';
 import CloseIcon from '@mui/icons-material/Close';
@@ -45,8 +46,10 @@ import { AnimatedThemeToggle } from '../components/AnimatedThemeToggle';
 import { TermWithHelp } from '../components/HelpIcon';
 import {
   useMessageDefinitions,
+  useMessageDetail,
   useMessageSearch,
   type MessageDefinition,
+  type MessageSummary,
   type SampleFlow,
   type PaymentSystem,
   type MtMapping,
@@ -142,7 +145,7 @@ function MessageCard({
   message,
   onClick,
 }: {
-  message: MessageDefinition;
+  message: MessageSummary;
   onClick: () => void;
 }) {
   const color = areaColors[message.business_area] || '#6b7280';
@@ -820,7 +823,9 @@ const ITEMS_PER_PAGE = 12;
 export function MessageDefinitionsPage() {
   const { messages, businessAreas, sampleFlows, paymentSystems, mtMappings, loading, error } = useMessageDefinitions();
   const { query, setQuery, selectedArea, setSelectedArea, results } = useMessageSearch(messages);
-  const [selectedMessage, setSelectedMessage] = useState<MessageDefinition | null>(null);
+  const [selectedMessage, setSelectedMessage] = useState<MessageSummary | null>(null);
+  // The catalogue only carries summaries; details come from the area shard.
+  const { detail: selectedDetail, error: detailError } = useMessageDetail(selectedMessage);
   const [activeTab, setActiveTab] = useState(0);
   const [page, setPage] = useState(1);
 
@@ -1091,9 +1096,21 @@ export function MessageDefinitionsPage() {
 
       {/* Message Detail Modal */}
       <MessageDetailModal
-        message={selectedMessage}
+        message={selectedDetail}
         onClose={() => setSelectedMessage(null)}
       />
+
+      {/* The detail shard failed to load: say so instead of leaving the click dead */}
+      <Snackbar
+        open={!!detailError}
+        autoHideDuration={6000}
+        onClose={() => setSelectedMessage(null)}
+        anchorOrigin={{ vertical: 'bottom', horizontal: 'center' }}
+      >
+        <Alert severity="error" onClose={() => setSelectedMessage(null)} sx={{ width: '100%' }}>
+          {detailError} for {selectedMessage?.id}. Click the card to try again.
+        </Alert>
+      </Snackbar>
     </Box>
   );
 }
@@ -28,6 +28,14 @@ export interface PaymentError {
   resources: Resource[];
 }
 
+/**
+ * Fields an ErrorCard renders - the "list" column group of the columnar export.
+ * Heavy fields are only loaded on the error page.
+ */
+export type PaymentErrorSummary = Pick<PaymentError, 'code' | 'name' | 'category' | 'severity' | 'message_types'> & {
+  description: Pick<ErrorDescription, 'short'> & Partial<Pick<ErrorDescription, 'detailed'>>;
+};
+
 export type ErrorCategory =
   | 'Account'
   | 'Amount'
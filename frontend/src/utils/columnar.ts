@@ -0,0 +1,97 @@
+/**
+ * Columnar errors catalogue
+ * Loads and decodes data/columnar/* (built by scripts/export_columnar.py).
+ * Groups are fetched on demand and rows are decoded lazily.
+ */
+
+import { fetchJson } from './fetchData';
+
+type Column =
+  | { type: 'str'; values: Array<number | null> }
+  | { type: 'strs'; values: Array<number[] | null> }
+  | { type: 'records'; fields: string[]; values: Array<Array<Array<number | null>> | null> }
+  | { type: 'json'; values: unknown[] };
+
+export type ColumnGroupName = 'list' | 'search' | 'detail';
+
+export interface ColumnGroup {
+  version: number;
+  group: ColumnGroupName;
+  rows: number;
+  strings: string[];
+  columns: Record<string, Column>;
+}
+
+interface ColumnarManifest {
+  version: number;
+  rows: number;
+  groups: Record<ColumnGroupName, { file: string; hash: string; bytes: number; columns: string[] }>;
+}
+
+let manifestPromise: Promise<ColumnarManifest> | null = null;
+const groupPromises = new Map<ColumnGroupName, Promise<ColumnGroup>>();
+
+/** Fetch one column group once per session (content-hashed, so safe to cache). */
+export function loadColumnGroup(name: ColumnGroupName): Promise<ColumnGroup> {
+  let promise = groupPromises.get(name);
+  if (!promise) {
+    manifestPromise ??= fetchJson<ColumnarManifest>('data/columnar/manifest.json');
+    promise = manifestPromise.then((manifest) =>
+      fetchJson<ColumnGroup>(`data/columnar/${manifest.groups[name].file}`)
+    );
+    promise.catch(() => {
+      groupPromises.delete(name);
+      manifestPromise = null;
+    });
+    groupPromises.set(name, promise);
+  }
+  return promise;
+}
+
+function decodeValue(column: Column, strings: string[], value: unknown): unknown {
+  switch (column.type) {
+    case 'str':
+      return strings[value as number];
+    case 'strs':
+      return (value as number[]).map((id) => strings[id]);
+    case 'records':
+      return (value as Array<Array<number | null>>).map((item) => {
+        const record: Record<string, string> = {};
+        column.fields.forEach((field, i) => {
+          const id = item[i];
+          if (id !== null) record[field] = strings[id];
+        });
+        return record;
+      });
+    default:
+      return value;
+  }
+}
+
+/** Decode one row into `target`, creating nested objects along column paths. */
+export function decodeRow<T>(group: ColumnGroup, index: number, target: Record<string, unknown> = {}): T {
+  Object.entries(group.columns).forEach(([path, column]) => {
+    const value = column.values[index];
+    if (value === null || value === undefined) return;
+    const parts = path.split('.');
+    let node = target;
+    parts.slice(0, -1).forEach((part) => {
+      node[part] ??= {};
+      node = node[part] as Record<string, unknown>;
+    });
+    node[parts[parts.length - 1]] = decodeValue(column, group.strings, value);
+  });
+  return target as T;
+}
+
+export function decodeAll<T>(group: ColumnGroup): T[] {
+  return Array.from({ length: group.rows }, (_, i) => decodeRow<T>(group, i));
+}
+
+/** Row index of an error code, read from the list group without decoding rows. */
+export function findRow(list: ColumnGroup, code: string): number {
+  const column = list.columns.code;
+  if (!column || column.type !== 'str') return -1;
+  const wanted = code.toLowerCase();
+  return column.values.findIndex((id) => id !== null && list.strings[id].toLowerCase() === wanted);
+}
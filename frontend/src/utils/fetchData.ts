@@ -0,0 +1,14 @@
+/**
+ * Fetch helpers for the files under public/data
+ */
+
+/** Vite's BASE_URL with a trailing slash, so data paths concatenate onto it. */
+export const baseUrl = () => (import.meta.env.BASE_URL || '/').replace(/\/?$/, '/');
+
+/** Fetch and parse a JSON file relative to the base URL; rejects on HTTP errors. */
+export function fetchJson<T>(path: string): Promise<T> {
+  return fetch(`${baseUrl()}${path}`).then((res) => {
+    if (!res.ok) throw new Error(`Failed to load ${path}: ${res.status}`);
+    return res.json() as Promise<T>;
+  });
+}
@@ -0,0 +1,57 @@
+/**
+ * Precomputed flow-graph layouts
+ * Loads data/layouts/* (built by scripts/build_flow_layouts.py) so large
+ * examples open without running dagre in the browser.
+ */
+
+import { fetchJson } from './fetchData';
+
+export type LayoutDirection = 'TB' | 'LR';
+
+export interface FlowLayout {
+  ids: string[];
+  TB: { size: [number, number]; xy: number[] };
+  LR: { size: [number, number]; xy: number[] };
+}
+
+interface FlowLayoutManifest {
+  version: number;
+  examples: Record<string, { file: string; nodes: number; bytes: number }>;
+}
+
+let manifestPromise: Promise<FlowLayoutManifest> | null = null;
+const layoutPromises = new Map<string, Promise<FlowLayout | null>>();
+
+/** Layout for one example, or null when none was built for it. */
+export function loadFlowLayout(exampleId: string): Promise<FlowLayout | null> {
+  let promise = layoutPromises.get(exampleId);
+  if (!promise) {
+    manifestPromise ??= fetchJson<FlowLayoutManifest>('data/layouts/index.json');
+    promise = manifestPromise.then((manifest) => {
+      const entry = manifest.examples[exampleId];
+      return entry ? fetchJson<FlowLayout>(`data/layouts/${entry.file}`) : null;
+    });
+    promise.catch(() => {
+      layoutPromises.delete(exampleId);
+      manifestPromise = null;
+    });
+    layoutPromises.set(exampleId, promise);
+  }
+  return promise;
+}
+
+/**
+ * Top-left positions by node id, or null if the layout does not cover
+ * exactly these nodes (stale build or edited steps).
+ */
+export function layoutPositions(
+  layout: FlowLayout,
+  direction: LayoutDirection,
+  nodeIds: string[]
+): Map<string, { x: number; y: number }> | null {
+  if (layout.ids.length !== nodeIds.length) return null;
+  const { xy } = layout[direction];
+  const positions = new Map<string, { x: number; y: number }>();
+  layout.ids.forEach((id, i) => positions.set(id, { x: xy[2 * i], y: xy[2 * i + 1] }));
+  return nodeIds.every((id) => positions.has(id)) ? positions : null;
+}
@@ -0,0 +1,80 @@
+/**
+ * Precomputed glossary annotations
+ * Loads data/annotations/* (built by scripts/annotate_glossary.py): for each
+ * record, the character ranges of its text fields that name a glossary term,
+ * so popovers need no matching in the browser.
+ */
+
+import { fetchJson } from './fetchData';
+
+// Datasets scripts/annotate_glossary.py builds annotations for
+export type AnnotatedDataset = 'errors';
+
+/** field path -> flat [start, end, termIndex, ...] (UTF-16 offsets). */
+export type FieldAnnotations = Record<string, number[]>;
+
+export interface DatasetAnnotations {
+  terms: string[];
+  records: Record<string, FieldAnnotations>;
+}
+
+export interface TextSegment {
+  text: string;
+  termId?: string;
+}
+
+interface AnnotationManifest {
+  version: number;
+  terms: string[];
+  files: Record<AnnotatedDataset, { file: string; records: number; bytes: number }>;
+}
+
+let manifestPromise: Promise<AnnotationManifest> | null = null;
+const datasetPromises = new Map<AnnotatedDataset, Promise<DatasetAnnotations>>();
+
+/** Annotations for every record of one dataset, fetched once per session. */
+export function loadAnnotations(dataset: AnnotatedDataset): Promise<DatasetAnnotations> {
+  let promise = datasetPromises.get(dataset);
+  if (!promise) {
+    manifestPromise ??= fetchJson<AnnotationManifest>('data/annotations/index.json');
+    promise = manifestPromise.then(async (manifest) => ({
+      terms: manifest.terms,
+      records: await fetchJson<Record<string, FieldAnnotations>>(
+        `data/annotations/${manifest.files[dataset].file}`
+      ),
+    }));
+    promise.catch(() => {
+      datasetPromises.delete(dataset);
+      manifestPromise = null;
+    });
+    datasetPromises.set(dataset, promise);
+  }
+  return promise;
+}
+
+/**
+ * Split text into plain and term segments. With firstOnly, only the first
+ * mention of each term is linked, so repeated words don't all grow icons.
+ */
+export function splitAnnotated(
+  text: string,
+  spans: number[] | undefined,
+  terms: string[],
+  firstOnly = true
+): TextSegment[] {
+  if (!spans || spans.length === 0) return [{ text }];
+  const segments: TextSegment[] = [];
+  const seen = new Set<number>();
+  let cursor = 0;
+  for (let i = 0; i + 2 < spans.length; i += 3) {
+    const [start, end, term] = [spans[i], spans[i + 1], spans[i + 2]];
+    // Stale annotations (text edited after the build) are ignored.
+    if (start < cursor || end > text.length || (firstOnly && seen.has(term))) continue;
+    seen.add(term);
+    if (start > cursor) segments.push({ text: text.slice(cursor, start) });
+    segments.push({ text: text.slice(start, end), termId: terms[term] });
+    cursor = end;
+  }
+  if (cursor < text.length) segments.push({ text: text.slice(cursor) });
+  return segments;
+}
@@ -0,0 +1,108 @@
+/**
+ * Precomputed quiz question banks
+ * Loads data/quiz/* (built by scripts/build_quiz_banks.py): one small file
+ * per business area and difficulty for message questions, and one per
+ * example for its "what message comes next?" quiz, so a quiz never needs
+ * the message definitions.
+ */
+
+import { fetchJson } from './fetchData';
+
+export type QuizDifficulty = 'easy' | 'medium' | 'hard';
+
+export interface BankQuestion {
+  /** Stable id, used to track which questions were answered */
+  id: string;
+  kind: 'name' | 'id' | 'purpose' | 'when_used' | 'use_case' | 'element' | 'mt';
+  prompt: string;
+  options: string[];
+  /** Index of the right option */
+  answer: number;
+  explanation: string;
+  /** Message names for id options (medium questions) */
+  details?: string[];
+}
+
+export interface FlowQuestion {
+  /** Index into the example's steps */
+  step: number;
+  options: string[];
+  answer: number;
+  hint: string;
+}
+
+export interface FlowQuiz {
+  example: string;
+  /** Names of the message ids used as options */
+  names: Record<string, string>;
+  questions: FlowQuestion[];
+}
+
+interface BankEntry {
+  file: string;
+  count: number;
+}
+
+export interface QuizIndex {
+  version: number;
+  seed: number;
+  difficulties: QuizDifficulty[];
+  areas: Record<string, { name: string; banks: Partial<Record<QuizDifficulty, BankEntry>> }>;
+  flows: Record<string, BankEntry>;
+}
+
+let indexPromise: Promise<QuizIndex> | null = null;
+const filePromises = new Map<string, Promise<unknown>>();
+
+/** The bank manifest, fetched once per session. */
+export function loadQuizIndex(): Promise<QuizIndex> {
+  if (!indexPromise) {
+    indexPromise = fetchJson<QuizIndex>('data/quiz/index.json');
+    indexPromise.catch(() => {
+      indexPromise = null;
+    });
+  }
+  return indexPromise;
+}
+
+function loadFile<T>(file: string): Promise<T> {
+  let promise = filePromises.get(file) as Promise<T> | undefined;
+  if (!promise) {
+    promise = fetchJson<T>(`data/quiz/${file}`);
+    promise.catch(() => filePromises.delete(file));
+    filePromises.set(file, promise);
+  }
+  return promise;
+}
+
+/** Questions for one example's flow, or null when it has none. */
+export async function loadFlowQuiz(exampleId: string): Promise<FlowQuiz | null> {
+  const entry = (await loadQuizIndex()).flows[exampleId];
+  return entry ? loadFile<FlowQuiz>(entry.file) : null;
+}
+
+/** One business area's questions at one difficulty (empty when the bank does not exist). */
+export async function loadAreaBank(area: string, difficulty: QuizDifficulty): Promise<BankQuestion[]> {
+  const entry = (await loadQuizIndex()).areas[area]?.banks[difficulty];
+  if (!entry) return [];
+  const bank = await loadFile<{ questions: BankQuestion[] }>(entry.file);
+  return bank.questions;
+}
+
+function shuffle<T>(items: T[]): T[] {
+  const copy = [...items];
+  for (let i = copy.length - 1; i > 0; i--) {
+    const j = Math.floor(Math.random() * (i + 1));
+    [copy[i], copy[j]] = [copy[j], copy[i]];
+  }
+  return copy;
+}
+
+/**
+ * Up to count questions from a bank, unanswered ones first, in random order.
+ */
+export function drawQuestions(questions: BankQuestion[], count: number, answered: Set<string>): BankQuestion[] {
+  const fresh = shuffle(questions.filter((q) => !answered.has(q.id)));
+  const seen = shuffle(questions.filter((q) => answered.has(q.id)));
+  return fresh.concat(seen).slice(0, count);
+}
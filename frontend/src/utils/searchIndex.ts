@@ -0,0 +1,192 @@
+/**
+ * Prebuilt error search index
+ * Query engine for data/search/errors_index.json (built by scripts/search_index.py).
+ * Must stay in step with the Python reference engine so rankings match.
+ */
+
+export interface ErrorSearchIndexData {
+  version: number;
+  docs: string[];
+  terms: string[];
+  postings: number[][];
+  synonyms: Record<string, string[]>;
+  source: { version: string; updated: string; hash: string };
+}
+
+const PREFIX_FACTOR = 0.7;
+const PLURAL_FACTOR = 0.9;
+const FUZZY_FACTOR = 0.5;
+const FUZZY_MIN_SIMILARITY = 0.5;
+const MIN_PREFIX_LENGTH = 2;
+const MIN_FUZZY_LENGTH = 4;
+const MIN_SINGULAR_LENGTH = 3;
+const SYNONYM_FALLBACK_BELOW = 5;
+
+export function tokenize(text: string): string[] {
+  if (!text) return [];
+  return text.replace(/([a-z])([A-Z])/g, '$1 $2').toLowerCase().match(/[a-z0-9]+/g) ?? [];
+}
+
+/** Light plural fold: charges -> charge, charg; fees -> fee. Not a stemmer. */
+function singularForms(token: string): string[] {
+  if (token.endsWith('ss') || !token.endsWith('s')) return [];
+  const forms = token.length > MIN_SINGULAR_LENGTH ? [token.slice(0, -1)] : [];
+  if (token.endsWith('es') && token.length > MIN_SINGULAR_LENGTH + 2) forms.push(token.slice(0, -2));
+  return forms;
+}
+
+function trigrams(word: string): Set<string> {
+  const padded = ` ${word} `;
+  const grams = new Set<string>();
+  for (let i = 0; i < padded.length - 2; i++) {
+    grams.add(padded.slice(i, i + 3));
+  }
+  return grams;
+}
+
+const round6 = (value: number) => Math.round(value * 1e6) / 1e6;
+
+export class ErrorSearchIndex {
+  readonly docs: string[];
+  private readonly terms: string[];
+  private readonly synonyms: Record<string, string[]>;
+  private readonly postings: Array<Array<[number, number]>>;
+  private readonly termIds = new Map<string, number>();
+  private trigramIndex: Map<string, number[]> | null = null;
+
+  constructor(data: ErrorSearchIndexData) {
+    this.docs = data.docs;
+    this.terms = data.terms;
+    this.synonyms = data.synonyms;
+    this.postings = data.postings.map((flat) => {
+      const decoded: Array<[number, number]> = [];
+      let doc = 0;
+      for (let i = 0; i < flat.length; i += 2) {
+        doc += flat[i];
+        decoded.push([doc, flat[i + 1]]);
+      }
+      return decoded;
+    });
+    this.terms.forEach((term, i) => this.termIds.set(term, i));
+  }
+
+  private idf(termId: number): number {
+    const n = this.docs.length;
+    const df = this.postings[termId].length;
+    return Math.log(1 + (n - df + 0.5) / (df + 0.5));
+  }
+
+  private prefixRange(token: string): number[] {
+    let lo = 0;
+    let hi = this.terms.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (this.terms[mid] < token) lo = mid + 1;
+      else hi = mid;
+    }
+    const ids: number[] = [];
+    while (lo < this.terms.length && this.terms[lo].startsWith(token)) {
+      ids.push(lo++);
+    }
+    return ids;
+  }
+
+  private fuzzy(token: string): Array<[number, number]> {
+    if (!this.trigramIndex) {
+      const index = new Map<string, number[]>();
+      this.terms.forEach((term, termId) => {
+        trigrams(term).forEach((gram) => {
+          const list = index.get(gram);
+          if (list) list.push(termId);
+          else index.set(gram, [termId]);
+        });
+      });
+      this.trigramIndex = index;
+    }
+    const grams = trigrams(token);
+    const shared = new Map<number, number>();
+    grams.forEach((gram) => {
+      this.trigramIndex!.get(gram)?.forEach((termId) => {
+        shared.set(termId, (shared.get(termId) ?? 0) + 1);
+      });
+    });
+    const matches: Array<[number, number]> = [];
+    shared.forEach((common, termId) => {
+      const similarity = (2 * common) / (grams.size + trigrams(this.terms[termId]).size);
+      if (similarity >= FUZZY_MIN_SIMILARITY) {
+        matches.push([termId, FUZZY_FACTOR * similarity]);
+      }
+    });
+    return matches;
+  }
+
+  /** Exact and prefix matches of the token and its singular forms, else fuzzy ones. */
+  private matchTerms(token: string): Array<[number, number]> {
+    const factors = new Map<number, number>();
+    const add = (termId: number, factor: number) => {
+      if (factor > (factors.get(termId) ?? 0)) factors.set(termId, factor);
+    };
+    const forms: Array<[string, number]> = [[token, 1]];
+    singularForms(token).forEach((form) => forms.push([form, PLURAL_FACTOR]));
+    forms.forEach(([form, exactFactor]) => {
+      const exact = this.termIds.get(form);
+      if (exact !== undefined) add(exact, exactFactor);
+      if (form.length >= MIN_PREFIX_LENGTH) {
+        this.prefixRange(form).forEach((termId) => add(termId, PREFIX_FACTOR));
+      }
+    });
+    if (factors.size === 0 && token.length >= MIN_FUZZY_LENGTH) {
+      return this.fuzzy(token);
+    }
+    return Array.from(factors.entries());
+  }
+
+  private scoreToken(token: string): Map<number, number> {
+    const scores = new Map<number, number>();
+    this.matchTerms(token).forEach(([termId, factor]) => {
+      const weight = this.idf(termId) * factor;
+      this.postings[termId].forEach(([doc, score]) => {
+        const value = score * weight;
+        if (value > (scores.get(doc) ?? 0)) scores.set(doc, value);
+      });
+    });
+    return scores;
+  }
+
+  private rank(tokens: string[], requireAll: boolean): number[] {
+    const totals = new Map<number, number>();
+    const hits = new Map<number, number>();
+    tokens.forEach((token) => {
+      this.scoreToken(token).forEach((value, doc) => {
+        totals.set(doc, (totals.get(doc) ?? 0) + value);
+        hits.set(doc, (hits.get(doc) ?? 0) + 1);
+      });
+    });
+    const docs = Array.from(totals.keys()).filter((doc) => !requireAll || hits.get(doc) === tokens.length);
+    return docs.sort((a, b) => round6(totals.get(b)!) - round6(totals.get(a)!) || a - b);
+  }
+
+  /** Matching error codes, best first, with synonym fallback for sparse results. */
+  search(query: string): string[] {
+    const tokens = Array.from(new Set(tokenize(query)));
+    if (tokens.length === 0) return [];
+
+    const results = this.rank(tokens, true);
+    if (results.length < SYNONYM_FALLBACK_BELOW) {
+      const expanded = [...tokens];
+      query.toLowerCase().split(/\s+/).forEach((word) => {
+        if (!Object.prototype.hasOwnProperty.call(this.synonyms, word)) return;
+        this.synonyms[word].forEach((token) => {
+          if (!expanded.includes(token)) expanded.push(token);
+        });
+      });
+      if (expanded.length > tokens.length) {
+        const seen = new Set(results);
+        this.rank(expanded, false).forEach((doc) => {
+          if (!seen.has(doc)) results.push(doc);
+        });
+      }
+    }
+    return results.map((doc) => this.docs[doc]);
+  }
+}
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Bulk analysis of ISO 20022 status messages against the errors catalogue.
+
+Streams pacs.002, pacs.004, pain.002 and camt.029 files (plain or .gz, any
+size, any number of documents per file) with expat, so no DOM is built.
+Reason codes are read from ``<...RsnInf>/Rsn/Cd`` (StsRsnInf, RtrRsnInf,
+CxlStsRsnInf, ModStsRsnInf, ...) and ``Rsn/Prtry`` for proprietary codes,
+then joined with errors.json for counts by code, category, severity and
+message type. The catalogue's ``xpath_locations`` for each code are tallied
+too, showing which fields of the original payment the failures point at.
+
+One file is one task in a process pool. A malformed document is reported
+as a failure; the documents before it in the same file are still counted.
+
+Usage:
+    python scripts/analyze_status_messages.py dumps/2026-10-16/ [more files or dirs]
+    python scripts/analyze_status_messages.py dumps/ --workers 8 --json report.json --top 20
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from xml.parsers import expat
+
+from datasets import dataset_path, iter_records
+
+READ_SIZE = 1024 * 1024
+MESSAGE_TYPE_RE = re.compile(r'\b([a-z]{4}\.\d{3})\.\d{3}\.\d{2}\b')
+
+# Message root element (first child of Document) -> message type, for
+# documents without a versioned namespace.
+ROOT_MESSAGE_TYPES = {
+    'FIToFIPmtStsRpt': 'pacs.002',
+    'PmtRtr': 'pacs.004',
+    'CstmrPmtStsRpt': 'pain.002',
+    'RsltnOfInvstgtn': 'camt.029',
+}
+REASON_KINDS = ('Cd', 'Prtry')
+UNKNOWN = 'unknown'
+JUNK_AFTER_ROOT = expat.errors.codes[expat.errors.XML_ERROR_JUNK_AFTER_DOC_ELEMENT]
+
+
+class StatusScanner:
+    """expat callbacks that count reason codes per message type."""
+
+    def __init__(self):
+        self.stack = []
+        self.message_type = UNKNOWN
+        self.capture = None
+        self.text = []
+        self.documents = Counter()
+        self.reasons = Counter()
+        self.parser = None
+        self.root_end = None
+
+    def start(self, name, attrs):
+        # Namespace processing is off (it is the slow path in expat); strip
+        # any prefix and read the message version from the xmlns attribute.
+        local = name.rpartition(':')[2] if ':' in name else name
+        stack = self.stack
+        if local == 'Document':
+            match = MESSAGE_TYPE_RE.search(' '.join(v for k, v in attrs.items() if k.startswith('xmlns')))
+            self.message_type = match.group(1) if match else UNKNOWN
+        elif stack and stack[-1] == 'Document':
+            if self.message_type == UNKNOWN:
+                self.message_type = ROOT_MESSAGE_TYPES.get(local, UNKNOWN)
+            self.documents[self.message_type] += 1
+        elif local in REASON_KINDS and len(stack) >= 2 and stack[-1] == 'Rsn' and stack[-2].endswith('RsnInf'):
+            self.capture = local
+            self.text = []
+        stack.append(local)
+
+    def end(self, name):
+        if self.capture and (name.rpartition(':')[2] if ':' in name else name) == self.capture:
+            code = ''.join(self.text).strip()
+            if code:
+                self.reasons[(self.message_type, self.capture, code)] += 1
+            self.capture = None
+        self.stack.pop()
+        if not self.stack:
+            # Where the root's end tag starts; the next document follows it.
+            self.root_end = self.parser.CurrentByteIndex
+
+    def chars(self, data):
+        if self.capture:
+            self.text.append(data)
+
+
+def open_input(path):
+    return gzip.open(path, 'rb') if path.endswith('.gz') else open(path, 'rb')
+
+
+def new_parser(scanner):
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = scanner.start
+    parser.EndElementHandler = scanner.end
+    parser.CharacterDataHandler = scanner.chars
+    scanner.parser = parser
+    scanner.root_end = None
+    return parser
+
+
+def scan_file(path):
+    """Worker: stream one file; returns plain dicts so results pickle cheaply.
+
+    expat stops at the end of the first root element ("junk after document
+    element"), so each further document in the file gets a fresh parser
+    starting at the byte expat rejected. A read or parse error ends the scan
+    but keeps the counts of the documents before it.
+    """
+    scanner = StatusScanner()
+    parser = new_parser(scanner)
+    start = 0  # file offset the current parser started at
+    size = 0
+    tail = b''
+    error = None
+    try:
+        with open_input(path) as f:
+            for block in iter(lambda: f.read(READ_SIZE), b''):
+                data, data_start = tail + block, size - len(tail)
+                fed = len(tail)
+                size += len(block)
+                while True:
+                    try:
+                        parser.Parse(data[fed:], False)
+                        break
+                    except expat.ExpatError as exc:
+                        next_document = start + parser.ErrorByteIndex
+                        if exc.code != JUNK_AFTER_ROOT or next_document < data_start:
+                            raise
+                    start, fed = next_document, next_document - data_start
+                    parser = new_parser(scanner)
+                # Keep the bytes a junk error in a later block can point back
+                # into: from the root's end tag once it has closed, else this
+                # block, where that end tag may start.
+                keep = start + scanner.root_end if scanner.root_end is not None else size - len(block)
+                tail = data[max(keep - data_start, 0):]
+            parser.Parse(b'', True)
+    except (OSError, EOFError, expat.ExpatError) as exc:
+        error = f'{exc} (document at byte {start})' if isinstance(exc, expat.ExpatError) else str(exc)
+    return {
+        'bytes': size,
+        'documents': dict(scanner.documents),
+        'reasons': [[message_type, kind, code, count] for (message_type, kind, code), count in scanner.reasons.items()],
+        'error': error,
+    }
+
+
+def collect_files(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                files.extend(os.path.join(root, n) for n in sorted(names) if n.endswith(('.xml', '.xml.gz')))
+        else:
+            files.append(path)
+    return files
+
+
+def load_catalogue():
+    return {
+        error['code']: {
+            'name': error['name'],
+            'category': error['category'],
+            'severity': error['severity'],
+            'xpath_locations': error.get('xpath_locations', []),
+        }
+        for error in iter_records(dataset_path('errors'), 'errors')
+    }
+
+
+def analyze(paths, workers=None):
+    """Scan every file in a process pool and join the codes with the catalogue."""
+    files = collect_files(paths)
+    catalogue = load_catalogue()
+    totals = {'files': len(files), 'bytes': 0, 'documents': 0, 'reasons': 0, 'unknown_codes': 0}
+    by = {name: Counter() for name in ('code', 'category', 'severity', 'message_type', 'field', 'proprietary', 'unknown')}
+    documents = Counter()
+    failures = []
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(scan_file, path): path for path in files}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except (OSError, EOFError, expat.ExpatError) as exc:
+                failures.append({'file': futures[future], 'error': str(exc)})
+                continue
+            if result['error']:
+                # The documents before the failure still count.
+                failures.append({'file': futures[future], 'error': result['error']})
+            totals['bytes'] += result['bytes']
+            documents.update(result['documents'])
+            for message_type, kind, code, count in result['reasons']:
+                totals['reasons'] += count
+                by['message_type'][message_type] += count
+                if kind == 'Prtry':
+                    by['proprietary'][code] += count
+                    continue
+                entry = catalogue.get(code)
+                if entry is None:
+                    totals['unknown_codes'] += count
+                    by['unknown'][code] += count
+                    continue
+                by['code'][code] += count
+                by['category'][entry['category']] += count
+                by['severity'][entry['severity']] += count
+                for xpath in entry['xpath_locations']:
+                    by['field'][xpath] += count
+
+    totals['documents'] = sum(documents.values())
+    totals['seconds'] = round(time.perf_counter() - start, 3)
+    return {
+        'totals': totals,
+        'documents': dict(documents.most_common()),
+        'by_code': [
+            {'code': code, 'name': catalogue[code]['name'], 'count': count}
+            for code, count in by['code'].most_common()
+        ],
+        **{f'by_{name}': dict(by[name].most_common()) for name in ('category', 'severity', 'message_type', 'field', 'proprietary', 'unknown')},
+        'failures': sorted(failures, key=lambda item: item['file']),
+    }
+
+
+def print_section(title, rows, top):
+    if not rows:
+        return
+    print(f"\n{title}")
+    for label, count in rows[:top]:
+        print(f"  {count:10,d}  {label}")
+    if len(rows) > top:
+        print(f"  ... {len(rows) - top} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='+', help='XML files or directories (.xml, .xml.gz)')
+    parser.add_argument('--workers', type=int, help='Process pool size (default: CPU count)')
+    parser.add_argument('--json', dest='json_out', help='Write the full report to this JSON file')
+    parser.add_argument('--top', type=int, default=10, help='Rows per section in the summary')
+    args = parser.parse_args()
+
+    report = analyze(args.paths, args.workers)
+    totals = report['totals']
+    mb = totals['bytes'] / 1024 / 1024
+    print(
+        f"{totals['files']} files, {mb:,.1f} MB, {totals['documents']:,} documents, "
+        f"{totals['reasons']:,} reason codes in {totals['seconds']:.1f}s "
+        f"({mb / max(totals['seconds'], 1e-9):,.0f} MB/s)"
+    )
+    print_section('By message type', list(report['by_message_type'].items()), args.top)
+    print_section('By severity', list(report['by_severity'].items()), args.top)
+    print_section('By category', list(report['by_category'].items()), args.top)
+    print_section('By code', [(f"{row['code']}  {row['name']}", row['count']) for row in report['by_code']], args.top)
+    print_section('Fields implicated (catalogue xpath_locations)', list(report['by_field'].items()), args.top)
+    print_section('Proprietary codes', list(report['by_proprietary'].items()), args.top)
+    print_section('Codes not in the catalogue', list(report['by_unknown'].items()), args.top)
+    for failure in report['failures']:
+        print(f"FAILED {failure['file']}: {failure['error']}")
+
+    if args.json_out:
+        with open(args.json_out, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 1 if report['failures'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
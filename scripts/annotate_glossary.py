@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Build-time glossary annotation with an Aho-Corasick automaton.
+
+Every glossary display name and alias becomes a pattern in one automaton,
+and each annotated text field (error descriptions, causes and fix steps) is
+scanned once, in time linear in the text size whatever the number of terms.
+Matches must sit on word boundaries; all-caps aliases (BIC, UETR, DVP) match
+case-sensitively, everything else ignores case. Overlaps resolve
+leftmost-longest, so "Debtor Agent" wins over "Debtor".
+
+Only datasets with a page that renders annotations (ErrorPage, via
+GlossaryText) are listed in TEXT_FIELDS; add one there together with its
+consumer.
+
+Output, one content-hashed file per dataset plus a manifest:
+
+    data/annotations/index.json              {"terms": [term ids], "files": {dataset: file}}
+    data/annotations/<dataset>.<hash>.json   {record id: {field path: [start, end, term, ...]}}
+
+Field paths are dotted (``description.short``, ``steps.3.description``),
+``term`` indexes the manifest's term list and offsets are UTF-16 code
+units, so they slice JavaScript strings directly.
+
+Usage:
+    python scripts/annotate_glossary.py [--dry-run] [--verbose]
+"""
+
+import argparse
+import os
+import re
+import sys
+from collections import Counter, deque
+
+from datasets import DATA_DIR, DATASETS, content_hash, dataset_path, dumps_compact, iter_records, write_if_changed
+
+ANNOTATIONS_DIR = os.path.join(DATA_DIR, 'annotations')
+MANIFEST_NAME = 'index.json'
+ANNOTATION_FILE_RE = re.compile(r'^[a-z]+\.[0-9a-f]{10}\.json$')
+
+# Text fields per annotated dataset; "*" matches every list index or mapping key.
+TEXT_FIELDS = {
+    'errors': [
+        'description.short', 'description.detailed', 'common_causes.*', 'how_to_fix.steps.*', 'how_to_fix.prevention',
+    ],
+}
+
+
+def fold(text):
+    """Lowercase one character at a time so offsets never shift."""
+    return ''.join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+class Automaton:
+    """Aho-Corasick over folded patterns; each pattern maps to one term."""
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]  # per node: (length, term, exact text or None) ending here, own patterns only
+        self.link = [0]  # nearest proper suffix node with output (dictionary link)
+
+    def add(self, pattern, term):
+        node = 0
+        for char in fold(pattern):
+            nxt = self.goto[node].get(char)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[node][char] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append([])
+                self.link.append(0)
+            node = nxt
+        exact = pattern if pattern.isupper() else None
+        if all(existing[2] != exact for existing in self.out[node]):
+            self.out[node].append((len(pattern), term, exact))
+            return True
+        return False
+
+    def build(self):
+        # Breadth-first, so a node's failure target is final before its children's.
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                state = self.fail[node]
+                while state and char not in self.goto[state]:
+                    state = self.fail[state]
+                self.fail[child] = self.goto[state].get(char, 0)
+                target = self.fail[child]
+                self.link[child] = target if self.out[target] else self.link[target]
+                queue.append(child)
+
+    def matches(self, text):
+        """All (start, end, term) pattern occurrences on word boundaries."""
+        found = []
+        node = 0
+        for end, char in enumerate(fold(text), 1):
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+            hit = node if self.out[node] else self.link[node]
+            while hit:
+                for length, term, exact in self.out[hit]:
+                    start = end - length
+                    if exact is not None and text[start:end] != exact:
+                        continue
+                    if (start and text[start - 1].isalnum()) or (end < len(text) and text[end].isalnum()):
+                        continue
+                    found.append((start, end, term))
+                    break
+                hit = self.link[hit]
+        return found
+
+
+def leftmost_longest(matches):
+    chosen = []
+    last_end = 0
+    for start, end, term in sorted(matches, key=lambda m: (m[0], m[0] - m[1])):
+        if start >= last_end:
+            chosen.append((start, end, term))
+            last_end = end
+    return chosen
+
+
+def utf16_offsets(text):
+    """Map code point offsets to UTF-16 offsets (identity for BMP-only text)."""
+    if all(ord(c) < 0x10000 for c in text):
+        return None
+    offsets = [0]
+    for c in text:
+        offsets.append(offsets[-1] + (2 if ord(c) >= 0x10000 else 1))
+    return offsets
+
+
+def iter_fields(record, path):
+    """Yield (dotted path, string) for one TEXT_FIELDS pattern."""
+
+    def walk(value, parts, prefix):
+        if not parts:
+            if isinstance(value, str) and value:
+                yield '.'.join(prefix), value
+            return
+        head, rest = parts[0], parts[1:]
+        if head == '*':
+            items = value.items() if isinstance(value, dict) else enumerate(value) if isinstance(value, list) else ()
+            for key, child in items:
+                yield from walk(child, rest, prefix + [str(key)])
+        elif isinstance(value, dict) and head in value:
+            yield from walk(value[head], rest, prefix + [head])
+
+    yield from walk(record, path.split('.'), [])
+
+
+def build_automaton(terms):
+    automaton = Automaton()
+    collisions = []
+    # Display names first: a name always beats another term's alias.
+    patterns = [(term['display_name'], index) for index, term in enumerate(terms)]
+    patterns += [(alias, index) for index, term in enumerate(terms) for alias in term.get('aliases', [])]
+    for pattern, index in patterns:
+        if pattern.strip() and not automaton.add(pattern, index):
+            collisions.append((pattern, terms[index]['id']))
+    automaton.build()
+    return automaton, collisions
+
+
+def annotate(terms):
+    """Scan the annotated datasets; returns ({dataset: {id: {path: spans}}}, per-term counts, stats)."""
+    automaton, collisions = build_automaton(terms)
+    results = {}
+    counts = Counter()
+    stats = {'fields': 0, 'chars': 0, 'spans': 0, 'collisions': collisions}
+    for dataset, paths in TEXT_FIELDS.items():
+        spec = DATASETS[dataset]
+        annotated = {}
+        for record in iter_records(dataset_path(dataset), spec['key']):
+            fields = {}
+            for pattern in paths:
+                for path, text in iter_fields(record, pattern):
+                    stats['fields'] += 1
+                    stats['chars'] += len(text)
+                    spans = leftmost_longest(automaton.matches(text))
+                    if not spans:
+                        continue
+                    offsets = utf16_offsets(text)
+                    flat = []
+                    for start, end, term in spans:
+                        if offsets:
+                            start, end = offsets[start], offsets[end]
+                        flat.extend((start, end, term))
+                        counts[term] += 1
+                    fields[path] = flat
+                    stats['spans'] += len(spans)
+            if fields:
+                annotated[record[spec['id_field']]] = fields
+        results[dataset] = annotated
+    return results, counts, stats
+
+
+def write_annotations(results, terms, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    files = {}
+    for dataset, annotated in results.items():
+        payload = dumps_compact(annotated)
+        name = f'{dataset}.{content_hash(payload)}.json'
+        write_if_changed(os.path.join(out_dir, name), payload)
+        files[dataset] = {'file': name, 'records': len(annotated), 'bytes': len(payload)}
+    manifest = {'version': 1, 'terms': [term['id'] for term in terms], 'files': files}
+    changed = write_if_changed(os.path.join(out_dir, MANIFEST_NAME), dumps_compact(manifest))
+    live = {entry['file'] for entry in files.values()}
+    for name in os.listdir(out_dir):
+        if ANNOTATION_FILE_RE.match(name) and name not in live:
+            os.remove(os.path.join(out_dir, name))
+    return files, changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--out', default=ANNOTATIONS_DIR, help='Output directory')
+    parser.add_argument('--dry-run', action='store_true', help='Report without writing')
+    parser.add_argument('--verbose', action='store_true', help='Show match counts per term')
+    args = parser.parse_args()
+
+    terms = list(iter_records(dataset_path('glossary'), 'terms'))
+    results, counts, stats = annotate(terms)
+
+    print(
+        f"{len(terms)} terms over {stats['fields']:,} fields ({stats['chars']:,} chars): "
+        f"{stats['spans']:,} annotations"
+    )
+    for pattern, term_id in stats['collisions']:
+        print(f"  duplicate pattern {pattern!r} ({term_id}) ignored")
+    if args.verbose:
+        for index, term in enumerate(terms):
+            print(f"  {counts[index]:6d}  {term['id']}")
+    if args.dry_run:
+        return 0
+    files, changed = write_annotations(results, terms, args.out)
+    for dataset, entry in files.items():
+        print(f"  {dataset:<9} {entry['records']:5d} records  {entry['bytes'] / 1024:7.1f} KB  {entry['file']}")
+    print(f"Manifest {'updated' if changed else 'unchanged'}: {os.path.join(args.out, MANIFEST_NAME)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
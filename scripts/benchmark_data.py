@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the data layer, with stored baselines and regression checks.
+
+Measures, for each published dataset and for synthetic example fixtures at
+several scales:
+    parse_s            best-of-N json.load time
+    peak_mem_mb        tracemalloc peak while parsing
+    size_raw / size_gzip / size_brotli   serialized bytes
+    merge_rps          records per second through merge_data.merge
+    index_build_s      search index build time (errors only)
+
+Results are written as JSON. With a baseline present, the run fails when a
+metric regresses by more than its threshold (time and memory are noisy, so
+they get looser thresholds than sizes).
+
+Usage:
+    python scripts/benchmark_data.py                     # compare with baseline
+    python scripts/benchmark_data.py --scales 1,10,100
+    python scripts/benchmark_data.py --update-baseline
+"""
+
+import argparse
+import gzip
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from datasets import DATASETS, REPO_ROOT, dataset_path, load_json
+from generate_fixtures import BASELINE_EXAMPLES, write_fixture
+from merge_data import merge
+import search_index
+
+try:
+    import brotli
+except ImportError:  # optional: sizes are reported as null without it
+    brotli = None
+
+BENCH_DIR = os.path.join(REPO_ROOT, 'benchmarks')
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baseline.json')
+RESULTS_FILE = os.path.join(BENCH_DIR, 'results', 'latest.json')
+
+# Relative regression allowed per metric, and whether higher is better.
+METRICS = {
+    'parse_s': (0.50, False),
+    'peak_mem_mb': (0.25, False),
+    'size_raw': (0.05, False),
+    'size_gzip': (0.05, False),
+    'size_brotli': (0.05, False),
+    'merge_rps': (0.50, True),
+    'index_build_s': (0.50, False),
+}
+
+
+def best_of(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def peak_memory_mb(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def measure_file(path, dataset, repeat, tmp_dir):
+    """Collect every metric for one dataset-shaped file."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    metrics = {
+        'parse_s': best_of(lambda: load_json(path), repeat),
+        'peak_mem_mb': peak_memory_mb(lambda: load_json(path)),
+        'size_raw': len(raw),
+        'size_gzip': len(gzip.compress(raw, 9)),
+        'size_brotli': len(brotli.compress(raw, quality=11)) if brotli else None,
+    }
+
+    out = os.path.join(tmp_dir, f'merged-{dataset}.json')
+    inputs = [] if path == dataset_path(dataset) else [path]
+    records = merge(dataset, inputs, out)['read']
+    metrics['merge_rps'] = records / best_of(lambda: merge(dataset, inputs, out), repeat)
+
+    if dataset == 'errors':
+        errors = load_json(path)['errors']
+        synonyms = search_index.load_synonyms()
+        metrics['index_build_s'] = best_of(lambda: search_index.build_index(errors, synonyms), repeat)
+    return metrics
+
+
+def run(scales, repeat, seed):
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='bench-') as tmp_dir:
+        for name in DATASETS:
+            print(f"  {name} ...")
+            results[name] = measure_file(dataset_path(name), name, repeat, tmp_dir)
+        for scale in scales:
+            print(f"  synthetic x{scale} ...")
+            fixture = os.path.join(tmp_dir, f'synthetic-x{scale}.json')
+            write_fixture(fixture, scale * BASELINE_EXAMPLES, 12, 8, seed)
+            results[f'synthetic_x{scale}'] = measure_file(fixture, 'examples', repeat, tmp_dir)
+            os.remove(fixture)
+    return results
+
+
+def compare(results, baseline):
+    """Return a list of (subject, metric, baseline, current, change) regressions."""
+    regressions = []
+    for subject, metrics in results.items():
+        for metric, current in metrics.items():
+            previous = baseline.get(subject, {}).get(metric)
+            if current is None or not previous:
+                continue
+            threshold, higher_is_better = METRICS[metric]
+            change = (current - previous) / previous
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append((subject, metric, previous, current, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default='1,10', help='Comma-separated synthetic scales')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best is kept)')
+    parser.add_argument('--seed', type=int, default=20022)
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--out', default=RESULTS_FILE)
+    parser.add_argument('--update-baseline', action='store_true', help='Store this run as the baseline')
+    args = parser.parse_args()
+
+    scales = [int(scale) for scale in args.scales.split(',') if scale]
+    print("Running data benchmarks")
+    results = run(scales, args.repeat, args.seed)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'brotli': brotli is not None,
+        },
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    for subject, metrics in results.items():
+        summary = ', '.join(
+            f"{metric}={value:.4g}" for metric, value in metrics.items() if value is not None
+        )
+        print(f"{subject}: {summary}")
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline found; run with --update-baseline to create one")
+        return 0
+
+    regressions = compare(results, load_json(args.baseline)['results'])
+    for subject, metric, previous, current, change in regressions:
+        print(f"REGRESSION {subject}.{metric}: {previous:.4g} -> {current:.4g} ({change:+.0%})")
+    if regressions:
+        return 1
+    print("No regressions against baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Data build orchestrator: runs every data stage as a content-hashed DAG.
+
+Each stage declares the files it reads and writes (glob patterns relative
+to the repo root). A stage depends on every stage whose outputs it reads,
+independent stages run in parallel (each stage is its own process), and a
+stage is skipped when the hash of its inputs, including its own scripts,
+matches the last successful run and its outputs still exist.
+
+Stages:
+    merge      fold pending complex_examples.json into real_world_examples.json
+    chunks     errors.json -> data/chunks/
+    search     errors.json -> data/search/
+    columnar   errors.json -> data/columnar/
+    messages   message_definitions.json -> data/messages/
+    layouts    real_world_examples.json -> data/layouts/
+    examples   real_world_examples.json -> data/examples/
+    quiz       message_definitions.json + real_world_examples.json -> data/quiz/
+    graph      all datasets -> build/graph/ (not deployed)
+    annotate   glossary terms in errors.json -> data/annotations/
+    validate   schema and integrity checks over the datasets and chunks
+    sitemap    errors.json -> public/sitemap.xml
+    prerender  errors.json -> dist/iso20022/error/<CODE>.html (once vite has built dist/)
+    compress   precompress dist/iso20022/data (only once vite has built dist/)
+
+Every run writes a report with per-stage status, wall time, CPU time and
+peak RSS (largest process in the stage, from wait4) plus the critical path,
+to show where build time goes. Within a stage, the instrumented scripts
+write per-phase traces to .cache/traces/<script>.json (see instrument.py).
+
+Usage:
+    python scripts/build.py                   # everything that is out of date
+    python scripts/build.py layouts validate  # these stages and what they depend on
+    python scripts/build.py --force --jobs 4 --report build-report.json
+"""
+
+import argparse
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from datasets import REPO_ROOT, write_bytes_atomic
+
+STATE_FILE = os.path.join(REPO_ROOT, '.cache', 'build-state.json')
+REPORT_FILE = os.path.join(REPO_ROOT, '.cache', 'build-report.json')
+TRACE_DIR = os.path.join(REPO_ROOT, '.cache', 'traces')
+DATA = 'frontend/public/data'
+PYTHON = sys.executable
+SHARED = ['scripts/datasets.py', 'scripts/instrument.py']
+
+# name -> command, inputs and outputs (globs relative to REPO_ROOT). An
+# "optional" stage is skipped when none of its inputs exist; "requires"
+# names a path that must exist for the stage to make sense at all.
+STAGES = {
+    'merge': {
+        'command': [PYTHON, 'scripts/merge_complex.py'],
+        'inputs': [f'{DATA}/complex_examples.json', 'scripts/merge_complex.py', 'scripts/merge_data.py'] + SHARED,
+        'outputs': [f'{DATA}/real_world_examples.json'],
+        'optional': True,
+    },
+    'chunks': {
+        'command': [PYTHON, 'scripts/build_chunks.py'],
+        'inputs': [f'{DATA}/errors.json', 'scripts/build_chunks.py'] + SHARED,
+        'outputs': [f'{DATA}/chunks/*.json'],
+    },
+    'search': {
+        'command': [PYTHON, 'scripts/search_index.py', 'build'],
+        'inputs': [f'{DATA}/errors.json', 'frontend/src/utils/synonyms.ts', 'scripts/search_index.py'] + SHARED,
+        'outputs': [f'{DATA}/search/*.json'],
+    },
+    'columnar': {
+        'command': [PYTHON, 'scripts/export_columnar.py'],
+        'inputs': [f'{DATA}/errors.json', 'scripts/export_columnar.py'] + SHARED,
+        'outputs': [f'{DATA}/columnar/*.json'],
+    },
+    'messages': {
+        'command': [PYTHON, 'scripts/build_message_shards.py'],
+        'inputs': [f'{DATA}/message_definitions.json', 'scripts/build_message_shards.py'] + SHARED,
+        'outputs': [f'{DATA}/messages/*.json'],
+    },
+    'layouts': {
+        'command': [PYTHON, 'scripts/build_flow_layouts.py'],
+        'inputs': [f'{DATA}/real_world_examples.json', 'scripts/build_flow_layouts.py'] + SHARED,
+        'outputs': [f'{DATA}/layouts/*.json'],
+    },
+    'examples': {
+        'command': [PYTHON, 'scripts/build_example_windows.py'],
+        'inputs': [f'{DATA}/real_world_examples.json', 'scripts/build_example_windows.py'] + SHARED,
+        'outputs': [f'{DATA}/examples/*.json'],
+    },
+    'quiz': {
+        'command': [PYTHON, 'scripts/build_quiz_banks.py'],
+        'inputs': [
+            f'{DATA}/message_definitions.json', f'{DATA}/real_world_examples.json', 'scripts/build_quiz_banks.py',
+        ] + SHARED,
+        'outputs': [f'{DATA}/quiz/*.json'],
+    },
+    'graph': {
+        'command': [PYTHON, 'scripts/build_reference_graph.py'],
+        'inputs': [
+            f'{DATA}/errors.json', f'{DATA}/message_definitions.json', f'{DATA}/real_world_examples.json',
+            f'{DATA}/glossary_terms.json', 'scripts/build_reference_graph.py',
+        ] + SHARED,
+        'outputs': ['build/graph/*.json'],
+    },
+    'annotate': {
+        'command': [PYTHON, 'scripts/annotate_glossary.py'],
+        'inputs': [f'{DATA}/errors.json', f'{DATA}/glossary_terms.json', 'scripts/annotate_glossary.py'] + SHARED,
+        'outputs': [f'{DATA}/annotations/*.json'],
+    },
+    'validate': {
+        'command': [PYTHON, 'scripts/validate_data.py', '--cache', '.cache/validate.json'],
+        'inputs': [
+            f'{DATA}/errors.json', f'{DATA}/message_definitions.json', f'{DATA}/real_world_examples.json',
+            f'{DATA}/glossary_terms.json', f'{DATA}/chunks/*.json', 'scripts/validate_data.py',
+        ] + SHARED,
+        'outputs': [],
+    },
+    'sitemap': {
+        'command': ['node', 'frontend/scripts/generate-sitemap.js'],
+        'inputs': [f'{DATA}/errors.json', 'frontend/scripts/generate-sitemap.js'],
+        'outputs': ['frontend/public/sitemap.xml'],
+    },
+    'prerender': {
+        'command': [PYTHON, 'scripts/prerender_errors.py'],
+        'inputs': [
+            f'{DATA}/errors.json', 'frontend/dist/iso20022/index.html', 'scripts/prerender_errors.py',
+        ] + SHARED,
+        'outputs': ['frontend/dist/iso20022/error/*.html'],
+        'requires': 'frontend/dist/iso20022/index.html',
+    },
+    'compress': {
+        'command': ['node', 'frontend/scripts/compress-data.js'],
+        'inputs': [
+            'frontend/dist/iso20022/data/**/*.json', 'frontend/dist/iso20022/data/**/*.txt',
+            'frontend/dist/iso20022/data/**/*.xml', 'frontend/scripts/compress-data.js',
+        ],
+        'outputs': ['frontend/dist/_headers'],
+        'requires': 'frontend/dist/iso20022/data',
+    },
+}
+
+
+def expand(patterns):
+    """Sorted repo-relative files matching any of the patterns."""
+    files = set()
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(REPO_ROOT, pattern), recursive=True):
+            if os.path.isfile(path):
+                files.add(os.path.relpath(path, REPO_ROOT))
+    return sorted(files)
+
+
+def covers(pattern, other):
+    """True if a file matched by one pattern could be matched by the other."""
+    return pattern == other or fnmatch.fnmatch(other, pattern) or fnmatch.fnmatch(pattern, other)
+
+
+def dependencies(stages):
+    """stage -> set of stages whose outputs it reads."""
+    deps = {name: set() for name in stages}
+    for name, stage in stages.items():
+        for other, producer in stages.items():
+            if other != name and any(covers(o, i) for o in producer['outputs'] for i in stage['inputs']):
+                deps[name].add(other)
+    return deps
+
+
+def topological_order(deps):
+    order, seen, visiting = [], set(), set()
+
+    def visit(name):
+        if name in seen:
+            return
+        if name in visiting:
+            raise ValueError(f'dependency cycle through {name}')
+        visiting.add(name)
+        for dep in sorted(deps[name]):
+            visit(dep)
+        visiting.discard(name)
+        seen.add(name)
+        order.append(name)
+
+    for name in deps:
+        visit(name)
+    return order
+
+
+def input_hash(name, stage):
+    """Hash of the stage definition and the path and content of every input."""
+    digest = hashlib.sha256(json.dumps(stage['command'][1:]).encode('utf-8'))
+    for path in expand(stage['inputs']):
+        digest.update(path.encode('utf-8') + b'\0')
+        with open(os.path.join(REPO_ROOT, path), 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def run_stage(name, stage, log_dir):
+    """Run one stage's command; returns (exit code, wall s, cpu s, peak RSS KB, log path)."""
+    log_path = os.path.join(log_dir, f'{name}.log')
+    start = time.perf_counter()
+    with open(log_path, 'wb') as log:
+        try:
+            proc = subprocess.Popen(
+                stage['command'], cwd=REPO_ROOT, stdout=log, stderr=subprocess.STDOUT,
+                env={**os.environ, 'DATA_TRACE_DIR': TRACE_DIR},
+            )
+        except OSError as exc:
+            log.write(f'{exc}\n'.encode('utf-8'))
+            return 127, 0.0, 0.0, 0, log_path
+        # wait4 rather than proc.wait() for the child's resource usage.
+        _, status, usage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+    wall = time.perf_counter() - start
+    return proc.returncode, wall, usage.ru_utime + usage.ru_stime, usage.ru_maxrss, log_path
+
+
+def select(targets, deps):
+    """The target stages plus everything upstream of them."""
+    selected, stack = set(), list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in selected:
+            selected.add(name)
+            stack.extend(deps[name])
+    return selected
+
+
+def critical_path(results, deps):
+    """Longest chain of stages by wall time among those that ran."""
+    finish, via = {}, {}
+    for name in topological_order(deps):
+        if name not in results:
+            continue
+        upstream = [(finish[d], d) for d in deps[name] if d in finish]
+        best = max(upstream) if upstream else (0.0, None)
+        finish[name] = best[0] + results[name]['seconds']
+        via[name] = best[1]
+    if not finish:
+        return [], 0.0
+    end = max(finish, key=finish.get)
+    path, node = [], end
+    while node:
+        path.append(node)
+        node = via[node]
+    return path[::-1], finish[end]
+
+
+def build(targets=None, force=False, jobs=None, dry_run=False):
+    deps = dependencies(STAGES)
+    wanted = select(targets or list(STAGES), deps)
+    order = [name for name in topological_order(deps) if name in wanted]
+    state = {}
+    if os.path.exists(STATE_FILE) and not force:
+        with open(STATE_FILE, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    log_dir = os.path.join(REPO_ROOT, '.cache', 'build-logs')
+    os.makedirs(log_dir, exist_ok=True)
+
+    results = {}
+    pending = list(order)
+    running = {}
+    start = time.perf_counter()
+
+    def settle(name, status, **extra):
+        results[name] = {'status': status, 'seconds': 0.0, 'cpu_seconds': 0.0, 'peak_rss_mb': 0.0, **extra}
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        while pending or running:
+            for name in list(pending):
+                if any(dep in pending or dep in running.values() for dep in deps[name] & wanted):
+                    continue
+                pending.remove(name)
+                stage = STAGES[name]
+                failed = [dep for dep in deps[name] & wanted if results[dep]['status'] in ('failed', 'blocked')]
+                if failed:
+                    settle(name, 'blocked', reason=f"{', '.join(sorted(failed))} failed")
+                    continue
+                if dry_run and any(results[dep]['status'] == 'would-run' for dep in deps[name] & wanted):
+                    settle(name, 'would-run', reason='upstream changes')
+                    continue
+                if stage.get('requires') and not os.path.exists(os.path.join(REPO_ROOT, stage['requires'])):
+                    settle(name, 'skipped', reason=f"{stage['requires']} does not exist")
+                    continue
+                if stage.get('optional') and not expand(stage['inputs'][:1]):
+                    settle(name, 'skipped', reason='nothing to do')
+                    continue
+                digest = input_hash(name, stage)
+                outputs_present = all(expand([pattern]) for pattern in stage['outputs'])
+                if state.get(name) == digest and outputs_present:
+                    settle(name, 'fresh')
+                    continue
+                if dry_run:
+                    settle(name, 'would-run')
+                    continue
+                running[pool.submit(run_stage, name, stage, log_dir)] = name
+                results[name] = {'digest': digest}
+
+            if not running:
+                continue
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                code, wall, cpu, rss_kb, log_path = future.result()
+                digest = results[name].pop('digest')
+                results[name] = {
+                    'status': 'ran' if code == 0 else 'failed',
+                    'seconds': round(wall, 3),
+                    'cpu_seconds': round(cpu, 3),
+                    'peak_rss_mb': round(rss_kb / 1024, 1),
+                    'log': os.path.relpath(log_path, REPO_ROOT),
+                }
+                if code == 0:
+                    # Hash again: a stage may rewrite its own inputs (merge).
+                    state[name] = input_hash(name, STAGES[name])
+                else:
+                    results[name]['exit_code'] = code
+                    state.pop(name, None)
+                print(f"  {name:<10} {results[name]['status']:<7} {wall:7.2f}s", flush=True)
+
+    if not dry_run:
+        write_bytes_atomic(STATE_FILE, json.dumps(state, indent=2, sort_keys=True).encode('utf-8'))
+    path, path_seconds = critical_path({n: r for n, r in results.items() if r['status'] in ('ran', 'failed')}, deps)
+    return {
+        'wall_seconds': round(time.perf_counter() - start, 3),
+        'stage_seconds': round(sum(r['seconds'] for r in results.values()), 3),
+        'critical_path': path,
+        'critical_path_seconds': round(path_seconds, 3),
+        'stages': {name: results[name] for name in order},
+        'dependencies': {name: sorted(deps[name]) for name in order},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('stages', nargs='*', help=f"Stages to build (default: all of {', '.join(STAGES)})")
+    parser.add_argument('--force', action='store_true', help='Ignore recorded input hashes and rerun everything')
+    parser.add_argument('--jobs', type=int, help='Stages to run at once (default: CPU count)')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would run')
+    parser.add_argument('--list', action='store_true', help='List stages and their dependencies')
+    parser.add_argument('--report', default=REPORT_FILE, help='Write the timing report here')
+    args = parser.parse_args()
+
+    if args.list:
+        deps = dependencies(STAGES)
+        for name in topological_order(deps):
+            after = ', '.join(sorted(deps[name])) or '-'
+            print(f"  {name:<10} after {after:<20} {' '.join(STAGES[name]['command'][1:])}")
+        return 0
+    unknown = [name for name in args.stages if name not in STAGES]
+    if unknown:
+        print(f"Unknown stage(s): {', '.join(unknown)}")
+        return 1
+
+    report = build(args.stages, args.force, args.jobs, args.dry_run)
+    print(f"\n  {'stage':<10} {'status':<9} {'wall':>8} {'cpu':>8} {'peak RSS':>9}")
+    for name, result in report['stages'].items():
+        note = result.get('reason', '')
+        print(
+            f"  {name:<10} {result['status']:<9} {result['seconds']:7.2f}s {result['cpu_seconds']:7.2f}s "
+            f"{result['peak_rss_mb']:7.1f}MB  {note}"
+        )
+    print(
+        f"\nWall {report['wall_seconds']:.2f}s for {report['stage_seconds']:.2f}s of stage time; "
+        f"critical path {' -> '.join(report['critical_path']) or '-'} ({report['critical_path_seconds']:.2f}s)"
+    )
+    failed = [name for name, result in report['stages'].items() if result['status'] == 'failed']
+    for name in failed:
+        print(f"FAILED {name}: see {report['stages'][name]['log']}")
+
+    if not args.dry_run:
+        write_bytes_atomic(args.report, json.dumps(report, indent=2).encode('utf-8'))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
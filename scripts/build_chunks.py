@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Split errors.json into size-balanced, content-hashed chunks plus a manifest.
+
+Chunk boundaries are content-defined: a chunk may only end after a record
+whose id hashes onto a boundary, once the chunk has reached the minimum size
+(or unconditionally at the maximum size). Because boundaries follow record
+ids rather than running offsets, editing one error only changes the chunk
+that holds it, and every other chunk keeps its file name and CDN cache entry.
+
+Usage:
+    python scripts/build_chunks.py [--target-kb 64] [--dry-run]
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+
+from datasets import CHUNKS_DIR, ERRORS_FILE, content_hash, dumps_compact, load_json, write_if_changed
+from instrument import Trace, add_arguments
+
+MANIFEST_NAME = 'index.json'
+CHUNK_FILE_RE = re.compile(r'^errors(_\d+|\.[0-9a-f]+)\.json$')
+
+# On average, one record in BOUNDARY_MODULUS is a valid cut point.
+BOUNDARY_MODULUS = 8
+
+
+def is_boundary(record_id):
+    """Stable, content-independent cut point test for a record id."""
+    digest = hashlib.blake2b(record_id.encode('utf-8'), digest_size=4).digest()
+    return int.from_bytes(digest, 'big') % BOUNDARY_MODULUS == 0
+
+
+def plan_chunks(errors, target_bytes):
+    """Group errors into contiguous chunks of roughly target_bytes each."""
+    min_bytes = target_bytes * 3 // 4
+    max_bytes = target_bytes * 2
+    chunks = []
+    current = []
+    size = 0
+
+    for error in errors:
+        current.append(error)
+        size += len(dumps_compact(error)) + 1
+        if (size >= min_bytes and is_boundary(error['id'])) or size >= max_bytes:
+            chunks.append(current)
+            current = []
+            size = 0
+
+    if current:
+        # Fold a short tail into the previous chunk rather than shipping a runt.
+        if chunks and size < min_bytes and chunk_size(chunks[-1]) + size <= max_bytes:
+            chunks[-1].extend(current)
+        else:
+            chunks.append(current)
+    return chunks
+
+
+def chunk_size(errors):
+    """Approximate serialized size of a list of errors."""
+    return sum(len(dumps_compact(error)) + 1 for error in errors)
+
+
+def render_chunk(errors):
+    """Serialize one chunk and derive its content-addressed file name."""
+    payload = dumps_compact({'count': len(errors), 'errors': errors})
+    digest = content_hash(payload)
+    return f'errors.{digest}.json', digest, payload
+
+
+def build_chunks(errors_file=ERRORS_FILE, out_dir=CHUNKS_DIR, target_bytes=64 * 1024, dry_run=False, trace=None):
+    """Write changed chunks and the manifest; remove chunks no longer referenced."""
+    trace = trace or Trace('build_chunks')
+    with trace.span('load') as span:
+        data = load_json(errors_file)
+        errors = data['errors']
+        span.read(errors_file).count(records=len(errors))
+    with trace.span('plan') as span:
+        planned = plan_chunks(errors, target_bytes)
+        span.count(chunks=len(planned))
+
+    entries = []
+    written = 0
+    with trace.span('write') as span:
+        for chunk in planned:
+            name, digest, payload = render_chunk(chunk)
+            path = os.path.join(out_dir, name)
+            if not os.path.exists(path):
+                if not dry_run:
+                    write_if_changed(path, payload)
+                    span.count(bytes_written=len(payload))
+                written += 1
+            entries.append({
+                'file': name,
+                'hash': digest,
+                'count': len(chunk),
+                'bytes': len(payload),
+                'first_code': chunk[0]['code'],
+                'last_code': chunk[-1]['code'],
+            })
+
+        manifest = {
+            'version': data.get('version'),
+            'updated': data.get('updated'),
+            'total_chunks': len(entries),
+            'total_errors': len(errors),
+            'target_bytes': target_bytes,
+            'chunks': entries,
+        }
+
+        live = {entry['file'] for entry in entries}
+        stale = []
+        if os.path.isdir(out_dir):
+            stale = sorted(
+                name for name in os.listdir(out_dir)
+                if CHUNK_FILE_RE.match(name) and name not in live
+            )
+
+        manifest_changed = True
+        if not dry_run:
+            manifest_changed = write_if_changed(os.path.join(out_dir, MANIFEST_NAME), dumps_compact(manifest))
+            for name in stale:
+                os.remove(os.path.join(out_dir, name))
+        span.count(records=len(errors), files=written)
+
+    return {
+        'chunks': len(entries),
+        'errors': len(errors),
+        'written': written,
+        'unchanged': len(entries) - written,
+        'removed': len(stale),
+        'manifest_changed': manifest_changed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--errors', default=ERRORS_FILE, help='Source errors.json')
+    parser.add_argument('--out', default=CHUNKS_DIR, help='Output chunk directory')
+    parser.add_argument('--target-kb', type=int, default=64, help='Target chunk size in KB')
+    parser.add_argument('--dry-run', action='store_true', help='Report without writing')
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.errors):
+        print(f"File not found: {args.errors}")
+        return 1
+
+    with Trace.from_args('build_chunks', args) as trace:
+        stats = build_chunks(args.errors, args.out, args.target_kb * 1024, args.dry_run, trace)
+    print(
+        f"{stats['errors']} errors in {stats['chunks']} chunks: "
+        f"{stats['written']} written, {stats['unchanged']} unchanged, {stats['removed']} removed"
+        + ('' if stats['manifest_changed'] else ' (manifest unchanged)')
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
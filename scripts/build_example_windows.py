@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Split real_world_examples.json into a listing index, per-example files and step windows.
+
+    data/examples/index.json                  listing: metadata plus, per example, the
+                                              fields the Learn page cards, search and
+                                              filters use (title, category, difficulty,
+                                              scenario, related messages and terms,
+                                              key takeaways, step count, the message
+                                              types its steps use) and its detail file
+    data/examples/<id>.<hash>.json            everything else: characters, possible
+                                              errors, the first window of steps, an
+                                              outline of every step ([actor, target,
+                                              message type] as ids into outline.names)
+                                              and the remaining windows
+    data/examples/<id>.<start>.<hash>.json    steps[start:start + window] as an array
+
+The listing never grows with step counts, so a generated example with
+thousands of steps costs the Learn page one row. Opening an example fetches
+its detail file; the stepper fetches further windows as the user scrolls,
+and the graph, sequence and quiz views fetch all of them. Every file but
+the index is content-hashed, so an edit to one example (or one window of
+it) only renames what changed.
+
+Usage:
+    python scripts/build_example_windows.py [--window 25] [--dry-run]
+"""
+
+import argparse
+import os
+import re
+import sys
+
+from datasets import DATA_DIR, content_hash, dataset_path, dumps_compact, iter_records, read_header, write_if_changed
+from instrument import Trace, add_arguments
+
+EXAMPLES_DIR = os.path.join(DATA_DIR, 'examples')
+INDEX_NAME = 'index.json'
+EXAMPLE_FILE_RE = re.compile(r'^.+\.[0-9a-f]{10}\.json$')
+WINDOW_SIZE = 25
+
+LISTING_FIELDS = (
+    'id', 'title', 'difficulty', 'category', 'scenario', 'related_messages', 'related_terms',
+    'key_takeaways', 'has_branches',
+)
+
+
+def step_message_types(steps):
+    seen = []
+    for step in steps:
+        if step.get('message_type') and step['message_type'] not in seen:
+            seen.append(step['message_type'])
+    return seen
+
+
+def outline(steps):
+    """Actor, target and message type of every step as ids into shared name lists."""
+    names = {}
+    rows = []
+    for step in steps:
+        row = []
+        for key in ('actor', 'target', 'message_type'):
+            value = step.get(key)
+            row.append(None if value is None else names.setdefault(value, len(names)))
+        rows.append(row)
+    return {'names': list(names), 'steps': rows}
+
+
+def split_example(example, window):
+    """Return (listing row, detail document, [(start, steps)] for the later windows)."""
+    steps = example.get('steps', [])
+    listing = {key: example[key] for key in LISTING_FIELDS if key in example}
+    listing['step_count'] = len(steps)
+    listing['message_types'] = step_message_types(steps)
+
+    detail = {key: value for key, value in example.items() if key not in LISTING_FIELDS and key != 'steps'}
+    detail['steps'] = steps[:window]
+    detail['step_count'] = len(steps)
+    detail['outline'] = outline(steps)
+    windows = [(start, steps[start:start + window]) for start in range(window, len(steps), window)]
+    return listing, detail, windows
+
+
+def build_windows(source=None, out_dir=EXAMPLES_DIR, window=WINDOW_SIZE, dry_run=False, trace=None):
+    """Write the index, changed example and window files; remove files no longer referenced."""
+    source = source or dataset_path('examples')
+    trace = trace or Trace('build_example_windows')
+    with trace.span('header') as span:
+        header = read_header(source, 'examples')
+        span.read(source)
+
+    files = {}  # name -> payload
+
+    def add(prefix, document):
+        payload = dumps_compact(document)
+        name = f'{prefix}.{content_hash(payload)}.json'
+        files[name] = payload
+        return name
+
+    rows = []
+    largest = (0, None)
+    with trace.span('split') as span:
+        span.read(source)
+        for example in iter_records(source, 'examples'):
+            listing, detail, windows = split_example(example, window)
+            detail['windows'] = [
+                {'start': start, 'count': len(steps), 'file': add(f"{example['id']}.{start}", steps)}
+                for start, steps in windows
+            ]
+            listing['file'] = add(example['id'], detail)
+            largest = max(largest, (len(files[listing['file']]), example['id']))
+            rows.append(listing)
+            span.count(records=1, steps=listing['step_count'])
+
+        index = {key: value for key, value in header.items() if key != 'examples'}
+        index['window_size'] = window
+        index['examples'] = rows
+        index_payload = dumps_compact(index)
+
+    written = [name for name in files if not os.path.exists(os.path.join(out_dir, name))]
+    stale = []
+    if os.path.isdir(out_dir):
+        stale = sorted(name for name in os.listdir(out_dir) if EXAMPLE_FILE_RE.match(name) and name not in files)
+
+    index_changed = True
+    if not dry_run:
+        with trace.span('write') as span:
+            os.makedirs(out_dir, exist_ok=True)
+            for name in written:
+                write_if_changed(os.path.join(out_dir, name), files[name])
+            index_changed = write_if_changed(os.path.join(out_dir, INDEX_NAME), index_payload)
+            for name in stale:
+                os.remove(os.path.join(out_dir, name))
+            span.count(
+                files=len(written),
+                bytes_written=sum(len(files[name]) for name in written) + (len(index_payload) if index_changed else 0),
+            )
+    return {
+        'examples': len(rows),
+        'files': len(files),
+        'written': len(written),
+        'removed': len(stale),
+        'index_bytes': len(index_payload),
+        'index_changed': index_changed,
+        'largest_detail': largest,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--source', default=dataset_path('examples'), help='Source real_world_examples.json')
+    parser.add_argument('--out', default=EXAMPLES_DIR, help='Output directory')
+    parser.add_argument('--window', type=int, default=WINDOW_SIZE, help='Steps per window')
+    parser.add_argument('--dry-run', action='store_true', help='Report without writing')
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.window < 1:
+        print('--window must be at least 1')
+        return 1
+    with Trace.from_args('build_example_windows', args) as trace:
+        stats = build_windows(args.source, args.out, args.window, args.dry_run, trace)
+    largest_bytes, largest_id = stats['largest_detail']
+    print(
+        f"{stats['examples']} examples -> {stats['files']} files "
+        f"({stats['written']} new, {stats['removed']} removed); "
+        f"index {stats['index_bytes'] / 1024:.1f} KB ({'updated' if stats['index_changed'] else 'unchanged'}), "
+        f"largest detail {largest_bytes / 1024:.1f} KB ({largest_id})"
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Precompute layered flow-graph layouts for every real-world example.
+
+Builds the same graph ReactFlowGraph.tsx draws (actor nodes joined by one
+edge per step, or step/decision nodes for branching examples) and lays it
+out the way its dagre call does: cycle removal, ranking, dummy nodes for
+long edges, barycenter crossing reduction and per-layer coordinate
+placement, with the same node sizes and spacing, for both TB and LR.
+
+Output is one content-hashed file per example plus a manifest:
+
+    data/layouts/index.json              {"examples": {id: {file, nodes}}}
+    data/layouts/<id>.<hash>.json        {"ids": [...],
+                                          "TB": {"size": [w, h], "xy": [x0, y0, x1, y1, ...]},
+                                          "LR": {...}}
+
+Coordinates are node top-left corners, as React Flow expects. The client
+falls back to running dagre itself when a layout is missing or stale.
+
+Usage:
+    python scripts/build_flow_layouts.py [--dry-run] [--example global_treasury_full_day]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+from datasets import DATA_DIR, content_hash, dataset_path, dumps_compact, iter_records, write_if_changed
+
+LAYOUTS_DIR = os.path.join(DATA_DIR, 'layouts')
+MANIFEST_NAME = 'index.json'
+LAYOUT_FILE_RE = re.compile(r'^.+\.[0-9a-f]{10}\.json$')
+
+# Must match getLayoutedElements in ReactFlowGraph.tsx.
+NODE_SIZES = {'entity': (120, 90), 'stepNode': (160, 70), 'decision': (120, 120)}
+NODESEP = 80
+RANKSEP = 100
+MARGIN = 50
+EDGESEP = 20  # dagre default, used between dummy (edge) nodes
+
+ORDER_SWEEPS = 24
+ORDER_PATIENCE = 4
+PLACEMENT_PASSES = 8
+
+
+def flow_graph(steps):
+    """Nodes [(id, type)] and edges [(source, target)] as ReactFlowGraph builds them."""
+    nodes = []
+    edges = []
+    has_branches = any(step.get('decision_point') or step.get('branch_type') for step in steps)
+
+    if has_branches:
+        for index, step in enumerate(steps):
+            node_id = f"step-{step['step']}"
+            nodes.append((node_id, 'decision' if step.get('decision_point') else 'stepNode'))
+            if step.get('decision_point') and step.get('branches'):
+                for branch in ('success', 'failure'):
+                    edges.append((node_id, f"step-{step['branches'][branch]['next_step']}"))
+            elif index < len(steps) - 1:
+                next_step = steps[index + 1]
+                same_branch = not step.get('branch_type') or step.get('branch_type') == next_step.get('branch_type')
+                end_of_branch = 'End' in (step.get('branch_label') or '')
+                if same_branch and not end_of_branch and not next_step.get('decision_point'):
+                    edges.append((node_id, f"step-{next_step['step']}"))
+    else:
+        actors = []
+        for step in steps:
+            for name in (step['actor'], step.get('target')):
+                if name and name not in actors:
+                    actors.append(name)
+        nodes = [(actor, 'entity') for actor in actors]
+        for step in steps:
+            target = step.get('target') or actors[(actors.index(step['actor']) + 1) % len(actors)]
+            edges.append((step['actor'], target))
+    return nodes, edges
+
+
+class Layout:
+    """Layered (Sugiyama-style) layout of a directed graph, top to bottom."""
+
+    def __init__(self, nodes, edges, sizes):
+        self.nodes = list(nodes)
+        self.sizes = dict(sizes)
+        self.dummy = set()
+        known = set(self.nodes)
+        # dagre's Graph is not a multigraph: repeated edges collapse into one.
+        self.edges = []
+        seen = set()
+        for source, target in edges:
+            if source != target and source in known and target in known and (source, target) not in seen:
+                seen.add((source, target))
+                self.edges.append((source, target))
+
+    def run(self):
+        self.remove_cycles()
+        self.assign_ranks()
+        self.add_dummies()
+        self.order_layers()
+        return self.place()
+
+    def remove_cycles(self):
+        """Reverse DFS back edges, visiting nodes and out-edges in insertion order."""
+        out = {node: [] for node in self.nodes}
+        for source, target in self.edges:
+            out[source].append(target)
+        state = {}
+        back = set()
+        for root in self.nodes:
+            if root in state:
+                continue
+            stack = [(root, iter(out[root]))]
+            state[root] = 'open'
+            while stack:
+                node, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    state[node] = 'done'
+                    stack.pop()
+                elif state.get(child) == 'open':
+                    back.add((node, child))
+                elif child not in state:
+                    state[child] = 'open'
+                    stack.append((child, iter(out[child])))
+        self.edges = [(t, s) if (s, t) in back else (s, t) for s, t in self.edges]
+        self.edges = list(dict.fromkeys(self.edges))
+
+    def assign_ranks(self):
+        """Longest-path ranks, then tightened towards minimal total edge length."""
+        preds = {node: [] for node in self.nodes}
+        succs = {node: [] for node in self.nodes}
+        for source, target in self.edges:
+            succs[source].append(target)
+            preds[target].append(source)
+
+        rank = {}
+
+        def longest(node):
+            # Iterative post-order: sinks get 0, others min(successor) - 1.
+            stack = [node]
+            while stack:
+                current = stack[-1]
+                pending = [s for s in succs[current] if s not in rank]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                stack.pop()
+                if current not in rank:
+                    rank[current] = min((rank[s] - 1 for s in succs[current]), default=0)
+
+        for node in self.nodes:
+            longest(node)
+
+        # Coordinate descent on sum(|rank(u) - rank(v)|): move each node to the
+        # median of its neighbours' ranks within its feasible interval.
+        for _ in range(len(self.nodes)):
+            moved = False
+            for node in self.nodes:
+                low = max((rank[p] + 1 for p in preds[node]), default=None)
+                high = min((rank[s] - 1 for s in succs[node]), default=None)
+                neighbours = sorted([rank[p] + 1 for p in preds[node]] + [rank[s] - 1 for s in succs[node]])
+                if not neighbours:
+                    continue
+                target = neighbours[(len(neighbours) - 1) // 2]
+                if low is not None:
+                    target = max(target, low)
+                if high is not None:
+                    target = min(target, high)
+                if target != rank[node]:
+                    rank[node] = target
+                    moved = True
+            if not moved:
+                break
+
+        # Align every connected component (and isolated node) to the top rank.
+        component = {}
+        for root in self.nodes:
+            if root in component:
+                continue
+            stack = [root]
+            component[root] = root
+            while stack:
+                node = stack.pop()
+                for other in preds[node] + succs[node]:
+                    if other not in component:
+                        component[other] = root
+                        stack.append(other)
+        lowest = {}
+        for node, value in rank.items():
+            lowest[component[node]] = min(lowest.get(component[node], value), value)
+        self.rank = {node: value - lowest[component[node]] for node, value in rank.items()}
+
+    def add_dummies(self):
+        """Split edges spanning several ranks into unit-length chains."""
+        edges = []
+        for source, target in self.edges:
+            previous = source
+            for rank in range(self.rank[source] + 1, self.rank[target]):
+                dummy = f'_d{len(self.dummy)}'
+                self.dummy.add(dummy)
+                self.rank[dummy] = rank
+                self.sizes[dummy] = (0, 0)
+                edges.append((previous, dummy))
+                previous = dummy
+            edges.append((previous, target))
+        self.edges = edges
+        self.preds = {node: [] for node in self.rank}
+        self.succs = {node: [] for node in self.rank}
+        for source, target in edges:
+            self.succs[source].append(target)
+            self.preds[target].append(source)
+
+    def initial_order(self):
+        """DFS from nodes in rank order, as dagre's initOrder does."""
+        layers = [[] for _ in range(max(self.rank.values(), default=-1) + 1)]
+        visited = set()
+        starts = sorted(self.rank, key=lambda node: self.rank[node])
+        for start in starts:
+            stack = [start]
+            while stack:
+                node = stack.pop()
+                if node in visited:
+                    continue
+                visited.add(node)
+                layers[self.rank[node]].append(node)
+                stack.extend(reversed(self.succs[node]))
+        return layers
+
+    def crossings(self, layers):
+        total = 0
+        for upper, lower in zip(layers, layers[1:]):
+            position = {node: i for i, node in enumerate(lower)}
+            ends = sorted(
+                (i, position[target])
+                for i, node in enumerate(upper)
+                for target in self.succs[node]
+            )
+            # Count inversions of the lower endpoints.
+            seen = []
+            for _, end in ends:
+                total += sum(1 for other in seen if other > end)
+                seen.append(end)
+        return total
+
+    def order_layers(self):
+        layers = self.initial_order()
+        best = [list(layer) for layer in layers]
+        best_crossings = self.crossings(layers)
+        stale = 0
+        for sweep in range(ORDER_SWEEPS):
+            downward = sweep % 2 == 0
+            indices = range(1, len(layers)) if downward else range(len(layers) - 2, -1, -1)
+            for i in indices:
+                fixed = layers[i - 1] if downward else layers[i + 1]
+                position = {node: p for p, node in enumerate(fixed)}
+                neighbours = self.preds if downward else self.succs
+
+                def barycenter(item):
+                    p, node = item
+                    linked = [position[n] for n in neighbours[node] if n in position]
+                    return (sum(linked) / len(linked) if linked else p, p)
+
+                layers[i] = [node for _, node in sorted(enumerate(layers[i]), key=barycenter)]
+            count = self.crossings(layers)
+            if count < best_crossings:
+                best = [list(layer) for layer in layers]
+                best_crossings = count
+                stale = 0
+            else:
+                stale += 1
+                if stale >= ORDER_PATIENCE:
+                    break
+        self.layers = best
+
+    def separation(self, left, right):
+        gap_left = EDGESEP if left in self.dummy else NODESEP
+        gap_right = EDGESEP if right in self.dummy else NODESEP
+        return self.sizes[left][0] / 2 + (gap_left + gap_right) / 2 + self.sizes[right][0] / 2
+
+    def place_layer(self, layer, desired, weights):
+        """Closest positions to `desired` keeping order and minimum separation.
+
+        With offsets c_i (cumulative separations) this is isotonic regression
+        on desired_i - c_i, solved exactly by pool-adjacent-violators.
+        """
+        offsets = [0.0]
+        for left, right in zip(layer, layer[1:]):
+            offsets.append(offsets[-1] + self.separation(left, right))
+        blocks = []  # [weighted mean, total weight, count]
+        for i, node in enumerate(layer):
+            blocks.append([desired[i] - offsets[i], weights[i], 1])
+            while len(blocks) > 1 and blocks[-2][0] > blocks[-1][0]:
+                mean, weight, count = blocks.pop()
+                previous = blocks[-1]
+                total = previous[1] + weight
+                previous[0] = (previous[0] * previous[1] + mean * weight) / total
+                previous[1] = total
+                previous[2] += count
+        x = {}
+        i = 0
+        for mean, _, count in blocks:
+            for _ in range(count):
+                x[layer[i]] = mean + offsets[i]
+                i += 1
+        return x
+
+    def place(self):
+        x = {}
+        for layer in self.layers:
+            x.update(self.place_layer(layer, [0.0] * len(layer), [1.0] * len(layer)))
+
+        for sweep in range(PLACEMENT_PASSES):
+            downward = sweep % 2 == 0
+            order = self.layers[1:] if downward else self.layers[-2::-1]
+            neighbours = self.preds if downward else self.succs
+            for layer in order:
+                desired = []
+                weights = []
+                for node in layer:
+                    linked = [x[n] for n in neighbours[node]]
+                    desired.append(sum(linked) / len(linked) if linked else x[node])
+                    # Keep long edges straight: dummies pull harder.
+                    weights.append(8.0 if node in self.dummy else 1.0 + len(linked))
+                x.update(self.place_layer(layer, desired, weights))
+
+        y = {}
+        top = 0.0
+        for layer in self.layers:
+            height = max((self.sizes[node][1] for node in layer), default=0)
+            for node in layer:
+                y[node] = top + height / 2
+            top += height + RANKSEP
+
+        real = [node for node in self.rank if node not in self.dummy]
+        if not real:
+            return {}, (0, 0)
+        min_x = min(x[n] - self.sizes[n][0] / 2 for n in real)
+        min_y = min(y[n] - self.sizes[n][1] / 2 for n in real)
+        centres = {n: (x[n] - min_x + MARGIN, y[n] - min_y + MARGIN) for n in real}
+        width = max(cx + self.sizes[n][0] / 2 for n, (cx, _) in centres.items()) + MARGIN
+        height = max(cy + self.sizes[n][1] / 2 for n, (_, cy) in centres.items()) + MARGIN
+        return centres, (width, height)
+
+
+def layout_flow(steps, direction):
+    """Top-left node positions and graph size for one rank direction."""
+    nodes, edges = flow_graph(steps)
+    sizes = {node_id: NODE_SIZES[kind] for node_id, kind in nodes}
+    # Like dagre, lay LR out as TB with width and height swapped, then transpose.
+    layout_sizes = sizes if direction == 'TB' else {n: (h, w) for n, (w, h) in sizes.items()}
+    centres, (width, height) = Layout([n for n, _ in nodes], edges, layout_sizes).run()
+    if direction == 'LR':
+        centres = {n: (cy, cx) for n, (cx, cy) in centres.items()}
+        width, height = height, width
+    ids = [node_id for node_id, _ in nodes]
+    xy = []
+    for node_id in ids:
+        cx, cy = centres[node_id]
+        w, h = sizes[node_id]
+        xy.extend([round(cx - w / 2), round(cy - h / 2)])
+    return ids, {'size': [round(width), round(height)], 'xy': xy}
+
+
+def build_layouts(source=None, out_dir=LAYOUTS_DIR, only=None, dry_run=False):
+    """Write changed layout files and the manifest; remove unreferenced ones."""
+    entries = {}
+    written = 0
+    slowest = (0.0, None)
+    for example in iter_records(source or dataset_path('examples'), 'examples'):
+        if only and example['id'] != only:
+            continue
+        start = time.perf_counter()
+        document = {}
+        for direction in ('TB', 'LR'):
+            ids, document[direction] = layout_flow(example['steps'], direction)
+        document = {'ids': ids, **document}
+        slowest = max(slowest, (time.perf_counter() - start, example['id']))
+
+        payload = dumps_compact(document)
+        digest = content_hash(payload)
+        name = f"{example['id']}.{digest}.json"
+        if not os.path.exists(os.path.join(out_dir, name)):
+            if not dry_run:
+                write_if_changed(os.path.join(out_dir, name), payload)
+            written += 1
+        entries[example['id']] = {'file': name, 'nodes': len(ids), 'bytes': len(payload)}
+
+    stale = []
+    if not only and os.path.isdir(out_dir):
+        live = {entry['file'] for entry in entries.values()}
+        stale = sorted(name for name in os.listdir(out_dir) if LAYOUT_FILE_RE.match(name) and name not in live)
+    if not dry_run and not only:
+        write_if_changed(os.path.join(out_dir, MANIFEST_NAME), dumps_compact({'version': 1, 'examples': entries}))
+        for name in stale:
+            os.remove(os.path.join(out_dir, name))
+    return {'examples': len(entries), 'written': written, 'removed': len(stale), 'slowest': slowest}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--source', default=dataset_path('examples'), help='Source real_world_examples.json')
+    parser.add_argument('--out', default=LAYOUTS_DIR, help='Output directory')
+    parser.add_argument('--example', help='Only lay out this example id (manifest is left untouched)')
+    parser.add_argument('--dry-run', action='store_true', help='Report without writing')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.source):
+        print(f"File not found: {args.source}")
+        return 1
+
+    stats = build_layouts(args.source, args.out, args.example, args.dry_run)
+    seconds, example_id = stats['slowest']
+    print(
+        f"{stats['examples']} example layouts: {stats['written']} written, {stats['removed']} removed"
+        + (f" (slowest {example_id}: {seconds * 1000:.0f} ms)" if example_id else '')
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Split message_definitions.json into a light catalogue plus detail shards.
+
+    data/messages/index.json            catalogue: summary fields for every
+                                        message, the shared sections
+                                        (business areas, flows, systems,
+                                        MT mappings) and the shard map
+    data/messages/<area>.<hash>.json    heavy fields (sample_xml,
+                                        key_elements, ...) for one business
+                                        area, keyed by message id
+
+The messages page renders from the catalogue and fetches a shard only when
+a message from that business area is opened. Shards are content-hashed, so
+an edit to one area only changes that area's file name.
+
+Usage:
+    python scripts/build_message_shards.py [--dry-run]
+"""
+
+import argparse
+import os
+import re
+import sys
+
+from datasets import DATA_DIR, content_hash, dataset_path, dumps_compact, load_json, write_if_changed
+
+MESSAGES_DIR = os.path.join(DATA_DIR, 'messages')
+CATALOGUE_NAME = 'index.json'
+SHARD_FILE_RE = re.compile(r'^[a-z]+\.[0-9a-f]+\.json$')
+
+# Everything the cards, search and filters need; the rest goes to shards.
+SUMMARY_FIELDS = (
+    'id', 'full_id', 'name', 'business_area', 'business_area_name',
+    'purpose', 'usage', 'mt_equivalent',
+)
+
+
+def split_message(message):
+    summary = {key: message[key] for key in SUMMARY_FIELDS if key in message}
+    detail = {key: value for key, value in message.items() if key not in SUMMARY_FIELDS}
+    return summary, detail
+
+
+def build_shards(source=None, out_dir=MESSAGES_DIR, dry_run=False):
+    """Write the catalogue and changed shards; remove shards no longer referenced."""
+    data = load_json(source or dataset_path('messages'))
+
+    summaries = []
+    details = {}
+    for message in data['messages']:
+        summary, detail = split_message(message)
+        summaries.append(summary)
+        details.setdefault(message['business_area'], {})[message['id']] = detail
+
+    shards = {}
+    written = 0
+    for area in sorted(details):
+        payload = dumps_compact({'area': area, 'messages': details[area]})
+        digest = content_hash(payload)
+        name = f'{area}.{digest}.json'
+        path = os.path.join(out_dir, name)
+        if not os.path.exists(path):
+            if not dry_run:
+                write_if_changed(path, payload)
+            written += 1
+        shards[area] = {'file': name, 'hash': digest, 'count': len(details[area]), 'bytes': len(payload)}
+
+    catalogue = {key: value for key, value in data.items() if key != 'messages'}
+    catalogue['messages'] = summaries
+    catalogue['shards'] = shards
+    catalogue_payload = dumps_compact(catalogue)
+
+    live = {shard['file'] for shard in shards.values()}
+    stale = []
+    if os.path.isdir(out_dir):
+        stale = sorted(name for name in os.listdir(out_dir) if SHARD_FILE_RE.match(name) and name not in live)
+
+    catalogue_changed = True
+    if not dry_run:
+        catalogue_changed = write_if_changed(os.path.join(out_dir, CATALOGUE_NAME), catalogue_payload)
+        for name in stale:
+            os.remove(os.path.join(out_dir, name))
+    return {
+        'messages': len(summaries),
+        'shards': len(shards),
+        'written': written,
+        'removed': len(stale),
+        'catalogue_bytes': len(catalogue_payload),
+        'catalogue_changed': catalogue_changed,
+        'largest_shard': max((shard['bytes'], area) for area, shard in shards.items()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--source', default=dataset_path('messages'), help='Source message_definitions.json')
+    parser.add_argument('--out', default=MESSAGES_DIR, help='Output directory')
+    parser.add_argument('--dry-run', action='store_true', help='Report without writing')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.source):
+        print(f"File not found: {args.source}")
+        return 1
+
+    stats = build_shards(args.source, args.out, args.dry_run)
+    largest_bytes, largest_area = stats['largest_shard']
+    print(
+        f"{stats['messages']} messages: catalogue {stats['catalogue_bytes'] / 1024:.1f} KB"
+        + ('' if stats['catalogue_changed'] else ' (unchanged)')
+        + f", {stats['shards']} shards ({stats['written']} written, {stats['removed']} removed,"
+        f" largest {largest_area} {largest_bytes / 1024:.1f} KB)"
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
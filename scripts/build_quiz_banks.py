@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Precompute seeded, deduplicated quiz question banks from the datasets.
+
+    data/quiz/index.json                           manifest: banks per business area
+                                                   and difficulty, flow quiz per example
+    data/quiz/<area>.<difficulty>.<hash>.json      message questions for one area
+    data/quiz/flow.<example id>.<hash>.json        "what message comes next?" for
+                                                   every step of one example
+
+Message questions, by difficulty:
+    easy    what is <id>?  /  which id is <name>?    distractors from other areas
+    medium  which message is used to <purpose>?      distractors from the same area,
+            ... when <when used>?                    options show message names
+    hard    which message fits <use case>?           distractors from the same area,
+            which carries <element>?                 ids only
+            which replaces <MT>?
+
+A question is dropped when its prompt has more than one right answer (two
+messages share the purpose, name or use case), when the prompt gives the
+answer away (a use case that quotes the message id), when the same fact
+was already asked, or when fewer than three distractors remain. Flow
+questions skip steps whose message type is not an ISO 20022 id and never
+offer a message the flow already used at or before that step; the example's
+difficulty decides how close the distractors are.
+
+Every question draws its distractors and option order from a Random seeded
+with --seed and the question's own key, so the banks are reproducible and
+adding a message leaves other questions (and other banks' files) unchanged.
+
+Usage:
+    python scripts/build_quiz_banks.py [--seed 20022] [--dry-run]
+"""
+
+import argparse
+import functools
+import os
+import random
+import re
+import sys
+
+from datasets import DATA_DIR, content_hash, dataset_path, dumps_compact, iter_records, load_json, write_if_changed
+from instrument import Trace, add_arguments
+
+QUIZ_DIR = os.path.join(DATA_DIR, 'quiz')
+INDEX_NAME = 'index.json'
+QUIZ_FILE_RE = re.compile(r'^.+\.[0-9a-f]{10}\.json$')
+DEFAULT_SEED = 20022
+DIFFICULTIES = ('easy', 'medium', 'hard')
+DISTRACTORS = 3
+
+MESSAGE_ID_RE = re.compile(r'^[a-z]{4}\.\d{3}$')
+MENTIONS_ID_RE = re.compile(r'\b[a-z]{4}\.\d{3}\b')
+MT_RE = re.compile(r'^MT\d{3}\b')
+
+# Same-area distractors per flow option, by example difficulty.
+FLOW_SAME_AREA = {'beginner': 0, 'intermediate': 1, 'advanced': DISTRACTORS}
+
+
+@functools.lru_cache(maxsize=None)
+def normalize(text):
+    return ' '.join(re.sub(r'[^\w\s]', ' ', text.lower()).split())
+
+
+def area_of(message_id):
+    return message_id.split('.', 1)[0]
+
+
+def mt_codes(message):
+    value = message.get('mt_equivalent') or []
+    values = [value] if isinstance(value, str) else value
+    return [code for code in values if MT_RE.match(code)]
+
+
+def element_names(message):
+    elements = message.get('key_elements') or {}
+    return list(elements.items()) if isinstance(elements, dict) else [(name, None) for name in elements]
+
+
+def message_facts(message, unique_elements):
+    """(difficulty, kind, family, fact, prompt) for every question one message can answer."""
+    m_id, name = message['id'], message['name']
+    facts = [
+        ('easy', 'name', 'name', m_id, f'What is {m_id}?'),
+        ('easy', 'id', 'id', name, f'Which message is {name}?'),
+    ]
+    if message.get('purpose'):
+        facts.append(('medium', 'purpose', 'text', message['purpose'],
+                      f"Which message would you use to: {message['purpose'].rstrip('.?')}?"))
+    if message.get('when_used'):
+        facts.append(('medium', 'when_used', 'text', message['when_used'],
+                      f"Which message is sent in this situation: {message['when_used'].rstrip('.?')}?"))
+    for use_case in message.get('real_world_use_cases') or []:
+        facts.append(('hard', 'use_case', 'text', use_case, f"Which message fits this use case: {use_case.rstrip('.?')}?"))
+    for element, description in element_names(message):
+        if element in unique_elements:
+            detail = f' ({description})' if description else ''
+            facts.append(('hard', 'element', 'element', element, f'Which message carries the <{element}> element{detail}?'))
+    for code in mt_codes(message):
+        facts.append(('hard', 'mt', 'mt', code, f'Which ISO 20022 message replaces {code}?'))
+    return facts
+
+
+def pick_distractors(rng, answer, pool, count, excluded):
+    """Sample distractors with labels distinct from the answer, each other and the excluded labels."""
+    seen = {normalize(answer)} | excluded
+    candidates = []
+    for label in pool:
+        key = normalize(label)
+        if key not in seen:
+            seen.add(key)
+            candidates.append(label)
+    if len(candidates) < count:
+        return None
+    return rng.sample(candidates, count)
+
+
+def build_message_banks(messages, seed):
+    """{(area, difficulty): [question]} plus drop counts."""
+    by_id = {m['id']: m for m in messages}
+    element_counts = {}
+    for message in messages:
+        for element, _ in element_names(message):
+            element_counts[element] = element_counts.get(element, 0) + 1
+    unique_elements = {element for element, count in element_counts.items() if count == 1}
+
+    facts = [(message, *fact) for message in messages for fact in message_facts(message, unique_elements)]
+    # Prompts whose fact points at more than one message are ambiguous.
+    answers = {}
+    for message, _, _, family, fact, _ in facts:
+        answers.setdefault((family, normalize(fact)), set()).add(message['id'])
+    ids_by_area = {}
+    for message in sorted(messages, key=lambda m: m['id']):
+        ids_by_area.setdefault(area_of(message['id']), []).append(message['id'])
+    all_ids = sorted(by_id)
+    all_names = sorted({m['name'] for m in messages})
+
+    banks = {}
+    dropped = {'ambiguous': 0, 'gives_away': 0, 'duplicate': 0, 'few_options': 0}
+    asked = set()
+    for message, difficulty, kind, family, fact, prompt in facts:
+        m_id = message['id']
+        owners = answers[(family, normalize(fact))]
+        if len(owners) > 1 and kind != 'mt':
+            dropped['ambiguous'] += 1
+            continue
+        if kind in ('purpose', 'when_used', 'use_case') and (
+            MENTIONS_ID_RE.search(fact) or normalize(message['name']) in normalize(fact)
+        ):
+            dropped['gives_away'] += 1
+            continue
+        key = (family, normalize(fact), m_id)
+        if key in asked:
+            dropped['duplicate'] += 1
+            continue
+        asked.add(key)
+
+        rng = random.Random(f'{seed}:{kind}:{m_id}:{fact}')
+        area = area_of(m_id)
+        if kind == 'name':
+            answer, pool = message['name'], all_names
+            excluded = set()
+        else:
+            answer = m_id
+            if difficulty == 'easy':
+                pool = [other for other in all_ids if area_of(other) != area]
+            else:
+                # Same-area distractors first; other areas only top up small areas.
+                same = [other for other in ids_by_area[area] if other != m_id]
+                pool = same if len(same) >= DISTRACTORS else same + [o for o in all_ids if area_of(o) != area]
+            # Other right answers (an MT replaced by several messages) cannot be distractors.
+            excluded = {normalize(other) for other in owners if other != m_id}
+        distractors = pick_distractors(rng, answer, pool, DISTRACTORS, excluded)
+        if distractors is None:
+            dropped['few_options'] += 1
+            continue
+        options = [answer] + distractors
+        rng.shuffle(options)
+        question = {
+            'id': content_hash(f'{kind}|{m_id}|{fact}'.encode('utf-8'), 8),
+            'kind': kind,
+            'prompt': prompt,
+            'options': options,
+            'answer': options.index(answer),
+            'explanation': f"{m_id} {message['name']}: {message.get('purpose', '')}".rstrip(': '),
+        }
+        if difficulty == 'medium':
+            question['details'] = [by_id[option]['name'] for option in options]
+        banks.setdefault((area, difficulty), []).append(question)
+    return banks, dropped
+
+
+def flow_hint(steps, index):
+    # Same wording the quiz used when it built questions in the browser.
+    step = steps[index]
+    if index == 0:
+        return f"This is the first message in the flow, initiated by {step.get('actor')}."
+    previous = (steps[index - 1].get('action') or '').lower() or 'the previous step'
+    return f"This message is sent from {step.get('actor')} to {step.get('target') or 'the next party'} after {previous}."
+
+
+def build_flow_quiz(example, names, seed):
+    """Questions for every step of one example whose message type is an ISO 20022 id."""
+    steps = example.get('steps', [])
+    same_area = FLOW_SAME_AREA.get(example.get('difficulty'), 1)
+    pool = sorted(names)
+    used = set()
+    questions = []
+    for index, step in enumerate(steps):
+        answer = step.get('message_type') or ''
+        used.add(answer)
+        if not MESSAGE_ID_RE.match(answer):
+            continue
+        rng = random.Random(f"{seed}:flow:{example['id']}:{index}")
+        area = area_of(answer)
+        near = [m for m in pool if area_of(m) == area and m not in used]
+        far = [m for m in pool if area_of(m) != area and m not in used]
+        take_near = min(same_area, len(near))
+        if take_near + len(far) < DISTRACTORS:
+            take_near = min(DISTRACTORS, len(near))
+        distractors = rng.sample(near, take_near) + rng.sample(far, min(DISTRACTORS - take_near, len(far)))
+        options = [answer] + distractors
+        rng.shuffle(options)
+        questions.append({'step': index, 'options': options, 'answer': options.index(answer), 'hint': flow_hint(steps, index)})
+    used_names = {option: names[option] for q in questions for option in q['options'] if option in names}
+    return {'example': example['id'], 'names': dict(sorted(used_names.items())), 'questions': questions}
+
+
+def build_banks(out_dir=QUIZ_DIR, seed=DEFAULT_SEED, dry_run=False, trace=None):
+    """Write changed bank files and the manifest; remove files no longer referenced."""
+    trace = trace or Trace('build_quiz_banks')
+    with trace.span('load') as span:
+        definitions = load_json(dataset_path('messages'))
+        messages = definitions['messages']
+        area_names = {area['code']: area['name'] for area in definitions.get('business_areas', [])}
+        names = {m['id']: m['name'] for m in messages}
+        span.read(dataset_path('messages')).count(records=len(messages))
+
+    files = {}  # name -> payload
+
+    def add(prefix, document):
+        payload = dumps_compact(document)
+        name = f'{prefix}.{content_hash(payload)}.json'
+        files[name] = payload
+        return name
+
+    with trace.span('messages') as span:
+        banks, dropped = build_message_banks(messages, seed)
+        areas = {}
+        for (area, difficulty), questions in sorted(banks.items()):
+            entry = areas.setdefault(area, {'name': area_names.get(area, area), 'banks': {}})
+            document = {'area': area, 'difficulty': difficulty, 'questions': questions}
+            entry['banks'][difficulty] = {'file': add(f'{area}.{difficulty}', document), 'count': len(questions)}
+        span.count(records=sum(len(questions) for questions in banks.values()), **dropped)
+
+    flows = {}
+    with trace.span('flows') as span:
+        span.read(dataset_path('examples'))
+        for example in iter_records(dataset_path('examples'), 'examples'):
+            quiz = build_flow_quiz(example, names, seed)
+            if quiz['questions']:
+                flows[example['id']] = {'file': add(f"flow.{example['id']}", quiz), 'count': len(quiz['questions'])}
+            span.count(records=len(quiz['questions']))
+
+    index = {
+        'version': 1,
+        'seed': seed,
+        'difficulties': list(DIFFICULTIES),
+        'areas': areas,
+        'flows': flows,
+    }
+    index_payload = dumps_compact(index)
+
+    written = [name for name in files if not os.path.exists(os.path.join(out_dir, name))]
+    stale = []
+    if os.path.isdir(out_dir):
+        stale = sorted(name for name in os.listdir(out_dir) if QUIZ_FILE_RE.match(name) and name not in files)
+
+    index_path = os.path.join(out_dir, INDEX_NAME)
+    if dry_run:
+        index_changed = True
+        if os.path.exists(index_path):
+            with open(index_path, 'rb') as f:
+                index_changed = f.read() != index_payload
+    else:
+        with trace.span('write') as span:
+            os.makedirs(out_dir, exist_ok=True)
+            for name in written:
+                write_if_changed(os.path.join(out_dir, name), files[name])
+            index_changed = write_if_changed(index_path, index_payload)
+            for name in stale:
+                os.remove(os.path.join(out_dir, name))
+            span.count(files=len(written), bytes_written=sum(len(files[name]) for name in written))
+    return {
+        'message_questions': sum(entry['count'] for area in areas.values() for entry in area['banks'].values()),
+        'banks': sum(len(area['banks']) for area in areas.values()),
+        'flow_questions': sum(entry['count'] for entry in flows.values()),
+        'flows': len(flows),
+        'dropped': dropped,
+        'largest': max(len(payload) for payload in files.values()) if files else 0,
+        'written': len(written),
+        'removed': len(stale),
+        'index_bytes': len(index_payload),
+        'index_changed': index_changed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--out', default=QUIZ_DIR, help='Output directory')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Seed for distractors and option order')
+    parser.add_argument('--dry-run', action='store_true', help='Report without writing')
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    with Trace.from_args('build_quiz_banks', args) as trace:
+        stats = build_banks(args.out, args.seed, args.dry_run, trace)
+    dropped = ', '.join(f'{count} {reason}' for reason, count in stats['dropped'].items())
+    print(
+        f"{stats['message_questions']:,} message questions in {stats['banks']} banks (dropped: {dropped}); "
+        f"{stats['flow_questions']:,} flow questions for {stats['flows']} examples"
+    )
+    print(
+        f"{stats['written']} files written, {stats['removed']} removed; largest {stats['largest'] / 1024:.1f} KB; "
+        f"index {stats['index_bytes'] / 1024:.1f} KB ({'updated' if stats['index_changed'] else 'unchanged'})"
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
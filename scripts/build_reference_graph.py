@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Cross-dataset reference graph with precomputed adjacency.
+
+Resolves every link between the datasets once, in both directions, so
+questions like "errors for pacs.008", "examples that mention AC04" or
+"MX for MT103" are a single lookup:
+
+    errors     related_codes -> error, message_types -> message
+    examples   related_messages -> message, related_terms -> term,
+               possible_errors[].error_code -> error
+    glossary   related_terms -> term, appears_in -> message
+    messages   mt_to_mx_mappings: mt -> message
+
+Nodes are keyed ``<kind>:<id>`` (error:AC04, message:pacs.008, mt:MT103,
+example:<id>, term:<id>); each maps neighbour kinds to sorted id lists.
+References to ids that do not exist are reported as dangling and kept out
+of the graph.
+
+Usage:
+    python scripts/build_reference_graph.py [--report dangling.json]
+    python scripts/build_reference_graph.py query message pacs.008 --kind error
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+from datasets import REPO_ROOT, dataset_path, dumps_compact, load_json, write_if_changed
+
+# A build-time index for the query command and the dangling report; the
+# site does not fetch it, so it is kept out of public/data.
+GRAPH_FILE = os.path.join(REPO_ROOT, 'build', 'graph', 'references.json')
+KINDS = ('error', 'message', 'example', 'term', 'mt')
+
+
+def normalize_term(text):
+    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+
+
+class GraphBuilder:
+    """Collects typed edges and dangling references."""
+
+    def __init__(self, known):
+        self.known = known
+        self.adjacency = {}
+        self.dangling = []
+
+    def node(self, kind, node_id):
+        return self.adjacency.setdefault(f'{kind}:{node_id}', {})
+
+    def link(self, kind, node_id, field, target_kind, target_id):
+        """Add an undirected edge if the target exists, else record it as dangling."""
+        if target_id not in self.known[target_kind]:
+            self.dangling.append({
+                'source': f'{kind}:{node_id}',
+                'field': field,
+                'target': f'{target_kind}:{target_id}',
+            })
+            return
+        forward = self.node(kind, node_id).setdefault(target_kind, set())
+        forward.add(target_id)
+        self.node(target_kind, target_id).setdefault(kind, set()).add(node_id)
+
+    def result(self):
+        nodes = {
+            key: {kind: sorted(ids) for kind, ids in sorted(neighbours.items())}
+            for key, neighbours in sorted(self.adjacency.items())
+        }
+        return nodes, self.dangling
+
+
+def build_graph():
+    """Load all datasets and return (nodes, dangling)."""
+    errors = load_json(dataset_path('errors'))['errors']
+    definitions = load_json(dataset_path('messages'))
+    examples = load_json(dataset_path('examples'))['examples']
+    terms = load_json(dataset_path('glossary'))['terms']
+
+    # Example related_terms use loose spellings ("Correspondent_bank",
+    # "UETR"), so resolve them through normalized ids, names and aliases.
+    term_lookup = {}
+    for term in terms:
+        for name in [term['id'], term.get('display_name', '')] + term.get('aliases', []):
+            if name:
+                term_lookup.setdefault(normalize_term(name), term['id'])
+
+    known = {
+        'error': {error['code'] for error in errors},
+        'message': {message['id'] for message in definitions['messages']},
+        'example': {example['id'] for example in examples},
+        'term': {term['id'] for term in terms},
+        'mt': {mapping['mt'] for mapping in definitions.get('mt_to_mx_mappings', [])},
+    }
+    graph = GraphBuilder(known)
+
+    for error in errors:
+        code = error['code']
+        graph.node('error', code)
+        for related in error.get('related_codes', []):
+            graph.link('error', code, 'related_codes', 'error', related)
+        for message in error.get('message_types', []):
+            graph.link('error', code, 'message_types', 'message', message)
+
+    for example in examples:
+        example_id = example['id']
+        graph.node('example', example_id)
+        for message in example.get('related_messages', []):
+            graph.link('example', example_id, 'related_messages', 'message', message)
+        for term in example.get('related_terms', []):
+            resolved = term_lookup.get(normalize_term(term), term)
+            graph.link('example', example_id, 'related_terms', 'term', resolved)
+        for possible in example.get('possible_errors', []):
+            graph.link('example', example_id, 'possible_errors.error_code', 'error', possible['error_code'])
+
+    for term in terms:
+        graph.node('term', term['id'])
+        for related in term.get('related_terms', []):
+            graph.link('term', term['id'], 'related_terms', 'term', term_lookup.get(normalize_term(related), related))
+        for message in term.get('appears_in', []):
+            graph.link('term', term['id'], 'appears_in', 'message', message)
+
+    for message in definitions['messages']:
+        graph.node('message', message['id'])
+    for mapping in definitions.get('mt_to_mx_mappings', []):
+        graph.link('mt', mapping['mt'], 'mt_to_mx_mappings', 'message', mapping['mx'])
+
+    return graph.result()
+
+
+def write_graph(out_file=GRAPH_FILE):
+    nodes, dangling = build_graph()
+    document = {'version': 1, 'kinds': list(KINDS), 'nodes': nodes}
+    changed = write_if_changed(out_file, dumps_compact(document))
+    return nodes, dangling, changed
+
+
+def neighbours(nodes, kind, node_id, target_kind=None):
+    """One-lookup query against a loaded graph."""
+    links = nodes.get(f'{kind}:{node_id}', {})
+    return links.get(target_kind, []) if target_kind else links
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest='command')
+    query = sub.add_parser('query', help='Look up the neighbours of one node')
+    query.add_argument('node_kind', choices=KINDS)
+    query.add_argument('node_id')
+    query.add_argument('--kind', choices=KINDS, help='Only this neighbour kind')
+    parser.add_argument('--out', default=GRAPH_FILE)
+    parser.add_argument('--report', help='Write dangling references to this JSON file')
+    parser.add_argument('--verbose', action='store_true', help='List every dangling reference')
+    args = parser.parse_args()
+
+    if args.command == 'query':
+        result = neighbours(load_json(args.out)['nodes'], args.node_kind, args.node_id, args.kind)
+        print(json.dumps(result, indent=2))
+        return 0
+
+    nodes, dangling, changed = write_graph(args.out)
+    edges = sum(len(ids) for links in nodes.values() for ids in links.values()) // 2
+    print(
+        f"Reference graph: {len(nodes)} nodes, {edges} links, {len(dangling)} dangling"
+        + ('' if changed else ' (unchanged)')
+    )
+    by_field = {}
+    for ref in dangling:
+        key = f"{ref['source'].split(':', 1)[0]}.{ref['field']}"
+        by_field[key] = by_field.get(key, 0) + 1
+    for key, count in sorted(by_field.items()):
+        print(f"  {count:5d} dangling {key}")
+    for ref in dangling if args.verbose else []:
+        print(f"  {ref['source']} {ref['field']} -> {ref['target']}")
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(dangling, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
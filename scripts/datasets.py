@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Shared paths and JSON helpers for the data build scripts.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(REPO_ROOT, 'frontend', 'public', 'data')
+CHUNKS_DIR = os.path.join(DATA_DIR, 'chunks')
+
+ERRORS_FILE = os.path.join(DATA_DIR, 'errors.json')
+
+# The four published datasets: which array holds the records, which field
+# identifies a record, and which metadata fields are derived from records.
+DATASETS = {
+    'errors': {
+        'file': 'errors.json',
+        'key': 'errors',
+        'id_field': 'code',
+        'count_field': None,
+        'facets': {},
+    },
+    'messages': {
+        'file': 'message_definitions.json',
+        'key': 'messages',
+        'id_field': 'id',
+        'count_field': 'message_count',
+        'facets': {},
+    },
+    'examples': {
+        'file': 'real_world_examples.json',
+        'key': 'examples',
+        'id_field': 'id',
+        'count_field': 'example_count',
+        'facets': {'categories': 'category', 'difficulties': 'difficulty'},
+    },
+    'glossary': {
+        'file': 'glossary_terms.json',
+        'key': 'terms',
+        'id_field': 'id',
+        'count_field': 'term_count',
+        'facets': {'categories': 'category'},
+    },
+}
+
+READ_SIZE = 64 * 1024
+
+
+def dataset_path(name):
+    """Absolute path of a dataset file by its DATASETS name."""
+    return os.path.join(DATA_DIR, DATASETS[name]['file'])
+
+
+def load_json(path):
+    """Load a JSON document from disk."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class JsonStream:
+    """Incremental JSON reader that keeps at most one value in memory.
+
+    Wraps a text file and decodes values one at a time with
+    ``json.JSONDecoder.raw_decode``, refilling its buffer on demand.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, f, read_size=READ_SIZE):
+        self.f = f
+        self.read_size = read_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        chunk = self.f.read(self.read_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r}, found {found!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number or literal ending exactly at the buffer edge may continue.
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def items(self):
+        """Yield the elements of the array starting at the current position."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            sep = self.peek()
+            self.pos += 1
+            if sep == ']':
+                return
+            if sep != ',':
+                raise ValueError(f"Expected ',' or ']' in array, found {sep!r}")
+
+    def members(self):
+        """Yield (key, stream) for each member of the object at the current position.
+
+        The caller must consume the member value (``value()`` or ``items()``)
+        before advancing to the next member.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            yield key, self
+            sep = self.peek()
+            self.pos += 1
+            if sep == '}':
+                return
+            if sep != ',':
+                raise ValueError(f"Expected ',' or '}}' in object, found {sep!r}")
+
+
+def iter_records(path, key):
+    """Stream records from a bare JSON array or from ``document[key]``."""
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = JsonStream(f)
+        if stream.peek() == '[':
+            yield from stream.items()
+            return
+        for member, value_stream in stream.members():
+            if member == key:
+                yield from value_stream.items()
+            else:
+                value_stream.value()
+
+
+def read_header(path, key):
+    """Return the top-level members of a dataset document except the records.
+
+    The result preserves member order and holds ``None`` as a placeholder for
+    the records array, so it can be fed back to ``write_document``.
+    """
+    header = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = JsonStream(f)
+        if stream.peek() == '[':
+            return {key: None}
+        for member, value_stream in stream.members():
+            if member == key:
+                for _ in value_stream.items():
+                    pass
+                header[member] = None
+            else:
+                header[member] = value_stream.value()
+    return header
+
+
+def _indented(data, level):
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    return text.replace('\n', '\n' + ' ' * level)
+
+
+def write_document(path, header, key, records):
+    """Atomically stream a dataset document in the repo's ``indent=2`` layout.
+
+    ``header`` supplies the other top-level members in order; ``records`` is
+    any iterable and is written without being materialized. The output is
+    byte-identical to ``json.dump(doc, f, indent=2, ensure_ascii=False)``.
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write('{')
+            first_member = True
+            for member, value in header.items():
+                f.write('\n  ' if first_member else ',\n  ')
+                first_member = False
+                f.write(json.dumps(member, ensure_ascii=False) + ': ')
+                if member != key:
+                    f.write(_indented(value, 2))
+                    continue
+                f.write('[')
+                empty = True
+                for record in records:
+                    f.write('\n    ' if empty else ',\n    ')
+                    empty = False
+                    f.write(_indented(record, 4))
+                f.write(']' if empty else '\n  ]')
+            f.write('\n}' if not first_member else '}')
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def dumps_compact(data):
+    """Serialize data as compact, deterministic UTF-8 JSON bytes."""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def content_hash(payload, length=10):
+    """Short hex digest used in content-addressed file names."""
+    return hashlib.sha256(payload).hexdigest()[:length]
+
+
+def write_bytes_atomic(path, payload):
+    """Write bytes through a temp file in the same directory, then rename."""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        # mkstemp creates 0600 files; published data must stay world-readable.
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_if_changed(path, payload):
+    """Atomically write payload unless the file already holds the same bytes.
+
+    Returns True when the file was (re)written.
+    """
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == payload:
+                return False
+    write_bytes_atomic(path, payload)
+    return True
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Columnar export of errors.json with interned strings.
+
+Records are flattened into one column per leaf path (``description.short``,
+``how_to_fix.steps``, ``resources`` ...). Columns are grouped by when the UI
+needs them, and each group file carries one string table shared by all of
+its columns, sorted by frequency so the most repeated strings get the
+smallest ids:
+
+    list    everything an ErrorCard renders (loaded with the home page)
+    search  the detailed description (the prebuilt search index covers it,
+            so search never fetches this group)
+    detail  heavy fields; ErrorPage fetches search and detail together
+
+Column encodings:
+    str      string id per row
+    strs     list of string ids per row
+    records  list of rows of string ids, one per entry in ``fields``
+    json     raw JSON value per row (anything else)
+
+A missing value is ``null`` in every encoding. Group files are content
+hashed and listed in columnar/manifest.json.
+
+Usage:
+    python scripts/export_columnar.py [--verify]
+"""
+
+import argparse
+import os
+import re
+import sys
+from collections import Counter
+
+from datasets import DATA_DIR, ERRORS_FILE, content_hash, dumps_compact, load_json, write_if_changed
+
+COLUMNAR_DIR = os.path.join(DATA_DIR, 'columnar')
+FORMAT_VERSION = 1
+GROUP_FILE_RE = re.compile(r'^(list|search|detail)\.[0-9a-f]+\.json$')
+
+GROUPS = {
+    'list': ['code', 'name', 'category', 'severity', 'description.short', 'message_types'],
+    'search': ['description.detailed'],
+}
+DEFAULT_GROUP = 'detail'
+
+
+def flatten(record, prefix=''):
+    """Yield (path, value) for every non-dict leaf of a record."""
+    for key, value in record.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict) and value:
+            yield from flatten(value, path + '.')
+        else:
+            yield path, value
+
+
+def is_str_list(value):
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def record_fields(value):
+    """Field list if value is a list of flat string-valued dicts, else None."""
+    if not isinstance(value, list) or not all(isinstance(item, dict) for item in value):
+        return None
+    fields = []
+    for item in value:
+        for key, field_value in item.items():
+            if not isinstance(field_value, str):
+                return None
+            if key not in fields:
+                fields.append(key)
+    return fields
+
+
+def column_type(values):
+    """Pick the tightest encoding that fits every non-missing value."""
+    present = [value for value in values if value is not None]
+    if all(isinstance(value, str) for value in present):
+        return 'str', None
+    if all(is_str_list(value) for value in present):
+        return 'strs', None
+    fields = []
+    for value in present:
+        value_fields = record_fields(value)
+        if value_fields is None:
+            return 'json', None
+        fields.extend(field for field in value_fields if field not in fields)
+    return 'records', fields
+
+
+def column_strings(kind, fields, values):
+    for value in values:
+        if value is None:
+            continue
+        if kind == 'str':
+            yield value
+        elif kind == 'strs':
+            yield from value
+        elif kind == 'records':
+            for item in value:
+                yield from (item[field] for field in fields if field in item)
+
+
+def encode_value(kind, fields, value, ids):
+    if value is None or kind == 'json':
+        return value
+    if kind == 'str':
+        return ids[value]
+    if kind == 'strs':
+        return [ids[item] for item in value]
+    return [[ids[item[field]] if field in item else None for field in fields] for item in value]
+
+
+def build_group(name, paths, rows):
+    """Encode the given column paths of every row into one group document."""
+    columns = {}
+    counts = Counter()
+    specs = []
+    for path in paths:
+        values = [row.get(path) for row in rows]
+        kind, fields = column_type(values)
+        counts.update(column_strings(kind, fields, values))
+        specs.append((path, kind, fields, values))
+
+    strings = [text for text, _ in sorted(counts.items(), key=lambda item: (-item[1], item[0]))]
+    ids = {text: i for i, text in enumerate(strings)}
+    for path, kind, fields, values in specs:
+        column = {'type': kind}
+        if fields is not None:
+            column['fields'] = fields
+        column['values'] = [encode_value(kind, fields, value, ids) for value in values]
+        columns[path] = column
+
+    return {
+        'version': FORMAT_VERSION,
+        'group': name,
+        'rows': len(rows),
+        'strings': strings,
+        'columns': columns,
+    }
+
+
+def decode_value(column, strings, value):
+    kind = column['type']
+    if value is None or kind == 'json':
+        return value
+    if kind == 'str':
+        return strings[value]
+    if kind == 'strs':
+        return [strings[item] for item in value]
+    return [
+        {field: strings[item[i]] for i, field in enumerate(column['fields']) if item[i] is not None}
+        for item in value
+    ]
+
+
+def decode_row(group, index, target=None):
+    """Decode one row of a group into a (possibly shared) nested dict."""
+    target = {} if target is None else target
+    for path, column in group['columns'].items():
+        value = column['values'][index]
+        if value is None:
+            continue
+        node = target
+        parts = path.split('.')
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = decode_value(column, group['strings'], value)
+    return target
+
+
+def export(errors_file=ERRORS_FILE, out_dir=COLUMNAR_DIR):
+    """Write the group files and manifest; returns the manifest."""
+    data = load_json(errors_file)
+    rows = [dict(flatten(error)) for error in data['errors']]
+
+    all_paths = []
+    for row in rows:
+        all_paths.extend(path for path in row if path not in all_paths)
+    assigned = {path for paths in GROUPS.values() for path in paths}
+    groups = dict(GROUPS)
+    groups[DEFAULT_GROUP] = [path for path in all_paths if path not in assigned]
+
+    manifest = {
+        'version': FORMAT_VERSION,
+        'source': {'version': data.get('version'), 'updated': data.get('updated')},
+        'rows': len(rows),
+        'groups': {},
+    }
+    for name, paths in groups.items():
+        payload = dumps_compact(build_group(name, paths, rows))
+        digest = content_hash(payload)
+        file_name = f'{name}.{digest}.json'
+        write_if_changed(os.path.join(out_dir, file_name), payload)
+        manifest['groups'][name] = {
+            'file': file_name,
+            'hash': digest,
+            'bytes': len(payload),
+            'columns': paths,
+        }
+
+    live = {entry['file'] for entry in manifest['groups'].values()}
+    for name in os.listdir(out_dir):
+        if GROUP_FILE_RE.match(name) and name not in live:
+            os.remove(os.path.join(out_dir, name))
+
+    write_if_changed(os.path.join(out_dir, 'manifest.json'), dumps_compact(manifest))
+    return manifest
+
+
+def verify(errors_file=ERRORS_FILE, out_dir=COLUMNAR_DIR):
+    """Decode every row from the group files and compare with the source."""
+    errors = load_json(errors_file)['errors']
+    manifest = load_json(os.path.join(out_dir, 'manifest.json'))
+    groups = [load_json(os.path.join(out_dir, entry['file'])) for entry in manifest['groups'].values()]
+    mismatches = 0
+    for index, error in enumerate(errors):
+        decoded = {}
+        for group in groups:
+            decode_row(group, index, decoded)
+        if decoded != {k: v for k, v in error.items() if v != {}}:
+            mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--errors', default=ERRORS_FILE)
+    parser.add_argument('--out', default=COLUMNAR_DIR)
+    parser.add_argument('--verify', action='store_true', help='Round-trip every record after export')
+    args = parser.parse_args()
+
+    manifest = export(args.errors, args.out)
+    source_size = os.path.getsize(args.errors)
+    total = 0
+    for name, entry in manifest['groups'].items():
+        total += entry['bytes']
+        print(f"  {name:<7} {entry['bytes'] / 1024:8.1f} KB  {len(entry['columns'])} columns")
+    print(f"Exported {manifest['rows']} errors: {total / 1024:.1f} KB total vs {source_size / 1024:.1f} KB source")
+
+    if args.verify:
+        mismatches = verify(args.errors, args.out)
+        print(f"Round-trip: {manifest['rows'] - mismatches}/{manifest['rows']} records match")
+        return 1 if mismatches else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Export all four datasets into a normalized SQLite database with FTS5.
+
+Tables:
+    errors, error_message_types, error_related_codes, errors_fts
+    messages, business_areas, mt_to_mx_mappings
+    examples, example_messages, example_errors, example_terms, examples_fts
+    glossary, glossary_aliases, glossary_fts
+    sources                     per-dataset source hash and record count
+
+Every record row stores the hash of its JSON, so a rebuild only rewrites
+records that changed (and deletes removed ones); datasets whose source file
+hash is unchanged are skipped entirely (a database written by an older
+EXPORT_VERSION is rebuilt from scratch). The full record is kept in a
+``body`` JSON column for consumers that need fields not broken out here.
+
+Usage:
+    python scripts/export_sqlite.py [--db build/iso20022.sqlite] [build --force]
+    python scripts/export_sqlite.py search "account closed" [--dataset glossary]
+
+    sqlite3 build/iso20022.sqlite \\
+      "SELECT e.code, e.name FROM error_message_types m JOIN errors e USING (code)
+       WHERE m.message_type = 'pacs.008'"
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import time
+
+from datasets import DATASETS, REPO_ROOT, content_hash, dataset_path, dumps_compact, iter_records, read_header
+from search_index import tokenize
+
+DEFAULT_DB = os.path.join(REPO_ROOT, 'build', 'iso20022.sqlite')
+# Bump when the row builders change: a database written by another version
+# is rebuilt from scratch, since unchanged records would keep their old rows.
+EXPORT_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    dataset TEXT PRIMARY KEY, source_hash TEXT NOT NULL, version TEXT,
+    records INTEGER NOT NULL, built_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS errors (
+    code TEXT PRIMARY KEY, id TEXT, name TEXT NOT NULL, category TEXT, severity TEXT,
+    description_short TEXT, description_detailed TEXT, hash TEXT NOT NULL, body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS errors_category ON errors (category);
+CREATE INDEX IF NOT EXISTS errors_severity ON errors (severity);
+CREATE TABLE IF NOT EXISTS error_message_types (
+    code TEXT NOT NULL, message_type TEXT NOT NULL, PRIMARY KEY (code, message_type)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS error_message_types_type ON error_message_types (message_type);
+CREATE TABLE IF NOT EXISTS error_related_codes (
+    code TEXT NOT NULL, related_code TEXT NOT NULL, PRIMARY KEY (code, related_code)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS error_related_codes_related ON error_related_codes (related_code);
+CREATE VIRTUAL TABLE IF NOT EXISTS errors_fts USING fts5(
+    code UNINDEXED, name, description, causes, fixes, tokenize = 'porter unicode61'
+);
+
+CREATE TABLE IF NOT EXISTS messages (
+    id TEXT PRIMARY KEY, name TEXT NOT NULL, business_area TEXT, business_area_name TEXT,
+    purpose TEXT, hash TEXT NOT NULL, body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_area ON messages (business_area);
+CREATE TABLE IF NOT EXISTS business_areas (code TEXT PRIMARY KEY, name TEXT, description TEXT);
+CREATE TABLE IF NOT EXISTS mt_to_mx_mappings (mt TEXT NOT NULL, mx TEXT NOT NULL, name TEXT, notes TEXT);
+CREATE INDEX IF NOT EXISTS mt_to_mx_mappings_mt ON mt_to_mx_mappings (mt);
+CREATE INDEX IF NOT EXISTS mt_to_mx_mappings_mx ON mt_to_mx_mappings (mx);
+
+CREATE TABLE IF NOT EXISTS examples (
+    id TEXT PRIMARY KEY, title TEXT NOT NULL, difficulty TEXT, category TEXT, scenario TEXT,
+    step_count INTEGER, hash TEXT NOT NULL, body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS examples_category ON examples (category);
+CREATE TABLE IF NOT EXISTS example_messages (
+    example_id TEXT NOT NULL, message_type TEXT NOT NULL, PRIMARY KEY (example_id, message_type)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS example_messages_type ON example_messages (message_type);
+CREATE TABLE IF NOT EXISTS example_errors (
+    example_id TEXT NOT NULL, error_code TEXT NOT NULL, PRIMARY KEY (example_id, error_code)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS example_errors_code ON example_errors (error_code);
+CREATE TABLE IF NOT EXISTS example_terms (
+    example_id TEXT NOT NULL, term TEXT NOT NULL, PRIMARY KEY (example_id, term)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS examples_fts USING fts5(
+    id UNINDEXED, title, scenario, steps, takeaways, tokenize = 'porter unicode61'
+);
+
+CREATE TABLE IF NOT EXISTS glossary (
+    id TEXT PRIMARY KEY, display_name TEXT NOT NULL, category TEXT, hash TEXT NOT NULL, body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS glossary_aliases (
+    term_id TEXT NOT NULL, alias TEXT NOT NULL, PRIMARY KEY (term_id, alias)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS glossary_aliases_alias ON glossary_aliases (alias COLLATE NOCASE);
+CREATE VIRTUAL TABLE IF NOT EXISTS glossary_fts USING fts5(
+    id UNINDEXED, display_name, aliases, business, technical, simple, tokenize = 'porter unicode61'
+);
+"""
+
+
+def error_rows(error, body, digest):
+    description = error.get('description', {})
+    fixes = error.get('how_to_fix', {})
+    return {
+        'errors': [(
+            error['code'], error.get('id'), error['name'], error.get('category'), error.get('severity'),
+            description.get('short'), description.get('detailed'), digest, body,
+        )],
+        'error_message_types': [(error['code'], m) for m in dict.fromkeys(error.get('message_types', []))],
+        'error_related_codes': [(error['code'], c) for c in dict.fromkeys(error.get('related_codes', []))],
+        # unicode61 keeps ClosedAccountNumber as one token; index the words.
+        'errors_fts': [(
+            error['code'], ' '.join(tokenize(error['name'])),
+            ' '.join(filter(None, [description.get('short'), description.get('detailed')])),
+            ' '.join(error.get('common_causes', [])),
+            ' '.join(fixes.get('steps', []) + [fixes.get('prevention', '')]),
+        )],
+    }
+
+
+def message_rows(message, body, digest):
+    return {
+        'messages': [(
+            message['id'], message['name'], message.get('business_area'), message.get('business_area_name'),
+            message.get('purpose'), digest, body,
+        )],
+    }
+
+
+def example_rows(example, body, digest):
+    steps = example.get('steps', [])
+    return {
+        'examples': [(
+            example['id'], example['title'], example.get('difficulty'), example.get('category'),
+            example.get('scenario'), len(steps), digest, body,
+        )],
+        'example_messages': [
+            (example['id'], m)
+            for m in dict.fromkeys(example.get('related_messages', []) + [s['message_type'] for s in steps])
+        ],
+        'example_errors': [
+            (example['id'], c) for c in dict.fromkeys(e['error_code'] for e in example.get('possible_errors', []))
+        ],
+        'example_terms': [(example['id'], t) for t in dict.fromkeys(example.get('related_terms', []))],
+        'examples_fts': [(
+            example['id'], example['title'], example.get('scenario', ''),
+            ' '.join(f"{s.get('action', '')} {s.get('description', '')}" for s in steps),
+            ' '.join(example.get('key_takeaways', [])),
+        )],
+    }
+
+
+def glossary_rows(term, body, digest):
+    explanations = term.get('explanations', {})
+    aliases = list(dict.fromkeys(term.get('aliases', [])))
+    return {
+        'glossary': [(term['id'], term['display_name'], term.get('category'), digest, body)],
+        'glossary_aliases': [(term['id'], alias) for alias in aliases],
+        'glossary_fts': [(
+            term['id'], term['display_name'], ' '.join(aliases),
+            explanations.get('business', ''), explanations.get('technical', ''), explanations.get('simple', ''),
+        )],
+    }
+
+
+# dataset -> (row builder, [(table, key column)], main table first)
+EXPORTS = {
+    'errors': (error_rows, [
+        ('errors', 'code'), ('error_message_types', 'code'), ('error_related_codes', 'code'), ('errors_fts', 'code'),
+    ]),
+    'messages': (message_rows, [('messages', 'id')]),
+    'examples': (example_rows, [
+        ('examples', 'id'), ('example_messages', 'example_id'), ('example_errors', 'example_id'),
+        ('example_terms', 'example_id'), ('examples_fts', 'id'),
+    ]),
+    'glossary': (glossary_rows, [
+        ('glossary', 'id'), ('glossary_aliases', 'term_id'), ('glossary_fts', 'id'),
+    ]),
+}
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def insert(db, table, rows):
+    if rows:
+        marks = ', '.join('?' * len(rows[0]))
+        db.executemany(f'INSERT INTO {table} VALUES ({marks})', rows)
+
+
+def export_dataset(db, name, force=False):
+    """Sync one dataset into the database; returns change counts or None if skipped."""
+    path = dataset_path(name)
+    source_hash = file_hash(path)
+    row = db.execute('SELECT source_hash FROM sources WHERE dataset = ?', (name,)).fetchone()
+    if row and row[0] == source_hash and not force:
+        return None
+
+    build_rows, tables = EXPORTS[name]
+    main_table, main_key = tables[0]
+    key_field = DATASETS[name]['id_field']
+    existing = dict(db.execute(f'SELECT {main_key}, hash FROM {main_table}'))
+    stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+
+    def remove(record_id):
+        for table, key in tables:
+            db.execute(f'DELETE FROM {table} WHERE {key} = ?', (record_id,))
+
+    seen = set()
+    for record in iter_records(path, DATASETS[name]['key']):
+        body = dumps_compact(record)
+        digest = content_hash(body, 16)
+        record_id = record[key_field]
+        if record_id in seen:
+            continue
+        seen.add(record_id)
+        if existing.get(record_id) == digest:
+            stats['unchanged'] += 1
+            continue
+        if record_id in existing:
+            remove(record_id)
+            stats['updated'] += 1
+        else:
+            stats['added'] += 1
+        for table, rows in build_rows(record, body.decode('utf-8'), digest).items():
+            insert(db, table, rows)
+
+    for record_id in existing.keys() - seen:
+        remove(record_id)
+        stats['removed'] += 1
+
+    header = read_header(path, DATASETS[name]['key'])
+    if name == 'messages':
+        # Small document-level sections: replaced wholesale.
+        db.execute('DELETE FROM business_areas')
+        insert(db, 'business_areas', [
+            (a['code'], a.get('name'), a.get('description')) for a in header.get('business_areas', [])
+        ])
+        db.execute('DELETE FROM mt_to_mx_mappings')
+        insert(db, 'mt_to_mx_mappings', [
+            (m['mt'], m['mx'], m.get('name'), m.get('notes')) for m in header.get('mt_to_mx_mappings', [])
+        ])
+
+    metadata = header.get('metadata') if isinstance(header.get('metadata'), dict) else {}
+    version = header.get('version') or metadata.get('version')
+    db.execute(
+        'INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?)',
+        (name, source_hash, version, len(seen), time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())),
+    )
+    return stats
+
+
+def export(db_path=DEFAULT_DB, force=False):
+    os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+    db = sqlite3.connect(db_path)
+    if db.execute('PRAGMA user_version').fetchone()[0] != EXPORT_VERSION:
+        db.close()
+        os.remove(db_path)
+        db = sqlite3.connect(db_path)
+    try:
+        db.executescript(SCHEMA)
+        db.execute(f'PRAGMA user_version = {EXPORT_VERSION}')
+        results = {}
+        for name in EXPORTS:
+            with db:  # one transaction per dataset
+                results[name] = export_dataset(db, name, force)
+        for table in ('errors_fts', 'examples_fts', 'glossary_fts'):
+            db.execute(f"INSERT INTO {table}({table}) VALUES ('optimize')")
+        db.commit()
+        return results
+    finally:
+        db.close()
+
+
+FTS_QUERIES = {
+    'errors': "SELECT errors.code, errors.name, snippet(errors_fts, 2, '[', ']', '...', 8) "
+              "FROM errors_fts JOIN errors ON errors.code = errors_fts.code "
+              "WHERE errors_fts MATCH ? ORDER BY bm25(errors_fts, 0, 4.0, 2.0, 1.0, 1.0) LIMIT ?",
+    'examples': "SELECT id, title, snippet(examples_fts, 2, '[', ']', '...', 8) FROM examples_fts "
+                "WHERE examples_fts MATCH ? ORDER BY bm25(examples_fts, 0, 4.0, 2.0, 1.0, 1.0) LIMIT ?",
+    'glossary': "SELECT id, display_name, snippet(glossary_fts, 3, '[', ']', '...', 8) FROM glossary_fts "
+                "WHERE glossary_fts MATCH ? ORDER BY bm25(glossary_fts, 0, 4.0, 3.0, 1.0, 1.0, 1.0) LIMIT ?",
+}
+
+
+def fts_query(text):
+    """Quote each word so user input cannot hit FTS5 query syntax; prefix-match the last."""
+    words = re.findall(r'\w+', text)
+    if not words:
+        return None
+    return ' '.join(f'"{word}"' for word in words[:-1]) + f' "{words[-1]}"*'
+
+
+def search(db_path, text, dataset, limit):
+    query = fts_query(text)
+    if query is None:
+        return []
+    db = sqlite3.connect(db_path)
+    try:
+        return db.execute(FTS_QUERIES[dataset], (query.strip(), limit)).fetchall()
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--db', default=DEFAULT_DB, help='SQLite database path')
+    sub = parser.add_subparsers(dest='command')
+    build = sub.add_parser('build', help='Create or incrementally update the database (default)')
+    build.add_argument('--force', action='store_true', help='Re-check every record even if sources are unchanged')
+    find = sub.add_parser('search', help='Ranked full-text search')
+    find.add_argument('text')
+    find.add_argument('--dataset', choices=sorted(FTS_QUERIES), default='errors')
+    find.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    if args.command == 'search':
+        if not os.path.exists(args.db):
+            print(f"Database not found: {args.db} (run the build first)")
+            return 1
+        start = time.perf_counter()
+        rows = search(args.db, args.text, args.dataset, args.limit)
+        for key, title, snippet in rows:
+            print(f"{key:24s} {title}\n    {snippet}")
+        print(f"{len(rows)} result(s) in {(time.perf_counter() - start) * 1000:.1f} ms")
+        return 0
+
+    start = time.perf_counter()
+    results = export(args.db, getattr(args, 'force', False))
+    for name, stats in results.items():
+        if stats is None:
+            print(f"  {name}: source unchanged")
+        else:
+            print(
+                f"  {name}: {stats['added']} added, {stats['updated']} updated, "
+                f"{stats['removed']} removed, {stats['unchanged']} unchanged"
+            )
+    print(f"Wrote {args.db} ({os.path.getsize(args.db) / 1024:.0f} KB) in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
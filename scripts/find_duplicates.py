@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection for the errors catalogue with MinHash and LSH.
+
+Each error is shingled (word 3-grams over name, description and
+common_causes, with the error's own code removed so scraped names like
+"AACRIssue_AACR" do not dominate) and summarized by a one-permutation
+MinHash signature: one hash per shingle, so signing is linear in the text
+size. Signatures are split into LSH bands; only records that share a band
+bucket are compared, using exact Jaccard similarity of their shingle sets.
+Matches are grouped into clusters, each with a suggested canonical record
+(the most complete, best-categorized entry with a standard code).
+
+Usage:
+    python scripts/find_duplicates.py [--threshold 0.7] [--json clusters.json]
+    python scripts/find_duplicates.py --source merged_errors.json --verbose
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+
+from datasets import dataset_path, iter_records
+
+NUM_PERM = 120
+SHINGLE_SIZE = 3
+MAX_BUCKET_PAIRS = 200  # larger buckets are compared against one pivot only
+# (bands, rows) splits of NUM_PERM; the LSH threshold is about (1/b)^(1/r).
+BANDINGS = [(40, 3), (30, 4), (24, 5), (20, 6), (15, 8), (12, 10), (10, 12)]
+STANDARD_CODE_RE = re.compile(r'^[A-Z]{2}[A-Z0-9]{2}$')
+MANGLED_NAME_RE = re.compile(r'^\w+Issue_\w+$')
+EMPTY_BIN = (1 << 64) - 1
+
+
+def words(text):
+    text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
+    return re.findall(r'[a-z0-9]+', text.lower())
+
+
+def shingles(error):
+    """Word n-gram shingles over the descriptive text of one error."""
+    description = error.get('description', {})
+    parts = [error.get('name', ''), description.get('short', ''), description.get('detailed', '')]
+    parts.extend(error.get('common_causes', []))
+    own_code = error['code'].lower()
+    tokens = [token for token in words(' '.join(parts)) if token != own_code]
+    if len(tokens) < SHINGLE_SIZE:
+        return {' '.join(tokens)} if tokens else set()
+    return {' '.join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+
+
+def shingle_hash(shingle):
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def signature(hashes, num_perm=NUM_PERM):
+    """One-permutation MinHash with rotation densification."""
+    bins = [EMPTY_BIN] * num_perm
+    for value in hashes:
+        index = value % num_perm
+        rest = value // num_perm
+        if rest < bins[index]:
+            bins[index] = rest
+    if all(value == EMPTY_BIN for value in bins):
+        return bins
+    # Empty bins borrow from the next non-empty bin to the right, offset by
+    # the distance so borrowed values stay distinguishable.
+    dense = list(bins)
+    for index in range(num_perm):
+        distance = 0
+        while bins[(index + distance) % num_perm] == EMPTY_BIN:
+            distance += 1
+        if distance:
+            dense[index] = bins[(index + distance) % num_perm] + distance * (1 << 58)
+    return dense
+
+
+def choose_banding(threshold):
+    """Banding whose S-curve midpoint sits just under the threshold (favours recall)."""
+    return min(BANDINGS, key=lambda br: abs((1 / br[0]) ** (1 / br[1]) - threshold * 0.85))
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def candidate_pairs(signatures, bands, rows):
+    pairs = set()
+    for band in range(bands):
+        buckets = {}
+        for index, sig in enumerate(signatures):
+            if sig[0] == EMPTY_BIN:
+                continue
+            buckets.setdefault(tuple(sig[band * rows:(band + 1) * rows]), []).append(index)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            if len(members) > MAX_BUCKET_PAIRS:
+                pairs.update((members[0], other) for other in members[1:])
+                continue
+            for i, left in enumerate(members):
+                for right in members[i + 1:]:
+                    pairs.add((left, right))
+    return pairs
+
+
+def canonical_score(error):
+    """Higher is a better canonical record for a cluster."""
+    description = error.get('description', {})
+    return (
+        bool(STANDARD_CODE_RE.match(error['code'])),
+        error.get('category') != 'Other',
+        not MANGLED_NAME_RE.match(error.get('name', '')),
+        len(error.get('common_causes', [])) + len(error.get('how_to_fix', {}).get('steps', [])),
+        len(description.get('detailed', '')),
+        -len(error['code']),
+    )
+
+
+def find_clusters(errors, threshold):
+    """Return (clusters, stats); each cluster is a list of (index, similarity to canonical)."""
+    start = time.perf_counter()
+    shingle_sets = [shingles(error) for error in errors]
+    signatures = [signature(shingle_hash(s) for s in sets) for sets in shingle_sets]
+    signed = time.perf_counter()
+
+    bands, rows = choose_banding(threshold)
+    pairs = candidate_pairs(signatures, bands, rows)
+
+    parent = list(range(len(errors)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    matched = 0
+    for left, right in pairs:
+        if jaccard(shingle_sets[left], shingle_sets[right]) >= threshold:
+            matched += 1
+            parent[find(left)] = find(right)
+
+    groups = {}
+    for index in range(len(errors)):
+        groups.setdefault(find(index), []).append(index)
+
+    clusters = []
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        canonical = max(members, key=lambda i: canonical_score(errors[i]))
+        ranked = sorted(
+            ((i, jaccard(shingle_sets[canonical], shingle_sets[i])) for i in members if i != canonical),
+            key=lambda item: (-item[1], errors[item[0]]['code']),
+        )
+        clusters.append([(canonical, 1.0)] + ranked)
+    clusters.sort(key=lambda cluster: (-len(cluster), errors[cluster[0][0]]['code']))
+
+    stats = {
+        'records': len(errors),
+        'bands': bands,
+        'rows': rows,
+        'candidate_pairs': len(pairs),
+        'all_pairs': len(errors) * (len(errors) - 1) // 2,
+        'matched_pairs': matched,
+        'sign_s': round(signed - start, 3),
+        'total_s': round(time.perf_counter() - start, 3),
+    }
+    return clusters, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--source', default=dataset_path('errors'), help='errors.json (or a bare array of errors)')
+    parser.add_argument('--threshold', type=float, default=0.7, help='Jaccard similarity that counts as a duplicate')
+    parser.add_argument('--json', dest='json_out', help='Write clusters to this JSON file')
+    parser.add_argument('--verbose', action='store_true', help='Show descriptions for every cluster member')
+    args = parser.parse_args()
+
+    errors = list(iter_records(args.source, 'errors'))
+    clusters, stats = find_clusters(errors, args.threshold)
+
+    duplicates = sum(len(cluster) - 1 for cluster in clusters)
+    print(
+        f"{stats['records']} errors: {len(clusters)} clusters, {duplicates} suggested duplicates "
+        f"(threshold {args.threshold}, {stats['bands']}x{stats['rows']} bands, "
+        f"{stats['candidate_pairs']:,} of {stats['all_pairs']:,} pairs compared, {stats['total_s']:.2f}s)"
+    )
+    for cluster in clusters:
+        canonical = errors[cluster[0][0]]
+        print(f"\n  keep {canonical['code']}  {canonical['name']}  [{canonical['category']}]")
+        for index, similarity in cluster[1:]:
+            error = errors[index]
+            print(f"    {similarity:4.2f}  {error['code']}  {error['name']}  [{error['category']}]")
+            if args.verbose:
+                print(f"          {error.get('description', {}).get('short', '')}")
+
+    if args.json_out:
+        report = {
+            'threshold': args.threshold,
+            'stats': stats,
+            'clusters': [
+                {
+                    'canonical': errors[cluster[0][0]]['code'],
+                    'duplicates': [
+                        {'code': errors[index]['code'], 'similarity': round(similarity, 3)}
+                        for index, similarity in cluster[1:]
+                    ],
+                }
+                for cluster in clusters
+            ],
+        }
+        with open(args.json_out, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Seeded synthetic real-world example fixtures for scale testing.
+
+Builds N examples x M steps over K message types by sampling the message
+catalogue, characters and possible errors from generate_large_example.py.
+Each example gets its own RNG derived from (seed, index), so example i is
+identical whatever N is, and output is streamed to disk one example at a
+time in the same document layout as real_world_examples.json.
+
+Usage:
+    python scripts/generate_fixtures.py --scale 10             # 600 examples
+    python scripts/generate_fixtures.py --examples 50 --steps 2000 --message-types 40
+"""
+
+import argparse
+import os
+import random
+import sys
+
+from datasets import REPO_ROOT, dataset_path, read_header, write_document
+from generate_large_example import CHARACTERS, MESSAGE_CATALOG, POSSIBLE_ERRORS, RELATED_TERMS
+
+FIXTURES_DIR = os.path.join(REPO_ROOT, 'fixtures')
+BASELINE_EXAMPLES = 60
+
+CATEGORIES = [
+    'cross-border-payments', 'domestic-payments', 'instant-payments', 'direct-debit',
+    'cash-management', 'treasury', 'securities', 'foreign-exchange', 'trade-finance',
+    'collateral', 'compliance', 'payment-returns', 'account-management', 'administration',
+]
+DIFFICULTIES = ['beginner', 'intermediate', 'advanced']
+ACTIONS = ['Send', 'Confirm', 'Request', 'Forward', 'Report', 'Acknowledge', 'Reject', 'Settle']
+FIELD_NAMES = ['MsgId', 'UETR', 'Amount', 'Currency', 'Status', 'SettlementDate', 'Reference', 'Account']
+
+
+def example_rng(seed, index):
+    # String seeds hash deterministically across runs and platforms.
+    return random.Random(f'{seed}:{index}')
+
+
+def generate_example(seed, index, steps, message_types):
+    """Generate one synthetic example; depends only on (seed, index)."""
+    rng = example_rng(seed, index)
+    catalog = sorted(MESSAGE_CATALOG)
+    messages = rng.sample(catalog, min(message_types, len(catalog)))
+    cast_keys = rng.sample(sorted(CHARACTERS), rng.randint(3, len(CHARACTERS)))
+    cast = {key: dict(CHARACTERS[key]) for key in cast_keys}
+    names = [character['name'] for character in cast.values()]
+
+    step_list = []
+    for number in range(1, steps + 1):
+        msg_type = rng.choice(messages)
+        actor, target = rng.sample(names, 2)
+        action = f"{rng.choice(ACTIONS)} {MESSAGE_CATALOG[msg_type]}"
+        step_list.append({
+            'step': number,
+            'actor': actor,
+            'target': target,
+            'action': action,
+            'description': f"{actor} sends {msg_type} to {target} (synthetic step {number}).",
+            'technical': f"{msg_type} {MESSAGE_CATALOG[msg_type]}.",
+            'message_type': msg_type,
+            'key_fields': [
+                f"{field}: {rng.randint(1000, 999999)}"
+                for field in rng.sample(FIELD_NAMES, rng.randint(1, 3))
+            ],
+        })
+
+    return {
+        'id': f'synthetic_{seed}_{index:06d}',
+        'title': f'Synthetic Scenario {index + 1}',
+        'difficulty': rng.choice(DIFFICULTIES),
+        'category': rng.choice(CATEGORIES),
+        'characters': cast,
+        'scenario': f"Synthetic {steps}-step scenario across {len(cast)} parties and {len(messages)} message types.",
+        'steps': step_list,
+        'possible_errors': rng.sample(POSSIBLE_ERRORS, rng.randint(1, len(POSSIBLE_ERRORS))),
+        'related_messages': sorted({step['message_type'] for step in step_list}),
+        'related_terms': rng.sample(RELATED_TERMS, rng.randint(2, 8)),
+        'key_takeaways': [f"Synthetic takeaway {i + 1}" for i in range(rng.randint(1, 4))],
+    }
+
+
+def write_fixture(path, examples, steps, message_types, seed):
+    """Stream a full examples document to path; returns bytes written."""
+    header = read_header(dataset_path('examples'), 'examples')
+    metadata = header['metadata']
+    metadata['version'] = f'synthetic-{seed}'
+    metadata['example_count'] = examples
+    metadata['categories'] = CATEGORIES
+    metadata['difficulties'] = DIFFICULTIES
+
+    records = (generate_example(seed, index, steps, message_types) for index in range(examples))
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    write_document(path, header, 'examples', records)
+    return os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument('--examples', type=int, help='Number of examples (N)')
+    size.add_argument('--scale', type=int, help=f'Multiple of today\'s {BASELINE_EXAMPLES} examples')
+    parser.add_argument('--steps', type=int, default=12, help='Steps per example (M)')
+    parser.add_argument('--message-types', type=int, default=8, help='Message types per example (K)')
+    parser.add_argument('--seed', type=int, default=20022)
+    parser.add_argument('--out', help='Output file (default: fixtures/examples_<N>x<M>_s<seed>.json)')
+    args = parser.parse_args()
+
+    examples = args.examples or (args.scale or 1) * BASELINE_EXAMPLES
+    if args.steps < 1 or args.message_types < 1:
+        print("--steps and --message-types must be positive")
+        return 1
+
+    out = args.out or os.path.join(FIXTURES_DIR, f'examples_{examples}x{args.steps}_s{args.seed}.json')
+    written = write_fixture(out, examples, args.steps, args.message_types, args.seed)
+    print(f"Wrote {examples} examples x {args.steps} steps to {out} ({written / 1024 / 1024:.1f} MB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
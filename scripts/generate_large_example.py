@@ -1,183 +1,235 @@
 #!/usr/bin/env python3
 """
 Generate a comprehensive 200-step treasury example with ~100 message types.
+
+Failures propagate with a traceback and a non-zero exit; --trace records the
+load, generate, transform and write phases (see instrument.py).
 """
 
+import argparse
 import json
+import os
+import sys
 from datetime import datetime
 
+from datasets import dataset_path, write_document
+from instrument import Trace, add_arguments
+
+# All ISO 20022 message types to use (~100 unique types)
+MESSAGE_CATALOG = {
+    # Payment Initiation (pain.*)
+    "pain.001": "CustomerCreditTransferInitiation",
+    "pain.002": "CustomerPaymentStatusReport",
+    "pain.007": "CustomerPaymentReversal",
+    "pain.008": "CustomerDirectDebitInitiation",
+    "pain.009": "MandateInitiationRequest",
+    "pain.010": "MandateAmendmentRequest",
+    "pain.011": "MandateCancellationRequest",
+    "pain.012": "MandateAcceptanceReport",
+    "pain.013": "CreditorPaymentActivationRequest",
+    "pain.014": "CreditorPaymentActivationRequestStatusReport",
+
+    # Payments Clearing & Settlement (pacs.*)
+    "pacs.002": "FIToFIPaymentStatusReport",
+    "pacs.003": "FIToFICustomerDirectDebit",
+    "pacs.004": "PaymentReturn",
+    "pacs.007": "FIToFIPaymentReversal",
+    "pacs.008": "FIToFICustomerCreditTransfer",
+    "pacs.009": "FinancialInstitutionCreditTransfer",
+    "pacs.010": "FinancialInstitutionDirectDebit",
+    "pacs.028": "FIToFIPaymentStatusRequest",
+
+    # Cash Management (camt.*)
+    "camt.026": "UnableToApply",
+    "camt.027": "ClaimNonReceipt",
+    "camt.028": "AdditionalPaymentInformation",
+    "camt.029": "ResolutionOfInvestigation",
+    "camt.030": "NotificationOfCaseAssignment",
+    "camt.052": "BankToCustomerAccountReport",
+    "camt.053": "BankToCustomerStatement",
+    "camt.054": "BankToCustomerDebitCreditNotification",
+    "camt.055": "CustomerPaymentCancellationRequest",
+    "camt.056": "FIToFIPaymentCancellationRequest",
+    "camt.057": "NotificationToReceive",
+    "camt.058": "NotificationToReceiveCancellationAdvice",
+    "camt.059": "NotificationToReceiveStatusReport",
+    "camt.060": "AccountReportingRequest",
+
+    # Account Management (acmt.*)
+    "acmt.001": "AccountOpeningInstruction",
+    "acmt.002": "AccountDetailsConfirmation",
+    "acmt.003": "AccountModificationInstruction",
+    "acmt.007": "AccountOpeningRequest",
+    "acmt.009": "AccountOpeningAdditionalInformationRequest",
+    "acmt.010": "AccountRequestAcknowledgement",
+    "acmt.014": "AccountReport",
+    "acmt.022": "IdentificationModificationAdvice",
+    "acmt.023": "IdentificationVerificationRequest",
+    "acmt.024": "IdentificationVerificationReport",
+
+    # Securities Settlement (sese.*)
+    "sese.001": "TransferOutInstruction",
+    "sese.003": "TransferOutConfirmation",
+    "sese.005": "TransferInInstruction",
+    "sese.007": "TransferInConfirmation",
+    "sese.011": "TransferInstructionStatusReport",
+    "sese.020": "SecuritiesTransactionCancellationRequest",
+    "sese.023": "SecuritiesSettlementTransactionInstruction",
+    "sese.024": "SecuritiesSettlementTransactionStatusAdvice",
+    "sese.025": "SecuritiesSettlementTransactionConfirmation",
+    "sese.033": "SecuritiesFinancingInstruction",
+    "sese.034": "SecuritiesFinancingConfirmation",
+
+    # Securities Management (semt.*)
+    "semt.002": "CustodyStatementOfHoldings",
+    "semt.003": "AccountingStatementOfHoldings",
+    "semt.013": "IntraPositionMovementInstruction",
+    "semt.015": "IntraPositionMovementConfirmation",
+    "semt.017": "SecuritiesTransactionPostingReport",
+    "semt.018": "SecuritiesTransactionPendingReport",
+    "semt.021": "SecuritiesStatementQuery",
+    "semt.022": "SecuritiesSettlementTransactionAuditTrailReport",
+
+    # Corporate Actions (seev.*)
+    "seev.001": "MeetingNotification",
+    "seev.004": "MeetingInstruction",
+    "seev.006": "MeetingInstructionStatus",
+    "seev.031": "CorporateActionNotification",
+    "seev.033": "CorporateActionInstruction",
+    "seev.034": "CorporateActionInstructionStatusAdvice",
+    "seev.035": "CorporateActionMovementPreliminaryAdvice",
+    "seev.036": "CorporateActionMovementConfirmation",
+    "seev.042": "CorporateActionInstructionStatementReport",
+
+    # Treasury (trea.*)
+    "trea.001": "CreateNonDeliverableForwardOpeningNotification",
+    "trea.007": "NonDeliverableForwardNotificationStatus",
+    "trea.009": "StatusNotification",
+    "trea.012": "ForeignExchangeTradeConfirmation",
+
+    # Foreign Exchange (fxtr.*)
+    "fxtr.008": "ForeignExchangeTradeInstruction",
+    "fxtr.013": "ForeignExchangeTradeStatusNotification",
+    "fxtr.015": "ForeignExchangeTradeConfirmationRequest",
+    "fxtr.030": "ForeignExchangeTradeConfirmation",
+
+    # Collateral Management (colr.*)
+    "colr.003": "MarginCallRequest",
+    "colr.004": "MarginCallResponse",
+    "colr.007": "CollateralProposal",
+    "colr.008": "CollateralProposalResponse",
+    "colr.012": "CollateralValueReport",
+    "colr.016": "CollateralAndExposureReport",
+
+    # Trade Services (tsmt.*)
+    "tsmt.001": "Acknowledgement",
+    "tsmt.013": "DataSetMatchReport",
+    "tsmt.014": "DataSetSubmission",
+    "tsmt.017": "FullPushThroughReport",
+    "tsmt.018": "InitialBaselineSubmission",
+    "tsmt.044": "IntentToPayNotification",
+    "tsmt.049": "SpecialNotification",
+
+    # Card Acceptor (caaa.*)
+    "caaa.001": "AcceptorAuthorisationRequest",
+    "caaa.002": "AcceptorAuthorisationResponse",
+    "caaa.003": "AcceptorCompletionAdvice",
+    "caaa.004": "AcceptorCompletionAdviceResponse",
+    "caaa.005": "AcceptorCancellationRequest",
+    "caaa.006": "AcceptorCancellationResponse",
+    "caaa.009": "AcceptorReconciliationRequest",
+    "caaa.010": "AcceptorReconciliationResponse",
+    "caaa.011": "AcceptorBatchTransfer",
+    "caaa.012": "AcceptorBatchTransferResponse",
+    "caaa.016": "AcceptorCurrencyConversionRequest",
+    "caaa.017": "AcceptorCurrencyConversionResponse",
+
+    # Card Issuer (cain.*)
+    "cain.001": "AcquirerAuthorisationRequest",
+    "cain.002": "AcquirerAuthorisationResponse",
+    "cain.003": "AcquirerCompletionAdvice",
+    "cain.004": "AcquirerCompletionAdviceResponse",
+
+    # ATM Management (catm.*)
+    "catm.001": "StatusReport",
+    "catm.002": "ManagementPlanReplacement",
+    "catm.003": "AcceptorConfigurationUpdate",
+
+    # ATM Transactions (catp.*)
+    "catp.001": "ATMWithdrawalRequest",
+    "catp.002": "ATMWithdrawalResponse",
+    "catp.003": "ATMWithdrawalCompletionAdvice",
+    "catp.004": "ATMWithdrawalCompletionAcknowledgement",
+    "catp.006": "ATMInquiryRequest",
+    "catp.007": "ATMInquiryResponse",
+
+    # Administration (admi.*)
+    "admi.002": "Resend",
+    "admi.004": "SystemEventNotification",
+    "admi.005": "ReportQueryRequest",
+    "admi.006": "ReportQueryResponse",
+    "admi.007": "ReceiptAcknowledgement",
+    "admi.011": "SystemEventAcknowledgement",
+
+    # Authorities (auth.*)
+    "auth.018": "ContractRegistrationRequest",
+    "auth.019": "ContractRegistrationConfirmation",
+    "auth.024": "PaymentRegulatoryInformationNotification",
+    "auth.027": "CurrencyControlStatusAdvice",
+
+    # Reference Data (reda.*)
+    "reda.016": "PartyStatusAdvice",
+    "reda.017": "PartyModificationRequest",
+    "reda.041": "StandingSettlementInstructionCreationRequest",
+    "reda.057": "StandingSettlementInstructionReport",
+}
+
+
+CHARACTERS = {
+    "treasury": {"name": "GlobalCorp Treasury", "role": "Corporate Treasury", "country": "USA", "bank": "JP Morgan"},
+    "us_sub": {"name": "GlobalCorp US", "role": "US Operations", "country": "USA", "bank": "Wells Fargo"},
+    "eu_sub": {"name": "GlobalCorp EU", "role": "European Operations", "country": "Germany", "bank": "Deutsche Bank"},
+    "asia_sub": {"name": "GlobalCorp Asia", "role": "Asian Operations", "country": "Singapore", "bank": "DBS Bank"},
+    "uk_sub": {"name": "GlobalCorp UK", "role": "UK Operations", "country": "UK", "bank": "Barclays"},
+    "custodian": {"name": "State Street", "role": "Global Custodian", "country": "USA", "bank": "State Street"},
+    "csd_eu": {"name": "Euroclear", "role": "EU Central Securities Depository", "country": "Belgium", "bank": "Euroclear"},
+    "clearing_us": {"name": "Federal Reserve", "role": "US Clearing System", "country": "USA", "bank": "Fed"},
+    "clearing_eu": {"name": "TARGET2", "role": "EU Clearing System", "country": "EU", "bank": "ECB"},
+    "fx_dealer": {"name": "CitiFX", "role": "FX Dealer", "country": "UK", "bank": "Citibank"},
+    "broker": {"name": "Goldman Sachs", "role": "Prime Broker", "country": "USA", "bank": "Goldman Sachs"},
+    "card_network": {"name": "Visa", "role": "Card Network", "country": "USA", "bank": "Visa"},
+    "atm": {"name": "ATM Network", "role": "ATM Service", "country": "USA", "bank": "ATM Provider"}
+}
+
+
+POSSIBLE_ERRORS = [
+    {"error_code": "AC01", "scenario": "IBAN incorrect in supplier payment", "result": "Payment returned to GlobalCorp", "message_type": "pacs.004"},
+    {"error_code": "AC04", "scenario": "Account closed at beneficiary bank", "result": "Payment returned, need new details", "message_type": "pacs.004"},
+    {"error_code": "AM04", "scenario": "Insufficient funds for wire payment", "result": "Payment rejected at initiation", "message_type": "pain.002"},
+    {"error_code": "AM05", "scenario": "Duplicate payment detected", "result": "Second payment rejected", "message_type": "pain.002"},
+    {"error_code": "BE04", "scenario": "Beneficiary address missing", "result": "Payment returned for correction", "message_type": "pacs.004"},
+    {"error_code": "FF01", "scenario": "Invalid file format in batch", "result": "Entire batch rejected", "message_type": "pain.002"},
+    {"error_code": "MD01", "scenario": "No mandate for direct debit", "result": "Collection returned unpaid", "message_type": "pacs.004"},
+    {"error_code": "RC01", "scenario": "Invalid BIC in payment", "result": "Payment cannot be routed", "message_type": "pacs.002"},
+    {"error_code": "RR04", "scenario": "Regulatory reason - sanctions", "result": "Payment blocked for review", "message_type": "pacs.002"},
+    {"error_code": "AG01", "scenario": "Transaction forbidden", "result": "Payment rejected by compliance", "message_type": "pacs.002"},
+    {"error_code": "DUPL", "scenario": "Duplicate instruction detected", "result": "Second instruction rejected", "message_type": "pacs.002"},
+    {"error_code": "TECH", "scenario": "Technical problem at clearing", "result": "Retry required", "message_type": "admi.002"}
+]
+
+
+RELATED_TERMS = [
+    "UETR", "IBAN", "BIC", "SWIFT", "TARGET2", "CHIPS", "Fedwire", "ACH",
+    "DVP", "RTGS", "CSD", "Custodian", "Clearing", "Settlement",
+    "Nostro", "Correspondent_bank", "Direct_debit", "Mandate", "SEPA",
+    "Corporate_action", "Dividend", "Collateral", "Margin",
+    "FX_spot", "NDF", "Letter_of_credit", "Trade_finance"
+]
+
+
 def generate_comprehensive_example():
     """Generate a comprehensive 200-step treasury operations example."""
 
-    # All ISO 20022 message types to use (~100 unique types)
-    message_catalog = {
-        # Payment Initiation (pain.*)
-        "pain.001": "CustomerCreditTransferInitiation",
-        "pain.002": "CustomerPaymentStatusReport",
-        "pain.007": "CustomerPaymentReversal",
-        "pain.008": "CustomerDirectDebitInitiation",
-        "pain.009": "MandateInitiationRequest",
-        "pain.010": "MandateAmendmentRequest",
-        "pain.011": "MandateCancellationRequest",
-        "pain.012": "MandateAcceptanceReport",
-        "pain.013": "CreditorPaymentActivationRequest",
-        "pain.014": "CreditorPaymentActivationRequestStatusReport",
-
-        # Payments Clearing & Settlement (pacs.*)
-        "pacs.002": "FIToFIPaymentStatusReport",
-        "pacs.003": "FIToFICustomerDirectDebit",
-        "pacs.004": "PaymentReturn",
-        "pacs.007": "FIToFIPaymentReversal",
-        "pacs.008": "FIToFICustomerCreditTransfer",
-        "pacs.009": "FinancialInstitutionCreditTransfer",
-        "pacs.010": "FinancialInstitutionDirectDebit",
-        "pacs.028": "FIToFIPaymentStatusRequest",
-
-        # Cash Management (camt.*)
-        "camt.026": "UnableToApply",
-        "camt.027": "ClaimNonReceipt",
-        "camt.028": "AdditionalPaymentInformation",
-        "camt.029": "ResolutionOfInvestigation",
-        "camt.030": "NotificationOfCaseAssignment",
-        "camt.052": "BankToCustomerAccountReport",
-        "camt.053": "BankToCustomerStatement",
-        "camt.054": "BankToCustomerDebitCreditNotification",
-        "camt.055": "CustomerPaymentCancellationRequest",
-        "camt.056": "FIToFIPaymentCancellationRequest",
-        "camt.057": "NotificationToReceive",
-        "camt.058": "NotificationToReceiveCancellationAdvice",
-        "camt.059": "NotificationToReceiveStatusReport",
-        "camt.060": "AccountReportingRequest",
-
-        # Account Management (acmt.*)
-        "acmt.001": "AccountOpeningInstruction",
-        "acmt.002": "AccountDetailsConfirmation",
-        "acmt.003": "AccountModificationInstruction",
-        "acmt.007": "AccountOpeningRequest",
-        "acmt.009": "AccountOpeningAdditionalInformationRequest",
-        "acmt.010": "AccountRequestAcknowledgement",
-        "acmt.014": "AccountReport",
-        "acmt.022": "IdentificationModificationAdvice",
-        "acmt.023": "IdentificationVerificationRequest",
-        "acmt.024": "IdentificationVerificationReport",
-
-        # Securities Settlement (sese.*)
-        "sese.001": "TransferOutInstruction",
-        "sese.003": "TransferOutConfirmation",
-        "sese.005": "TransferInInstruction",
-        "sese.007": "TransferInConfirmation",
-        "sese.011": "TransferInstructionStatusReport",
-        "sese.020": "SecuritiesTransactionCancellationRequest",
-        "sese.023": "SecuritiesSettlementTransactionInstruction",
-        "sese.024": "SecuritiesSettlementTransactionStatusAdvice",
-        "sese.025": "SecuritiesSettlementTransactionConfirmation",
-        "sese.033": "SecuritiesFinancingInstruction",
-        "sese.034": "SecuritiesFinancingConfirmation",
-
-        # Securities Management (semt.*)
-        "semt.002": "CustodyStatementOfHoldings",
-        "semt.003": "AccountingStatementOfHoldings",
-        "semt.013": "IntraPositionMovementInstruction",
-        "semt.015": "IntraPositionMovementConfirmation",
-        "semt.017": "SecuritiesTransactionPostingReport",
-        "semt.018": "SecuritiesTransactionPendingReport",
-        "semt.021": "SecuritiesStatementQuery",
-        "semt.022": "SecuritiesSettlementTransactionAuditTrailReport",
-
-        # Corporate Actions (seev.*)
-        "seev.001": "MeetingNotification",
-        "seev.004": "MeetingInstruction",
-        "seev.006": "MeetingInstructionStatus",
-        "seev.031": "CorporateActionNotification",
-        "seev.033": "CorporateActionInstruction",
-        "seev.034": "CorporateActionInstructionStatusAdvice",
-        "seev.035": "CorporateActionMovementPreliminaryAdvice",
-        "seev.036": "CorporateActionMovementConfirmation",
-        "seev.042": "CorporateActionInstructionStatementReport",
-
-        # Treasury (trea.*)
-        "trea.001": "CreateNonDeliverableForwardOpeningNotification",
-        "trea.007": "NonDeliverableForwardNotificationStatus",
-        "trea.009": "StatusNotification",
-        "trea.012": "ForeignExchangeTradeConfirmation",
-
-        # Foreign Exchange (fxtr.*)
-        "fxtr.008": "ForeignExchangeTradeInstruction",
-        "fxtr.013": "ForeignExchangeTradeStatusNotification",
-        "fxtr.015": "ForeignExchangeTradeConfirmationRequest",
-        "fxtr.030": "ForeignExchangeTradeConfirmation",
-
-        # Collateral Management (colr.*)
-        "colr.003": "MarginCallRequest",
-        "colr.004": "MarginCallResponse",
-        "colr.007": "CollateralProposal",
-        "colr.008": "CollateralProposalResponse",
-        "colr.012": "CollateralValueReport",
-        "colr.016": "CollateralAndExposureReport",
-
-        # Trade Services (tsmt.*)
-        "tsmt.001": "Acknowledgement",
-        "tsmt.013": "DataSetMatchReport",
-        "tsmt.014": "DataSetSubmission",
-        "tsmt.017": "FullPushThroughReport",
-        "tsmt.018": "InitialBaselineSubmission",
-        "tsmt.044": "IntentToPayNotification",
-        "tsmt.049": "SpecialNotification",
-
-        # Card Acceptor (caaa.*)
-        "caaa.001": "AcceptorAuthorisationRequest",
-        "caaa.002": "AcceptorAuthorisationResponse",
-        "caaa.003": "AcceptorCompletionAdvice",
-        "caaa.004": "AcceptorCompletionAdviceResponse",
-        "caaa.005": "AcceptorCancellationRequest",
-        "caaa.006": "AcceptorCancellationResponse",
-        "caaa.009": "AcceptorReconciliationRequest",
-        "caaa.010": "AcceptorReconciliationResponse",
-        "caaa.011": "AcceptorBatchTransfer",
-        "caaa.012": "AcceptorBatchTransferResponse",
-        "caaa.016": "AcceptorCurrencyConversionRequest",
-        "caaa.017": "AcceptorCurrencyConversionResponse",
-
-        # Card Issuer (cain.*)
-        "cain.001": "AcquirerAuthorisationRequest",
-        "cain.002": "AcquirerAuthorisationResponse",
-        "cain.003": "AcquirerCompletionAdvice",
-        "cain.004": "AcquirerCompletionAdviceResponse",
-
-        # ATM Management (catm.*)
-        "catm.001": "StatusReport",
-        "catm.002": "ManagementPlanReplacement",
-        "catm.003": "AcceptorConfigurationUpdate",
-
-        # ATM Transactions (catp.*)
-        "catp.001": "ATMWithdrawalRequest",
-        "catp.002": "ATMWithdrawalResponse",
-        "catp.003": "ATMWithdrawalCompletionAdvice",
-        "catp.004": "ATMWithdrawalCompletionAcknowledgement",
-        "catp.006": "ATMInquiryRequest",
-        "catp.007": "ATMInquiryResponse",
-
-        # Administration (admi.*)
-        "admi.002": "Resend",
-        "admi.004": "SystemEventNotification",
-        "admi.005": "ReportQueryRequest",
-        "admi.006": "ReportQueryResponse",
-        "admi.007": "ReceiptAcknowledgement",
-        "admi.011": "SystemEventAcknowledgement",
-
-        # Authorities (auth.*)
-        "auth.018": "ContractRegistrationRequest",
-        "auth.019": "ContractRegistrationConfirmation",
-        "auth.024": "PaymentRegulatoryInformationNotification",
-        "auth.027": "CurrencyControlStatusAdvice",
-
-        # Reference Data (reda.*)
-        "reda.016": "PartyStatusAdvice",
-        "reda.017": "PartyModificationRequest",
-        "reda.041": "StandingSettlementInstructionCreationRequest",
-        "reda.057": "StandingSettlementInstructionReport",
-    }
-
     steps = []
 
     # Define step templates for each phase
@@ -416,45 +468,12 @@ def generate_comprehensive_example():
         "title": "Global Corporate Treasury Operations - Full Day Lifecycle",
         "difficulty": "advanced",
         "category": "treasury",
-        "characters": {
-            "treasury": {"name": "GlobalCorp Treasury", "role": "Corporate Treasury", "country": "USA", "bank": "JP Morgan"},
-            "us_sub": {"name": "GlobalCorp US", "role": "US Operations", "country": "USA", "bank": "Wells Fargo"},
-            "eu_sub": {"name": "GlobalCorp EU", "role": "European Operations", "country": "Germany", "bank": "Deutsche Bank"},
-            "asia_sub": {"name": "GlobalCorp Asia", "role": "Asian Operations", "country": "Singapore", "bank": "DBS Bank"},
-            "uk_sub": {"name": "GlobalCorp UK", "role": "UK Operations", "country": "UK", "bank": "Barclays"},
-            "custodian": {"name": "State Street", "role": "Global Custodian", "country": "USA", "bank": "State Street"},
-            "csd_eu": {"name": "Euroclear", "role": "EU Central Securities Depository", "country": "Belgium", "bank": "Euroclear"},
-            "clearing_us": {"name": "Federal Reserve", "role": "US Clearing System", "country": "USA", "bank": "Fed"},
-            "clearing_eu": {"name": "TARGET2", "role": "EU Clearing System", "country": "EU", "bank": "ECB"},
-            "fx_dealer": {"name": "CitiFX", "role": "FX Dealer", "country": "UK", "bank": "Citibank"},
-            "broker": {"name": "Goldman Sachs", "role": "Prime Broker", "country": "USA", "bank": "Goldman Sachs"},
-            "card_network": {"name": "Visa", "role": "Card Network", "country": "USA", "bank": "Visa"},
-            "atm": {"name": "ATM Network", "role": "ATM Service", "country": "USA", "bank": "ATM Provider"}
-        },
+        "characters": CHARACTERS,
         "scenario": "A comprehensive full-day simulation of GlobalCorp's treasury operations across multiple time zones. Starting with Asia-Pacific morning liquidity management, through European midday trading, to US afternoon settlements. Covers payment initiation, FX trading, securities settlement, card processing, corporate actions, collateral management, and regulatory reporting. Demonstrates how ISO 20022 messages orchestrate complex multi-entity financial operations.",
         "steps": steps,
-        "possible_errors": [
-            {"error_code": "AC01", "scenario": "IBAN incorrect in supplier payment", "result": "Payment returned to GlobalCorp", "message_type": "pacs.004"},
-            {"error_code": "AC04", "scenario": "Account closed at beneficiary bank", "result": "Payment returned, need new details", "message_type": "pacs.004"},
-            {"error_code": "AM04", "scenario": "Insufficient funds for wire payment", "result": "Payment rejected at initiation", "message_type": "pain.002"},
-            {"error_code": "AM05", "scenario": "Duplicate payment detected", "result": "Second payment rejected", "message_type": "pain.002"},
-            {"error_code": "BE04", "scenario": "Beneficiary address missing", "result": "Payment returned for correction", "message_type": "pacs.004"},
-            {"error_code": "FF01", "scenario": "Invalid file format in batch", "result": "Entire batch rejected", "message_type": "pain.002"},
-            {"error_code": "MD01", "scenario": "No mandate for direct debit", "result": "Collection returned unpaid", "message_type": "pacs.004"},
-            {"error_code": "RC01", "scenario": "Invalid BIC in payment", "result": "Payment cannot be routed", "message_type": "pacs.002"},
-            {"error_code": "RR04", "scenario": "Regulatory reason - sanctions", "result": "Payment blocked for review", "message_type": "pacs.002"},
-            {"error_code": "AG01", "scenario": "Transaction forbidden", "result": "Payment rejected by compliance", "message_type": "pacs.002"},
-            {"error_code": "DUPL", "scenario": "Duplicate instruction detected", "result": "Second instruction rejected", "message_type": "pacs.002"},
-            {"error_code": "TECH", "scenario": "Technical problem at clearing", "result": "Retry required", "message_type": "admi.002"}
-        ],
+        "possible_errors": POSSIBLE_ERRORS,
         "related_messages": unique_messages,
-        "related_terms": [
-            "UETR", "IBAN", "BIC", "SWIFT", "TARGET2", "CHIPS", "Fedwire", "ACH",
-            "DVP", "RTGS", "CSD", "Custodian", "Clearing", "Settlement",
-            "Nostro", "Correspondent_bank", "Direct_debit", "Mandate", "SEPA",
-            "Corporate_action", "Dividend", "Collateral", "Margin",
-            "FX_spot", "NDF", "Letter_of_credit", "Trade_finance"
-        ],
+        "related_terms": RELATED_TERMS,
         "key_takeaways": [
             "Global treasury operations span multiple time zones requiring 24-hour coverage",
             "ISO 20022 provides a unified messaging standard across all financial domains",
@@ -473,40 +492,57 @@ def generate_comprehensive_example():
     return example
 
 def main():
-    file_path = '/Users/oneworkspace/vscode/tools/mx-error-guide/frontend/public/data/real_world_examples.json'
-
-    try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-
-        new_example = generate_comprehensive_example()
-
-        # Check if example already exists
-        existing_ids = [ex['id'] for ex in data['examples']]
-        if new_example['id'] in existing_ids:
-            print(f"Example '{new_example['id']}' already exists. Updating it.")
-            for i, ex in enumerate(data['examples']):
-                if ex['id'] == new_example['id']:
-                    data['examples'][i] = new_example
-                    break
-        else:
-            data['examples'].append(new_example)
-            data['metadata']['example_count'] = len(data['examples'])
-
-        data['metadata']['last_updated'] = datetime.now().strftime("%Y-%m-%d")
-
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
-
-        print(f"Successfully added example with {len(new_example['steps'])} steps.")
-        print(f"Unique message types: {len(new_example['related_messages'])}")
-        print(f"Message types: {', '.join(new_example['related_messages'][:15])}...")
-        print(f"Total examples now: {data['metadata']['example_count']}")
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', default=dataset_path('examples'), help='Examples file to add the example to')
+    add_arguments(parser)
+    args = parser.parse_args()
+    file_path = args.output
+
+    if not os.path.exists(file_path):
+        print(f"File not found: {file_path}")
+        return 1
+
+    with Trace.from_args('generate_large_example', args) as trace:
+        with trace.span('load') as span:
+            span.read(file_path)
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            span.count(records=len(data['examples']))
+
+        with trace.span('generate') as span:
+            new_example = generate_comprehensive_example()
+            span.count(records=len(new_example['steps']))
+
+        with trace.span('transform') as span:
+            # Check if example already exists
+            existing_ids = [ex['id'] for ex in data['examples']]
+            if new_example['id'] in existing_ids:
+                print(f"Example '{new_example['id']}' already exists. Updating it.")
+                for i, ex in enumerate(data['examples']):
+                    if ex['id'] == new_example['id']:
+                        data['examples'][i] = new_example
+                        break
+            else:
+                data['examples'].append(new_example)
+                data['metadata']['example_count'] = len(data['examples'])
+
+            data['metadata']['last_updated'] = datetime.now().strftime("%Y-%m-%d")
+            span.count(records=len(data['examples']))
+
+        with trace.span('write') as span:
+            # Same layout and escaping as merge_data.py, so the two writers
+            # leave each other's output unchanged.
+            header = {key: None if key == 'examples' else value for key, value in data.items()}
+            write_document(file_path, header, 'examples', data['examples'])
+            span.wrote(file_path)
+            span.count(records=len(data['examples']))
+
+    print(f"Successfully added example with {len(new_example['steps'])} steps.")
+    print(f"Unique message types: {len(new_example['related_messages'])}")
+    print(f"Message types: {', '.join(new_example['related_messages'][:15])}...")
+    print(f"Total examples now: {data['metadata']['example_count']}")
+    return 0
 
-    except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Timing and memory instrumentation shared by the data scripts.
+
+A script opens a Trace and wraps its phases in spans:
+
+    trace = Trace.from_args('merge_complex', args)
+    with trace:
+        with trace.span('load') as span:
+            span.read(path)
+            span.count(records=len(records))
+
+Each span records wall and CPU time, the process's peak RSS when it ended
+and how much the span raised that peak, plus whatever counts the script
+adds (records, bytes_read, bytes_written, ...). Spans nest; a nested span's
+path is "outer/inner". Leaving the ``with trace`` block writes the trace as
+JSON (also when the script failed, with the error recorded), to --trace or
+to $DATA_TRACE_DIR/<script>.json, which build.py sets for every stage. Keys
+and span order are stable, so two traces of the same script diff cleanly;
+``diff`` below prints the change per span.
+
+``--profile SPAN`` (repeatable, "*" for every top-level span) runs that span
+under cProfile, writes <trace>.<span>.prof next to the trace for pstats or
+snakeviz and lists the hottest functions in the span itself.
+
+Usage:
+    python scripts/merge_complex.py --trace .cache/merge.json --profile write
+    python scripts/instrument.py show .cache/traces/merge_complex.json
+    python scripts/instrument.py diff old.json new.json
+"""
+
+import argparse
+import cProfile
+import json
+import os
+import platform
+import pstats
+import sys
+import time
+from datetime import datetime, timezone
+
+from datasets import write_bytes_atomic
+
+try:
+    import resource
+except ImportError:  # not on Windows: peak RSS is reported as null
+    resource = None
+
+TRACE_DIR_ENV = 'DATA_TRACE_DIR'
+HOT_FUNCTIONS = 15
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process so far, in KB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes.
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def file_size(path):
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+def hot_functions(profiler, limit=HOT_FUNCTIONS):
+    """The functions with the most cumulative time, as JSON-friendly rows."""
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, func), (_, calls, own, cumulative, _) in stats.stats.items():
+        # Leave out the span bookkeeping itself.
+        if filename == __file__ or func == "<method 'disable' of '_lsprof.Profiler' objects>":
+            continue
+        rows.append({
+            'function': f'{os.path.basename(filename)}:{line}({func})',
+            'calls': calls,
+            'own_s': round(own, 4),
+            'cumulative_s': round(cumulative, 4),
+        })
+    rows.sort(key=lambda row: row['cumulative_s'], reverse=True)
+    return rows[:limit]
+
+
+class Span:
+    """One timed phase; counts accumulate with count(), read() and wrote()."""
+
+    def __init__(self, path):
+        self.path = path
+        self.counts = {}
+
+    def count(self, **counts):
+        for key, value in counts.items():
+            self.counts[key] = self.counts.get(key, 0) + value
+        return self
+
+    def read(self, *paths):
+        """Add the size of files this span read to bytes_read."""
+        return self.count(bytes_read=sum(file_size(path) for path in paths))
+
+    def wrote(self, *paths):
+        """Add the size of files this span wrote to bytes_written."""
+        return self.count(bytes_written=sum(file_size(path) for path in paths))
+
+
+class Trace:
+    """Collects spans for one script run and writes them as a JSON trace."""
+
+    def __init__(self, script, path=None, profile=()):
+        self.script = script
+        self.path = path
+        self.profile = set(profile)
+        self.spans = []
+        self.stack = []
+        self.profiling = False
+        self.started = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.process_time()
+        self.status = 'ok'
+        self.error = None
+
+    @classmethod
+    def from_args(cls, script, args):
+        """A trace configured by add_arguments() options or $DATA_TRACE_DIR."""
+        path = getattr(args, 'trace', None)
+        if not path and os.environ.get(TRACE_DIR_ENV):
+            path = os.path.join(os.environ[TRACE_DIR_ENV], f'{script}.json')
+        return cls(script, path, getattr(args, 'profile', None) or ())
+
+    def span(self, name, **counts):
+        return _SpanContext(self, name, counts)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.status = 'error'
+            self.error = f'{exc_type.__name__}: {exc}'
+        self.write()
+        return False
+
+    def to_dict(self):
+        return {
+            'script': self.script,
+            'argv': sys.argv[1:],
+            'started': self.started,
+            'python': platform.python_version(),
+            'status': self.status,
+            'error': self.error,
+            'wall_s': round(time.perf_counter() - self.start_wall, 4),
+            'cpu_s': round(time.process_time() - self.start_cpu, 4),
+            'peak_rss_kb': peak_rss_kb(),
+            'spans': self.spans,
+        }
+
+    def write(self):
+        """Write the trace if a path is configured; returns the path or None."""
+        if not self.path:
+            return None
+        payload = json.dumps(self.to_dict(), indent=2, ensure_ascii=False) + '\n'
+        write_bytes_atomic(self.path, payload.encode('utf-8'))
+        return self.path
+
+    def profile_path(self, span_path):
+        base = self.path[:-len('.json')] if self.path and self.path.endswith('.json') else self.path
+        return f"{base or self.script}.{span_path.replace('/', '.')}.prof"
+
+
+class _SpanContext:
+
+    def __init__(self, trace, name, counts):
+        self.trace = trace
+        self.span = Span(f'{trace.stack[-1].path}/{name}' if trace.stack else name)
+        self.span.count(**counts)
+        self.profiler = None
+
+    def __enter__(self):
+        trace = self.trace
+        wanted = self.span.path in trace.profile or ('*' in trace.profile and not trace.stack)
+        # cProfile cannot nest, so an inner span of a profiled one is only timed.
+        if wanted and not trace.profiling:
+            self.profiler = cProfile.Profile()
+            trace.profiling = True
+        trace.stack.append(self.span)
+        # Reserve the slot now so spans are listed in start order.
+        self.index = len(trace.spans)
+        trace.spans.append(None)
+        self.start_rss = peak_rss_kb()
+        self.start_cpu = time.process_time()
+        self.start_wall = time.perf_counter()
+        if self.profiler:
+            self.profiler.enable()
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.profiler:
+            self.profiler.disable()
+        wall = time.perf_counter() - self.start_wall
+        cpu = time.process_time() - self.start_cpu
+        trace = self.trace
+        trace.stack.pop()
+        peak = peak_rss_kb()
+        entry = {
+            'name': self.span.path,
+            'wall_s': round(wall, 4),
+            'cpu_s': round(cpu, 4),
+            'peak_rss_kb': peak,
+            'rss_growth_kb': None if peak is None else peak - self.start_rss,
+        }
+        entry.update(sorted(self.span.counts.items()))
+        if exc_type is not None:
+            entry['error'] = f'{exc_type.__name__}: {exc}'
+        if self.profiler:
+            trace.profiling = False
+            if trace.path:
+                entry['profile'] = trace.profile_path(self.span.path)
+                os.makedirs(os.path.dirname(os.path.abspath(entry['profile'])), exist_ok=True)
+                self.profiler.dump_stats(entry['profile'])
+            entry['hot'] = hot_functions(self.profiler)
+        trace.spans[self.index] = entry
+        return False
+
+
+def add_arguments(parser):
+    """Add the shared --trace and --profile options to a script's parser."""
+    parser.add_argument('--trace', help=f'Write a timing/memory trace here (default: ${TRACE_DIR_ENV}/<script>.json)')
+    parser.add_argument(
+        '--profile', action='append', metavar='SPAN',
+        help='Run this span under cProfile ("*" for every top-level span); repeatable',
+    )
+
+
+SPAN_FIELDS = ('name', 'wall_s', 'cpu_s', 'peak_rss_kb', 'rss_growth_kb', 'error', 'profile', 'hot')
+
+
+def counts(span):
+    """The script-defined counts of a span entry, in key order."""
+    return [key for key in span if key not in SPAN_FIELDS]
+
+
+def format_bytes(value):
+    return f'{value / 1024 / 1024:.1f} MB' if value >= 1024 * 1024 else f'{value / 1024:.1f} KB'
+
+
+def show(trace):
+    print(f"{trace['script']} ({trace['status']}) {trace['wall_s']:.3f}s wall, {trace['cpu_s']:.3f}s CPU, "
+          f"peak RSS {trace['peak_rss_kb'] or 0:,} KB")
+    if trace.get('error'):
+        print(f"  {trace['error']}")
+    for span in trace['spans']:
+        extras = []
+        for key in counts(span):
+            extras.append(f"{key} {format_bytes(span[key]) if key.startswith('bytes') else f'{span[key]:,}'}")
+        print(f"  {span['name']:<24} {span['wall_s']:9.3f}s {span['cpu_s']:9.3f}s cpu  "
+              f"+{span['rss_growth_kb'] or 0:>8,} KB  {', '.join(extras)}")
+        for row in span.get('hot', [])[:5]:
+            print(f"      {row['cumulative_s']:9.3f}s  {row['function']}")
+
+
+def diff(old, new):
+    """Print per-span changes between two traces of the same script."""
+    print(f"{new['script']}: wall {old['wall_s']:.3f}s -> {new['wall_s']:.3f}s, "
+          f"peak RSS {old['peak_rss_kb'] or 0:,} -> {new['peak_rss_kb'] or 0:,} KB")
+    before = {span['name']: span for span in old['spans']}
+    after = {span['name']: span for span in new['spans']}
+    names = [span['name'] for span in new['spans']] + [name for name in before if name not in after]
+    for name in names:
+        a, b = before.get(name), after.get(name)
+        if a is None or b is None:
+            print(f"  {name:<24} {'added' if a is None else 'removed'}")
+            continue
+        changes = []
+        for key in ['wall_s', 'cpu_s', 'rss_growth_kb'] + sorted(set(counts(a)) | set(counts(b))):
+            x, y = a.get(key), b.get(key)
+            if x is None or y is None or x == y:
+                continue
+            pct = f' ({(y - x) / x:+.0%})' if x else ''
+            changes.append(f'{key} {x:,} -> {y:,}{pct}')
+        print(f"  {name:<24} {'; '.join(changes) or 'unchanged'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+    show_parser = sub.add_parser('show', help='Summarize a trace')
+    show_parser.add_argument('trace')
+    diff_parser = sub.add_parser('diff', help='Compare two traces span by span')
+    diff_parser.add_argument('old')
+    diff_parser.add_argument('new')
+    args = parser.parse_args()
+
+    if args.command == 'show':
+        with open(args.trace, 'r', encoding='utf-8') as f:
+            show(json.load(f))
+    else:
+        with open(args.old, 'r', encoding='utf-8') as f:
+            old = json.load(f)
+        with open(args.new, 'r', encoding='utf-8') as f:
+            new = json.load(f)
+        diff(old, new)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Localhost lookup service for the errors catalogue (stdlib asyncio HTTP).
+
+Endpoints (JSON in and out):
+    GET  /health                          dataset version, record count, load time
+    GET  /errors/<code>                   one error
+    GET  /message-types/<type>/errors     errors that can occur in a message type
+    POST /errors/batch                    {"codes": [...], "message_types": [...]}
+                                          -> {"errors": {code: ...}, "message_types":
+                                              {type: [codes]}, "missing": [...]}
+
+By default errors carry the enrichment fields (code, name, category,
+severity, description, common_causes, how_to_fix); ``?fields=all`` or
+``?fields=code,name`` selects others. The index is built once at startup,
+serialized responses are kept in a bounded LRU cache, and errors.json is
+polled for changes: a new index is built off the event loop and swapped in
+atomically, so in-flight requests finish against the old one.
+
+The service only binds loopback addresses.
+
+Usage:
+    python scripts/lookup_service.py [--port 8720] [--cache-size 4096]
+    curl localhost:8720/errors/AC04
+    curl -d '{"codes": ["AC04", "AM04"]}' localhost:8720/errors/batch
+"""
+
+import argparse
+import asyncio
+import ipaddress
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from datasets import dataset_path, load_json
+
+DEFAULT_FIELDS = ('code', 'name', 'category', 'severity', 'description', 'common_causes', 'how_to_fix')
+MAX_BATCH = 10000
+MAX_BODY = 1024 * 1024
+HEADER_LIMIT = 16 * 1024
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large'}
+
+
+class Catalogue:
+    """Immutable in-memory index over one version of errors.json."""
+
+    def __init__(self, path):
+        stat = os.stat(path)
+        self.signature = (stat.st_mtime_ns, stat.st_size)
+        data = load_json(path)
+        errors = data.get('errors') if isinstance(data, dict) else None
+        if not isinstance(errors, list):
+            raise ValueError(f'{path} has no errors list')
+        for index, error in enumerate(errors):
+            if not isinstance(error, dict) or not isinstance(error.get('code'), str):
+                raise ValueError(f'errors[{index}] has no code')
+            message_types = error.get('message_types', [])
+            if not isinstance(message_types, list) or not all(isinstance(t, str) for t in message_types):
+                raise ValueError(f"errors[{index}] ({error['code']}) message_types is not a list of strings")
+        self.version = data.get('version')
+        self.loaded_at = time.time()
+        self.by_code = {error['code'].upper(): error for error in errors}
+        self.by_message_type = {}
+        for error in errors:
+            for message_type in error.get('message_types', []):
+                self.by_message_type.setdefault(message_type.lower(), []).append(error['code'])
+
+
+class LRUCache:
+    """Bounded mapping of request key -> serialized response body."""
+
+    def __init__(self, size):
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        body = self.entries.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def put(self, key, body):
+        self.entries[key] = body
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def encode(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def project(error, fields):
+    if fields is None:
+        return error
+    return {field: error[field] for field in fields if field in error}
+
+
+def parse_fields(query):
+    value = parse_qs(query).get('fields', [None])[0]
+    if value is None:
+        return DEFAULT_FIELDS
+    if value == 'all':
+        return None
+    return tuple(field for field in value.split(',') if field)
+
+
+class LookupService:
+    def __init__(self, path, cache_size, poll_seconds):
+        self.path = path
+        self.poll_seconds = poll_seconds
+        self.catalogue = Catalogue(path)
+        self.cache = LRUCache(cache_size)
+        self.reloads = 0
+
+    async def watch(self):
+        """Poll the dataset and swap in a freshly built index when it changes."""
+        loop = asyncio.get_running_loop()
+        rejected = None
+        while True:
+            await asyncio.sleep(self.poll_seconds)
+            signature = None
+            try:
+                stat = os.stat(self.path)
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if signature in (self.catalogue.signature, rejected):
+                    continue
+                catalogue = await loop.run_in_executor(None, Catalogue, self.path)
+            except Exception as exc:
+                # Half-written or invalid file: keep serving the current index
+                # and keep polling; an escaping error would end the watcher.
+                # Each bad version of the file is reported once.
+                rejected = signature
+                print(f"Reload skipped: {type(exc).__name__}: {exc}", file=sys.stderr)
+                continue
+            self.catalogue = catalogue
+            self.cache = LRUCache(self.cache.size)
+            self.reloads += 1
+            print(f"Reloaded {self.path}: {len(catalogue.by_code)} errors (version {catalogue.version})")
+
+    def route(self, method, target, body):
+        """Return the serialized response body for one request."""
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.strip('/').split('/') if part]
+        catalogue = self.catalogue
+
+        if parts == ['health']:
+            return encode({
+                'version': catalogue.version,
+                'errors': len(catalogue.by_code),
+                'loaded_at': catalogue.loaded_at,
+                'reloads': self.reloads,
+                'cache': {'entries': len(self.cache.entries), 'hits': self.cache.hits, 'misses': self.cache.misses},
+            })
+
+        fields = parse_fields(url.query)
+        if method == 'GET':
+            if len(parts) == 2 and parts[0] == 'errors':
+                key = ('error', parts[1].upper(), fields)
+            elif len(parts) == 3 and parts[0] == 'message-types' and parts[2] == 'errors':
+                key = ('type', parts[1].lower(), fields)
+            else:
+                raise HttpError(404, 'Unknown endpoint')
+        elif method == 'POST' and parts == ['errors', 'batch']:
+            try:
+                request = json.loads(body or b'{}')
+            except (ValueError, RecursionError):
+                # RecursionError: nesting deeper than the json module handles.
+                raise HttpError(400, 'Body must be JSON')
+            if not isinstance(request, dict):
+                raise HttpError(400, 'Body must be a JSON object')
+            codes = request.get('codes', [])
+            message_types = request.get('message_types', [])
+            if not isinstance(codes, list) or not isinstance(message_types, list):
+                raise HttpError(400, 'codes and message_types must be lists')
+            if len(codes) + len(message_types) > MAX_BATCH:
+                raise HttpError(413, f'At most {MAX_BATCH} keys per batch')
+            key = ('batch', tuple(str(c).upper() for c in codes), tuple(str(t).lower() for t in message_types), fields)
+        else:
+            raise HttpError(404 if method in ('GET', 'POST') else 405, 'Unsupported request')
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        if key[0] == 'error':
+            error = catalogue.by_code.get(key[1])
+            if error is None:
+                raise HttpError(404, f'Unknown code {parts[1]}')
+            payload = encode(project(error, fields))
+        elif key[0] == 'type':
+            codes = catalogue.by_message_type.get(key[1])
+            if codes is None:
+                raise HttpError(404, f'Unknown message type {parts[1]}')
+            payload = encode([project(catalogue.by_code[c.upper()], fields) for c in codes])
+        else:
+            found = {}
+            missing = []
+            for code in key[1]:
+                error = catalogue.by_code.get(code)
+                if error is None:
+                    missing.append(code)
+                else:
+                    found[error['code']] = project(error, fields)
+            by_type = {}
+            for message_type in key[2]:
+                if message_type in catalogue.by_message_type:
+                    by_type[message_type] = catalogue.by_message_type[message_type]
+                else:
+                    missing.append(message_type)
+            payload = encode({'errors': found, 'message_types': by_type, 'missing': missing})
+
+        # Only cache against the index the response was built from.
+        if catalogue is self.catalogue:
+            self.cache.put(key, payload)
+        return payload
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    await self.respond(writer, 400, encode({'error': 'Headers too large'}), False)
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    await self.respond(writer, 400, encode({'error': 'Malformed request line'}), False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(':')
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+
+                keep_alive = (
+                    headers.get('connection', '').lower() != 'close'
+                    if version == 'HTTP/1.1'
+                    else headers.get('connection', '').lower() == 'keep-alive'
+                )
+                length = headers.get('content-length') or '0'
+                # Digits only: int() would also take signs, spaces and
+                # underscores, and a negative length must not reach the read.
+                if not (length.isascii() and length.isdigit()):
+                    await self.respond(writer, 400, encode({'error': 'Invalid Content-Length'}), False)
+                    break
+                length = int(length)
+                if length > MAX_BODY:
+                    await self.respond(writer, 413, encode({'error': 'Body too large'}), False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                try:
+                    status, payload = 200, self.route(method, target, body)
+                except HttpError as exc:
+                    status, payload = exc.status, encode({'error': str(exc)})
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, payload, keep_alive):
+        writer.write(
+            f'HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n'
+            'Content-Type: application/json; charset=utf-8\r\n'
+            f'Content-Length: {len(payload)}\r\n'
+            f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode('latin-1')
+            + payload
+        )
+        await writer.drain()
+
+
+def is_loopback(host):
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+async def serve(args):
+    service = LookupService(args.errors, args.cache_size, args.poll)
+    server = await asyncio.start_server(service.handle, args.host, args.port, limit=HEADER_LIMIT)
+    watcher = asyncio.create_task(service.watch())
+    print(
+        f"Serving {len(service.catalogue.by_code)} errors on http://{args.host}:{args.port} "
+        f"(cache {args.cache_size}, reload poll {args.poll}s)"
+    )
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        watcher.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1', help='Loopback address to bind')
+    parser.add_argument('--port', type=int, default=8720)
+    parser.add_argument('--errors', default=dataset_path('errors'), help='errors.json to serve')
+    parser.add_argument('--cache-size', type=int, default=4096, help='Max cached responses')
+    parser.add_argument('--poll', type=float, default=2.0, help='Seconds between file change checks')
+    args = parser.parse_args()
+
+    if not is_loopback(args.host):
+        print(f"Refusing to bind non-loopback address {args.host}")
+        return 1
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,49 +1,39 @@
-import json
+#!/usr/bin/env python3
+"""
+Merge complex_examples.json into real_world_examples.json, then remove it.
+
+Thin wrapper over merge_data.py with the keep-first policy. --trace records
+the resolve, header and write passes (see instrument.py).
+"""
+
+import argparse
 import os
+import sys
+
+from datasets import DATA_DIR
+from instrument import Trace, add_arguments
+from merge_data import merge
 
-base_path = 'frontend/public/data'
-main_file = os.path.join(base_path, 'real_world_examples.json')
-new_file = os.path.join(base_path, 'complex_examples.json')
+new_file = os.path.join(DATA_DIR, 'complex_examples.json')
 
-def load_json(path):
-    with open(path, 'r') as f:
-        return json.load(f)
 
-def save_json(path, data):
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_arguments(parser)
+    args = parser.parse_args()
 
-try:
     if not os.path.exists(new_file):
         print(f"File not found: {new_file}")
-        exit(1)
-
-    main_data = load_json(main_file)
-    new_data = load_json(new_file)
-    
-    existing_ids = set(e['id'] for e in main_data['examples'])
-    added_count = 0
-    
-    for example in new_data:
-        if example['id'] not in existing_ids:
-            main_data['examples'].append(example)
-            existing_ids.add(example['id'])
-            added_count += 1
-            
-    # Update metadata
-    main_data['metadata']['example_count'] = len(main_data['examples'])
-    
-    # Update categories list
-    all_categories = set(main_data['metadata']['categories'])
-    for ex in new_data:
-        all_categories.add(ex['category'])
-    main_data['metadata']['categories'] = sorted(list(all_categories))
-    
-    save_json(main_file, main_data)
-    print(f"Successfully added {added_count} complex examples. Total: {main_data['metadata']['example_count']}")
-    
+        return 1
+
+    with Trace.from_args('merge_complex', args) as trace:
+        stats = merge('examples', [new_file], policy='keep-first', trace=trace)
+    print(f"Successfully added {stats['added']} complex examples. Total: {stats['total']}")
+
     # Remove the temp file
     os.remove(new_file)
+    return 0
+
 
-except Exception as e:
-    print(f"Error: {e}")
+if __name__ == '__main__':
+    sys.exit(main())
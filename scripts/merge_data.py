@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Streaming merge of record files into one of the published datasets.
+
+Records are read with an incremental JSON parser and written straight to a
+temp file that replaces the dataset atomically, so memory stays proportional
+to the number of ids rather than the size of the data. Inputs may be bare
+JSON arrays or full dataset documents.
+
+Conflict policies (records are matched on the dataset's id field):
+    keep-first  the earliest occurrence wins (base file, then inputs in order)
+    last-wins   the latest occurrence wins but keeps the earliest position
+
+Usage:
+    python scripts/merge_data.py examples complex_examples.json [more.json ...]
+    python scripts/merge_data.py errors scraped.json --policy last-wins
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+
+from datasets import DATASETS, dataset_path, iter_records, read_header, write_document
+from instrument import Trace, add_arguments
+
+POLICIES = ('keep-first', 'last-wins')
+
+
+class OverrideSpool:
+    """Disk-backed store for records that replace an earlier occurrence."""
+
+    def __init__(self):
+        fd, self.path = tempfile.mkstemp(prefix='merge-spool-', suffix='.sqlite')
+        os.close(fd)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute('CREATE TABLE records (id TEXT PRIMARY KEY, body TEXT)')
+
+    def put(self, record_id, record):
+        self.db.execute(
+            'INSERT OR REPLACE INTO records VALUES (?, ?)',
+            (record_id, json.dumps(record, ensure_ascii=False)),
+        )
+
+    def get(self, record_id):
+        row = self.db.execute('SELECT body FROM records WHERE id = ?', (record_id,)).fetchone()
+        return json.loads(row[0])
+
+    def close(self):
+        self.db.close()
+        os.remove(self.path)
+
+
+def merge(dataset, inputs, output=None, policy='keep-first', trace=None):
+    """Merge input files into a dataset and return merge statistics.
+
+    With a Trace, the resolve, header and write passes are recorded as spans.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    trace = trace or Trace('merge_data')
+
+    spec = DATASETS[dataset]
+    key, id_field = spec['key'], spec['id_field']
+    base = dataset_path(dataset)
+    output = output or base
+    sources = [base] + list(inputs)
+
+    # Pass 1: resolve the winning occurrence of every id. Only ids and their
+    # facet values stay in memory; overriding records are spooled to disk.
+    facets = {}
+    first_source = {}
+    overridden = set()
+    replacements = 0
+    spool = OverrideSpool() if policy == 'last-wins' else None
+    seen = 0
+    try:
+        with trace.span('resolve') as span:
+            for index, source in enumerate(sources):
+                span.read(source)
+                for record in iter_records(source, key):
+                    seen += 1
+                    record_id = record[id_field]
+                    if record_id not in first_source:
+                        first_source[record_id] = index
+                    elif policy == 'keep-first':
+                        continue
+                    else:
+                        overridden.add(record_id)
+                        replacements += 1
+                        spool.put(record_id, record)
+                    facets[record_id] = tuple(record.get(field) for field in spec['facets'].values())
+            span.count(records=seen, ids=len(first_source), overridden=len(overridden))
+
+        with trace.span('header'):
+            header = read_header(base, key)
+            header.setdefault(key, None)
+            metadata = header.get('metadata')
+            if isinstance(metadata, dict):
+                if spec['count_field']:
+                    metadata[spec['count_field']] = len(first_source)
+                # Keep the curated facet order and append newly seen values.
+                for position, name in enumerate(spec['facets']):
+                    existing = list(metadata.get(name, []))
+                    new_values = {v[position] for v in facets.values() if v[position]} - set(existing)
+                    metadata[name] = existing + sorted(new_values)
+
+        # Pass 2: stream every source again, emitting each id once at its
+        # first position with the winning body.
+        def winners():
+            emitted = set()
+            for index, source in enumerate(sources):
+                for record in iter_records(source, key):
+                    record_id = record[id_field]
+                    if record_id in emitted or first_source[record_id] != index:
+                        continue
+                    emitted.add(record_id)
+                    yield spool.get(record_id) if record_id in overridden else record
+
+        with trace.span('write') as span:
+            span.read(*sources)
+            write_document(output, header, key, winners())
+            span.wrote(output)
+            span.count(records=len(first_source))
+    finally:
+        if spool:
+            spool.close()
+
+    base_count = sum(1 for index in first_source.values() if index == 0)
+    return {
+        'read': seen,
+        'total': len(first_source),
+        'added': len(first_source) - base_count,
+        # Every later occurrence either replaces the winner or is skipped.
+        'replaced': replacements,
+        'skipped': seen - len(first_source) - replacements,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('dataset', choices=sorted(DATASETS), help='Target dataset')
+    parser.add_argument('inputs', nargs='+', help='Files to merge, in priority order')
+    parser.add_argument('--policy', choices=POLICIES, default='keep-first', help='Conflict policy')
+    parser.add_argument('--output', help='Write here instead of replacing the dataset file')
+    parser.add_argument('--remove-inputs', action='store_true', help='Delete input files after a successful merge')
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    missing = [path for path in args.inputs if not os.path.exists(path)]
+    if missing:
+        print(f"File not found: {', '.join(missing)}")
+        return 1
+
+    with Trace.from_args('merge_data', args) as trace:
+        stats = merge(args.dataset, args.inputs, args.output, args.policy, trace)
+    print(
+        f"Merged {len(args.inputs)} file(s) into {args.dataset}: "
+        f"{stats['added']} added, {stats['replaced']} replaced, {stats['skipped']} skipped. "
+        f"Total: {stats['total']}"
+    )
+
+    if args.remove_inputs:
+        for path in args.inputs:
+            os.remove(path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Prerender a static HTML page for every /error/<CODE> route.
+
+Each page is the built index.html (same hashed script and style tags, so
+the app still boots) with the error's title, description, canonical URL,
+Open Graph tags and TechArticle JSON-LD in the head, and a lightweight
+rendering of the error (description, message types, causes, fix steps,
+related codes, resources) inside #root. The browser paints that markup
+from the first response; when the bundle loads, React mounts over #root
+and replaces it with the interactive page.
+
+Pages are written as dist/iso20022/error/<CODE>.html, which Cloudflare
+Pages serves for /iso20022/error/<CODE> ahead of the SPA rewrite. Records
+are rendered in slices across a process pool, and a page is only rewritten
+when the hash of its record (or of the template and this renderer)
+changed since the last run and the file still exists.
+
+Usage:
+    python scripts/prerender_errors.py            # after vite build
+    python scripts/prerender_errors.py --force --workers 4
+"""
+
+import argparse
+import html
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from datasets import REPO_ROOT, content_hash, dataset_path, dumps_compact, iter_records, load_json, write_bytes_atomic
+
+DIST_DIR = os.path.join(REPO_ROOT, 'frontend', 'dist', 'iso20022')
+TEMPLATE_FILE = os.path.join(DIST_DIR, 'index.html')
+OUT_DIR = os.path.join(DIST_DIR, 'error')
+CACHE_FILE = os.path.join(REPO_ROOT, '.cache', 'prerender.json')
+SITE_URL = 'https://toolgalaxy.in/iso20022'
+BASE_PATH = '/iso20022'
+SLICE_SIZE = 100
+ROOT_DIV = '<div id="root"></div>'
+
+STYLE = (
+    '<style>'
+    '.pr{max-width:880px;margin:0 auto;padding:32px 20px;color:#e6e6eb;background:#0a0a0f;'
+    'font:15px/1.6 "Geist Sans",system-ui,sans-serif}'
+    '.pr a{color:#8ab4ff}.pr h1{font-size:28px;margin:8px 0}.pr h2{font-size:17px;margin:28px 0 8px}'
+    '.pr code{font-family:"Geist Mono",ui-monospace,monospace;font-size:13px}'
+    '.pr .tag{display:inline-block;padding:2px 8px;margin:0 6px 6px 0;border:1px solid #2a2a35;border-radius:6px;font-size:13px}'
+    '.pr .lead{font-size:17px;color:#fff}'
+    '</style>'
+)
+
+
+def esc(value):
+    return html.escape(str(value), quote=True)
+
+
+def page_title(error):
+    # Same strings ErrorPage passes to useSEO.
+    return f"{error['code']} - {error['name']} | ISO 20022 Error Guide"
+
+
+def page_description(error):
+    short = error.get('description', {}).get('short', '')
+    return f"Learn how to fix {error['code']} ({error['name']}) ISO 20022 payment error. {short}".strip()
+
+
+def render_list(items, ordered=False):
+    tag = 'ol' if ordered else 'ul'
+    return f"<{tag}>{''.join(f'<li>{esc(item)}</li>' for item in items)}</{tag}>"
+
+
+def render_body(error, known_codes):
+    description = error.get('description', {})
+    fix = error.get('how_to_fix', {})
+    parts = [
+        f'{STYLE}<main class="pr">',
+        f'<p><a href="{BASE_PATH}/">MX Error Guide</a> / <a href="{BASE_PATH}/reference">Reference</a></p>',
+        f"<h1><code>{esc(error['code'])}</code> {esc(error['name'])}</h1>",
+        f"<p><span class=\"tag\">{esc(error['category'])}</span><span class=\"tag\">{esc(error['severity'])}</span></p>",
+    ]
+    if description.get('short'):
+        parts.append(f"<p class=\"lead\">{esc(description['short'])}</p>")
+    if description.get('detailed') and description.get('detailed') != description.get('short'):
+        parts.append(f"<p>{esc(description['detailed'])}</p>")
+    if error.get('message_types'):
+        tags = ''.join(f'<span class="tag"><code>{esc(t)}</code></span>' for t in error['message_types'])
+        parts.append(f'<h2>Message types</h2><p>{tags}</p>')
+    if error.get('common_causes'):
+        parts.append(f"<h2>Common causes</h2>{render_list(error['common_causes'])}")
+    if fix.get('steps') or fix.get('prevention'):
+        parts.append('<h2>How to fix</h2>')
+        if fix.get('steps'):
+            parts.append(render_list(fix['steps'], ordered=True))
+        if fix.get('prevention'):
+            parts.append(f"<p><strong>Prevention:</strong> {esc(fix['prevention'])}</p>")
+    if error.get('xpath_locations'):
+        parts.append('<h2>Where it appears</h2>' + render_list(error['xpath_locations']))
+    if error.get('market_practices'):
+        tags = ''.join(f'<span class="tag">{esc(p)}</span>' for p in error['market_practices'])
+        parts.append(f'<h2>Market practices</h2><p>{tags}</p>')
+    related = [code for code in error.get('related_codes', []) if code in known_codes]
+    if related:
+        links = ', '.join(f'<a href="{BASE_PATH}/error/{esc(code)}"><code>{esc(code)}</code></a>' for code in related)
+        parts.append(f'<h2>Related codes</h2><p>{links}</p>')
+    if error.get('resources'):
+        links = ''.join(
+            f"<li><a href=\"{esc(r['url'])}\" rel=\"noopener\">{esc(r['title'])}</a></li>"
+            for r in error['resources'] if r.get('url')
+        )
+        parts.append(f'<h2>Resources</h2><ul>{links}</ul>')
+    parts.append('</main>')
+    return ''.join(parts)
+
+
+def set_meta(document, attr, name, content):
+    pattern = re.compile(rf'(<meta {attr}="{re.escape(name)}" content=")[^"]*(")')
+    if pattern.search(document):
+        return pattern.sub(lambda m: m.group(1) + esc(content) + m.group(2), document, count=1)
+    return document.replace('</head>', f'<meta {attr}="{name}" content="{esc(content)}" />\n</head>', 1)
+
+
+def render_page(template, error, known_codes):
+    title = page_title(error)
+    description = page_description(error)
+    url = f"{SITE_URL}/error/{error['code']}"
+    document = re.sub(r'<title>.*?</title>', lambda _: f'<title>{esc(title)}</title>', template, count=1, flags=re.S)
+    document = re.sub(r'<link rel="canonical" href="[^"]*"', lambda _: f'<link rel="canonical" href="{esc(url)}"', document, count=1)
+    document = set_meta(document, 'name', 'description', description)
+    document = set_meta(document, 'property', 'og:type', 'article')
+    document = set_meta(document, 'property', 'og:url', url)
+    for prefix, attr in (('og', 'property'), ('twitter', 'name')):
+        document = set_meta(document, attr, f'{prefix}:title', title)
+        document = set_meta(document, attr, f'{prefix}:description', description)
+    json_ld = {
+        '@context': 'https://schema.org',
+        '@type': 'TechArticle',
+        'name': f"{error['code']} - {error['name']}",
+        'description': error.get('description', {}).get('short', ''),
+        'about': {'@type': 'Thing', 'name': 'ISO 20022 Payment Error'},
+        'articleSection': error['category'],
+        'url': url,
+    }
+    # "</" cannot appear inside a script element.
+    ld = json.dumps(json_ld, ensure_ascii=False).replace('</', '<\\/')
+    document = document.replace('</head>', f'<script type="application/ld+json">{ld}</script>\n</head>', 1)
+    # The page itself now carries the content the generic noscript block stood in for.
+    document = re.sub(r'\s*<noscript>.*?</noscript>', '', document, count=1, flags=re.S)
+    return document.replace(ROOT_DIV, f'<div id="root">{render_body(error, known_codes)}</div>', 1)
+
+
+def page_path(out_dir, code):
+    return os.path.join(out_dir, f'{code}.html')
+
+
+def render_slice(template, errors, known_codes, out_dir):
+    """Worker: render and write one slice of pages; returns the codes written."""
+    for error in errors:
+        write_bytes_atomic(page_path(out_dir, error['code']), render_page(template, error, known_codes).encode('utf-8'))
+    return [error['code'] for error in errors]
+
+
+def prerender(source, template_file, out_dir, cache_file, workers=None, force=False):
+    with open(template_file, 'r', encoding='utf-8') as f:
+        template = f.read()
+    if ROOT_DIV not in template:
+        raise ValueError(f'{template_file} has no {ROOT_DIV}')
+    with open(os.path.abspath(__file__), 'rb') as f:
+        renderer = f.read()
+    errors = list(iter_records(source, 'errors'))
+    known_codes = {error['code'] for error in errors}
+    base = content_hash(template.encode('utf-8') + renderer)
+
+    cache = load_json(cache_file) if os.path.exists(cache_file) and not force else {}
+    previous = cache.get('pages', {}) if cache.get('out_dir') == out_dir else {}
+    # Related-code links are only rendered for codes that exist, so those are part of the page hash.
+    hashes = {
+        error['code']: content_hash(
+            base.encode('ascii') + dumps_compact(error)
+            + dumps_compact([code for code in error.get('related_codes', []) if code in known_codes])
+        )
+        for error in errors
+    }
+    stale = [
+        error for error in errors
+        if force or previous.get(error['code']) != hashes[error['code']]
+        or not os.path.exists(page_path(out_dir, error['code']))
+    ]
+
+    os.makedirs(out_dir, exist_ok=True)
+    written = 0
+    if stale:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(render_slice, template, stale[start:start + SLICE_SIZE], known_codes, out_dir)
+                for start in range(0, len(stale), SLICE_SIZE)
+            ]
+            for future in futures:
+                written += len(future.result())
+
+    removed = 0
+    for name in os.listdir(out_dir):
+        if name.endswith('.html') and name[:-len('.html')] not in known_codes:
+            os.remove(os.path.join(out_dir, name))
+            removed += 1
+
+    write_bytes_atomic(cache_file, json.dumps({'out_dir': out_dir, 'pages': hashes}, indent=2).encode('utf-8'))
+    return {'pages': len(errors), 'written': written, 'unchanged': len(errors) - written, 'removed': removed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--source', default=dataset_path('errors'), help='Source errors.json')
+    parser.add_argument('--template', default=TEMPLATE_FILE, help='Built index.html to wrap each page in')
+    parser.add_argument('--out', default=OUT_DIR, help='Output directory for <CODE>.html')
+    parser.add_argument('--cache', default=CACHE_FILE, help='Page hashes from the previous run')
+    parser.add_argument('--workers', type=int, help='Process pool size (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='Rewrite every page')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.template):
+        print(f"Template not found: {args.template} (run the vite build first)")
+        return 1
+    stats = prerender(args.source, args.template, os.path.abspath(args.out), args.cache, args.workers, args.force)
+    print(
+        f"Prerendered {stats['pages']} error pages: {stats['written']} written, "
+        f"{stats['unchanged']} unchanged, {stats['removed']} removed"
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Versioned dataset releases with record-level deltas.
+
+Each release of a dataset (identified by its declared version: ``version``
+in errors.json, ``metadata.version`` elsewhere) is snapshotted under
+releases/<dataset>/ and diffed against the previous release. The delta
+holds added records, removed ids and per-record field patches, keyed by
+the dataset's id field (code for errors), plus any changed top-level
+members:
+
+    {"dataset": "errors", "from": "2.0.1", "to": "2.0.2",
+     "header": {"updated": ...}, "header_unset": [],
+     "add": [{...}], "remove": ["XX01"],
+     "patch": {"AC04": {"set": {"name": ...}, "unset": ["resources"]}},
+     "order": [...]}                  # only when the record order changed
+
+Deltas are published as data/deltas/<dataset>/<from>_<to>.<hash>.json with
+a manifest listing the chain. A client holding version N follows the chain
+from N; when N is not in it, the chain is longer than ``max_chain`` or the
+deltas add up to more than the full file, it downloads the full file.
+
+Usage:
+    python scripts/release_deltas.py release [errors ...]    # all datasets by default
+    python scripts/release_deltas.py apply errors old-errors.json --out new.json
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+
+from datasets import (
+    DATA_DIR, DATASETS, REPO_ROOT, content_hash, dataset_path, dumps_compact, load_json, write_bytes_atomic,
+    write_if_changed,
+)
+
+RELEASES_DIR = os.path.join(REPO_ROOT, 'releases')
+DELTAS_DIR = os.path.join(DATA_DIR, 'deltas')
+MANIFEST_NAME = 'manifest.json'
+MAX_CHAIN = 5
+MAX_DELTAS = 20
+
+
+class ReleaseError(Exception):
+    pass
+
+
+def document_version(document):
+    metadata = document.get('metadata')
+    if 'version' in document:
+        return str(document['version'])
+    if isinstance(metadata, dict) and 'version' in metadata:
+        return str(metadata['version'])
+    raise ReleaseError('dataset has no version field')
+
+
+def split_document(document, key):
+    header = {name: value for name, value in document.items() if name != key}
+    return header, document[key]
+
+
+_MISSING = object()
+
+
+def diff(old_document, new_document, key, id_field):
+    """Record-level delta turning old_document into new_document."""
+    old_header, old_records = split_document(old_document, key)
+    new_header, new_records = split_document(new_document, key)
+    old_by_id = {record[id_field]: record for record in old_records}
+    new_ids = {record[id_field] for record in new_records}
+
+    delta = {
+        'header': {name: value for name, value in new_header.items() if old_header.get(name) != value},
+        'header_unset': [name for name in old_header if name not in new_header],
+        'add': [],
+        'remove': [record_id for record_id in old_by_id if record_id not in new_ids],
+        'patch': {},
+    }
+    for record in new_records:
+        previous = old_by_id.get(record[id_field])
+        if previous is None:
+            delta['add'].append(record)
+        elif previous != record:
+            delta['patch'][record[id_field]] = {
+                'set': {name: value for name, value in record.items() if previous.get(name, _MISSING) != value},
+                'unset': [name for name in previous if name not in record],
+            }
+
+    # apply() keeps surviving records in place and appends additions.
+    applied_order = [i for i in old_by_id if i in new_ids] + [r[id_field] for r in delta['add']]
+    new_order = [record[id_field] for record in new_records]
+    if applied_order != new_order:
+        delta['order'] = new_order
+    return delta
+
+
+def apply(document, delta, key, id_field):
+    """Apply one delta to a dataset document; returns the new document."""
+    header, records = split_document(document, key)
+    removed = set(delta['remove'])
+    patched = []
+    for record in records:
+        if record[id_field] in removed:
+            continue
+        patch = delta['patch'].get(record[id_field])
+        if patch:
+            record = {name: value for name, value in record.items() if name not in patch['unset']}
+            record.update(patch['set'])
+        patched.append(record)
+    patched.extend(delta['add'])
+    if 'order' in delta:
+        by_id = {record[id_field]: record for record in patched}
+        patched = [by_id[record_id] for record_id in delta['order']]
+
+    result = {name: value for name, value in header.items() if name not in delta['header_unset']}
+    result.update(delta['header'])
+    # Keep the records member where the new document has it.
+    ordered = {}
+    for name in list(document) + [name for name in result if name not in document]:
+        if name == key:
+            ordered[key] = patched
+        elif name in result:
+            ordered[name] = result[name]
+    return ordered
+
+
+def snapshot_path(dataset, version):
+    return os.path.join(RELEASES_DIR, dataset, f'{version}.json.gz')
+
+
+def read_snapshot(dataset, version):
+    with gzip.open(snapshot_path(dataset, version), 'rb') as f:
+        return json.loads(f.read())
+
+
+def write_snapshot(dataset, version, document):
+    # mtime=0 keeps snapshots byte-identical across runs.
+    payload = gzip.compress(dumps_compact(document), compresslevel=9, mtime=0)
+    write_bytes_atomic(snapshot_path(dataset, version), payload)
+
+
+def load_manifest(dataset):
+    path = os.path.join(DELTAS_DIR, dataset, MANIFEST_NAME)
+    return load_json(path) if os.path.exists(path) else None
+
+
+def write_manifest(dataset, version, max_chain, deltas):
+    """Write the dataset's manifest, describing the file as it is on disk now; returns True if it changed."""
+    path = dataset_path(dataset)
+    with open(path, 'rb') as f:
+        full = f.read()
+    manifest = {
+        'dataset': dataset,
+        'latest': version,
+        'full': {'file': os.path.basename(path), 'bytes': len(full), 'hash': content_hash(full)},
+        'max_chain': max_chain,
+        'deltas': deltas,
+    }
+    return write_if_changed(os.path.join(DELTAS_DIR, dataset, MANIFEST_NAME), dumps_compact(manifest))
+
+
+def release(dataset, max_chain=MAX_CHAIN, max_deltas=MAX_DELTAS):
+    """Snapshot the current dataset and emit a delta from the previous release."""
+    spec = DATASETS[dataset]
+    path = dataset_path(dataset)
+    document = load_json(path)
+    version = document_version(document)
+    manifest = load_manifest(dataset)
+    previous = manifest['latest'] if manifest else None
+
+    if previous == version:
+        if read_snapshot(dataset, version) != document:
+            raise ReleaseError(f'{dataset} changed but is still version {version}; bump the version first')
+        # Same content, but the bytes may differ (a reformatted file): the
+        # full entry's size and hash must still describe what clients get.
+        if write_manifest(dataset, version, max_chain, manifest['deltas']):
+            return {'from': previous, 'to': version, 'delta': None, 'refreshed': True}
+        return None
+
+    deltas = list(manifest['deltas']) if manifest else []
+    out_dir = os.path.join(DELTAS_DIR, dataset)
+    entry = None
+    if previous is not None:
+        delta = diff(read_snapshot(dataset, previous), document, spec['key'], spec['id_field'])
+        delta = {'dataset': dataset, 'from': previous, 'to': version, **delta}
+        payload = dumps_compact(delta)
+        name = f'{previous}_{version}.{content_hash(payload)}.json'
+        write_if_changed(os.path.join(out_dir, name), payload)
+        entry = {
+            'from': previous,
+            'to': version,
+            'file': name,
+            'bytes': len(payload),
+            'add': len(delta['add']),
+            'remove': len(delta['remove']),
+            'patch': len(delta['patch']),
+        }
+        deltas = (deltas + [entry])[-max_deltas:]
+
+    write_snapshot(dataset, version, document)
+    if previous is not None and os.path.exists(snapshot_path(dataset, previous)):
+        os.remove(snapshot_path(dataset, previous))
+
+    write_manifest(dataset, version, max_chain, deltas)
+
+    live = {item['file'] for item in deltas}
+    for name in os.listdir(out_dir):
+        if re.match(r'^.+_.+\.[0-9a-f]{10}\.json$', name) and name not in live:
+            os.remove(os.path.join(out_dir, name))
+    return {'from': previous, 'to': version, 'delta': entry}
+
+
+def plan_chain(manifest, version):
+    """Deltas leading from version to latest, or None if a full download is better."""
+    if version == manifest['latest']:
+        return []
+    by_from = {item['from']: item for item in manifest['deltas']}
+    chain = []
+    while version != manifest['latest']:
+        item = by_from.get(version)
+        if item is None:
+            return None
+        chain.append(item)
+        version = item['to']
+    if len(chain) > manifest['max_chain'] or sum(item['bytes'] for item in chain) >= manifest['full']['bytes']:
+        return None
+    return chain
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+    rel = sub.add_parser('release', help='Snapshot datasets and emit deltas from the previous release')
+    rel.add_argument('datasets', nargs='*', help=f"Datasets to release (default: all of {', '.join(DATASETS)})")
+    rel.add_argument('--max-chain', type=int, default=MAX_CHAIN, help='Longest chain a client should apply')
+    rel.add_argument('--max-deltas', type=int, default=MAX_DELTAS, help='Deltas kept in the manifest')
+    app = sub.add_parser('apply', help='Bring an older copy up to date through the delta chain')
+    app.add_argument('dataset', choices=sorted(DATASETS))
+    app.add_argument('base', help='Dataset file at an older release')
+    app.add_argument('--out', required=True)
+    args = parser.parse_args()
+
+    if args.command == 'release':
+        unknown = [name for name in args.datasets if name not in DATASETS]
+        if unknown:
+            print(f"Unknown dataset(s): {', '.join(unknown)}")
+            return 1
+        status = 0
+        for dataset in args.datasets or list(DATASETS):
+            try:
+                result = release(dataset, args.max_chain, args.max_deltas)
+            except ReleaseError as exc:
+                print(f"  {dataset}: {exc}")
+                status = 1
+                continue
+            if result is None:
+                print(f"  {dataset}: already released")
+            elif result.get('refreshed'):
+                print(f"  {dataset}: {result['to']} already released; manifest updated for the reformatted file")
+            elif result['delta'] is None:
+                print(f"  {dataset}: first release {result['to']} snapshotted")
+            else:
+                delta = result['delta']
+                print(
+                    f"  {dataset}: {delta['from']} -> {delta['to']}: +{delta['add']} -{delta['remove']} "
+                    f"~{delta['patch']} ({delta['bytes'] / 1024:.1f} KB)"
+                )
+        return status
+
+    spec = DATASETS[args.dataset]
+    manifest = load_manifest(args.dataset)
+    document = load_json(args.base)
+    chain = plan_chain(manifest, document_version(document)) if manifest else None
+    if chain is None:
+        print(f"No usable delta chain from {document_version(document)}; download {manifest['full']['file'] if manifest else 'the full file'}")
+        return 1
+    for item in chain:
+        delta = load_json(os.path.join(DELTAS_DIR, args.dataset, item['file']))
+        document = apply(document, delta, spec['key'], spec['id_field'])
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2, ensure_ascii=False)
+    print(f"Applied {len(chain)} delta(s): now at {document_version(document)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
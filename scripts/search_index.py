@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Prebuilt inverted search index for errors.json, plus the reference query engine.
+
+The index stores, for every token in the searchable fields, a postings list of
+(document, score) pairs. Scores are BM25-style term weights already multiplied
+by the field weights the UI used with Fuse.js (code 2, name 1.5, short
+description 1, detailed description 0.8). Synonym expansions from
+frontend/src/utils/synonyms.ts are resolved at build time.
+
+The query engine here is the reference for frontend/src/utils/searchIndex.ts;
+both must produce the same ranking for the same index.
+
+``parity`` writes the reference rankings for a fixed set of queries to
+frontend/e2e/fixtures/search-parity.json; e2e/search-parity.spec.ts runs
+the same queries through searchIndex.ts and expects the same codes.
+
+Usage:
+    python scripts/search_index.py build
+    python scripts/search_index.py query "account closed"
+    python scripts/search_index.py parity
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+
+from datasets import DATA_DIR, ERRORS_FILE, REPO_ROOT, content_hash, dumps_compact, load_json, write_if_changed
+
+INDEX_FILE = os.path.join(DATA_DIR, 'search', 'errors_index.json')
+SYNONYMS_FILE = os.path.join(REPO_ROOT, 'frontend', 'src', 'utils', 'synonyms.ts')
+PARITY_FILE = os.path.join(REPO_ROOT, 'frontend', 'e2e', 'fixtures', 'search-parity.json')
+INDEX_VERSION = 1
+
+# Exact, prefix, plural, fuzzy, multi-token and synonym-fallback cases.
+PARITY_QUERIES = [
+    'AC04', 'account closed', 'closed accounts', 'charge', 'charges', 'fees', 'returns',
+    'duplicate payment', 'insufficent funds', 'benificiary', 'timeout', 'invalid iban',
+    'sanctions', 'addresses', 'cut off', 'xyzzy',
+]
+PARITY_LIMIT = 25
+
+# Mirrors the Fuse.js keys previously used by useErrorSearch.
+FIELDS = [
+    ('code', 2.0),
+    ('name', 1.5),
+    ('description.short', 1.0),
+    ('description.detailed', 0.8),
+]
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+SCORE_SCALE = 100
+
+# Query-time match quality factors (must match searchIndex.ts).
+PREFIX_FACTOR = 0.7
+PLURAL_FACTOR = 0.9
+FUZZY_FACTOR = 0.5
+FUZZY_MIN_SIMILARITY = 0.5
+MIN_PREFIX_LENGTH = 2
+MIN_FUZZY_LENGTH = 4
+MIN_SINGULAR_LENGTH = 3
+SYNONYM_FALLBACK_BELOW = 5
+
+CAMEL_RE = re.compile(r'([a-z])([A-Z])')
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+SYNONYM_LINE_RE = re.compile(r"^\s*([a-z0-9_]+):\s*\[(.*)\],?\s*$")
+QUOTED_RE = re.compile(r"'([^']*)'")
+
+
+def tokenize(text):
+    """Split camelCase, lowercase and keep ASCII alphanumeric runs."""
+    if not text:
+        return []
+    return TOKEN_RE.findall(CAMEL_RE.sub(r'\1 \2', text).lower())
+
+
+def singular_forms(token):
+    """Light plural fold: charges -> charge, charg; fees -> fee. Not a stemmer."""
+    if token.endswith('ss') or not token.endswith('s'):
+        return []
+    forms = [token[:-1]] if len(token) > MIN_SINGULAR_LENGTH else []
+    if token.endswith('es') and len(token) > MIN_SINGULAR_LENGTH + 2:
+        forms.append(token[:-2])
+    return forms
+
+
+def field_value(record, path):
+    value = record
+    for part in path.split('.'):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value if isinstance(value, str) else ''
+
+
+def load_synonyms(path=SYNONYMS_FILE):
+    """Parse SEARCH_SYNONYMS out of synonyms.ts."""
+    synonyms = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            match = SYNONYM_LINE_RE.match(line)
+            if match:
+                synonyms[match.group(1)] = QUOTED_RE.findall(match.group(2))
+    return synonyms
+
+
+def expand_synonyms(synonyms):
+    """Precompute expandQueryWithSynonyms for every word it can affect."""
+    expansions = {}
+    for key, values in synonyms.items():
+        expansions.setdefault(key, []).extend(values)
+        for value in values:
+            if ' ' not in value:
+                expansions.setdefault(value, []).append(key)
+
+    result = {}
+    for word, phrases in sorted(expansions.items()):
+        tokens = []
+        for phrase in phrases:
+            for token in tokenize(phrase):
+                if token != word and token not in tokens:
+                    tokens.append(token)
+        if tokens:
+            result[word] = tokens
+    return result
+
+
+def build_index(errors, synonyms):
+    """Build the serializable index structure from error records."""
+    field_lengths = [[] for _ in FIELDS]
+    doc_tokens = []
+    for error in errors:
+        per_field = []
+        for position, (path, _) in enumerate(FIELDS):
+            tokens = tokenize(field_value(error, path))
+            per_field.append(tokens)
+            field_lengths[position].append(len(tokens))
+        doc_tokens.append(per_field)
+
+    averages = [max(sum(lengths) / max(len(lengths), 1), 1.0) for lengths in field_lengths]
+
+    postings = {}
+    for doc, per_field in enumerate(doc_tokens):
+        scores = {}
+        for position, tokens in enumerate(per_field):
+            if not tokens:
+                continue
+            weight = FIELDS[position][1]
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * len(tokens) / averages[position])
+            counts = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, tf in counts.items():
+                scores[token] = scores.get(token, 0.0) + weight * tf * (BM25_K1 + 1) / (tf + norm)
+        for token, score in scores.items():
+            postings.setdefault(token, []).append((doc, max(1, round(score * SCORE_SCALE))))
+
+    terms = sorted(postings)
+    encoded = []
+    for term in terms:
+        # Flattened [gap, score, gap, score, ...] with delta-encoded doc ids.
+        flat = []
+        previous = 0
+        for doc, score in postings[term]:
+            flat.extend((doc - previous, score))
+            previous = doc
+        encoded.append(flat)
+
+    return {
+        'version': INDEX_VERSION,
+        'docs': [error['code'] for error in errors],
+        'terms': terms,
+        'postings': encoded,
+        'synonyms': expand_synonyms(synonyms),
+    }
+
+
+def write_index(errors_file=ERRORS_FILE, out_file=INDEX_FILE, synonyms_file=SYNONYMS_FILE):
+    """Build and write the index; returns (index, changed)."""
+    data = load_json(errors_file)
+    index = build_index(data['errors'], load_synonyms(synonyms_file))
+    index['source'] = {
+        'version': data.get('version'),
+        'updated': data.get('updated'),
+        'hash': content_hash(dumps_compact(data['errors'])),
+    }
+    return index, write_if_changed(out_file, dumps_compact(index))
+
+
+def trigrams(word):
+    padded = f' {word} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Reference query engine over a loaded index document."""
+
+    def __init__(self, index):
+        self.docs = index['docs']
+        self.terms = index['terms']
+        self.synonyms = index['synonyms']
+        self.postings = []
+        for flat in index['postings']:
+            decoded = []
+            doc = 0
+            for i in range(0, len(flat), 2):
+                doc += flat[i]
+                decoded.append((doc, flat[i + 1]))
+            self.postings.append(decoded)
+        self.term_ids = {term: i for i, term in enumerate(self.terms)}
+        self._trigrams = None
+
+    def _idf(self, term_id):
+        n = len(self.docs)
+        df = len(self.postings[term_id])
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def _prefix_range(self, token):
+        lo, hi = 0, len(self.terms)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.terms[mid] < token:
+                lo = mid + 1
+            else:
+                hi = mid
+        start = lo
+        while lo < len(self.terms) and self.terms[lo].startswith(token):
+            lo += 1
+        return range(start, lo)
+
+    def _fuzzy(self, token):
+        if self._trigrams is None:
+            self._trigrams = {}
+            for term_id, term in enumerate(self.terms):
+                for gram in trigrams(term):
+                    self._trigrams.setdefault(gram, []).append(term_id)
+        grams = trigrams(token)
+        shared = {}
+        for gram in grams:
+            for term_id in self._trigrams.get(gram, ()):
+                shared[term_id] = shared.get(term_id, 0) + 1
+        matches = []
+        for term_id, common in shared.items():
+            similarity = 2 * common / (len(grams) + len(trigrams(self.terms[term_id])))
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                matches.append((term_id, FUZZY_FACTOR * similarity))
+        return matches
+
+    def match_terms(self, token):
+        """Return [(term_id, factor)] for a query token.
+
+        Exact and prefix matches of the token and of its singular forms (best
+        factor per term), then fuzzy matches only if none of those hit.
+        """
+        factors = {}
+        for form, exact_factor in [(token, 1.0)] + [(form, PLURAL_FACTOR) for form in singular_forms(token)]:
+            candidates = []
+            exact = self.term_ids.get(form)
+            if exact is not None:
+                candidates.append((exact, exact_factor))
+            if len(form) >= MIN_PREFIX_LENGTH:
+                candidates.extend((term_id, PREFIX_FACTOR) for term_id in self._prefix_range(form))
+            for term_id, factor in candidates:
+                if factor > factors.get(term_id, 0.0):
+                    factors[term_id] = factor
+        if not factors and len(token) >= MIN_FUZZY_LENGTH:
+            return self._fuzzy(token)
+        return sorted(factors.items())
+
+    def score_token(self, token):
+        """Best score per doc for one query token across its matching terms."""
+        scores = {}
+        for term_id, factor in self.match_terms(token):
+            weight = self._idf(term_id) * factor
+            for doc, score in self.postings[term_id]:
+                value = score * weight
+                if value > scores.get(doc, 0.0):
+                    scores[doc] = value
+        return scores
+
+    def rank(self, tokens, require_all):
+        totals = {}
+        hits = {}
+        for token in tokens:
+            for doc, value in self.score_token(token).items():
+                totals[doc] = totals.get(doc, 0.0) + value
+                hits[doc] = hits.get(doc, 0) + 1
+        docs = [doc for doc in totals if not require_all or hits[doc] == len(tokens)]
+        docs.sort(key=lambda doc: (-round(totals[doc], 6), doc))
+        return docs
+
+    def search(self, query):
+        """Return matching error codes, best first (mirrors useErrorSearch)."""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        results = self.rank(tokens, require_all=True)
+        if len(results) < SYNONYM_FALLBACK_BELOW:
+            expanded = list(tokens)
+            for word in query.lower().split():
+                for token in self.synonyms.get(word, ()):
+                    if token not in expanded:
+                        expanded.append(token)
+            if len(expanded) > len(tokens):
+                seen = set(results)
+                results.extend(doc for doc in self.rank(expanded, require_all=False) if doc not in seen)
+        return [self.docs[doc] for doc in results]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+    build = sub.add_parser('build', help='Write the search index')
+    build.add_argument('--errors', default=ERRORS_FILE)
+    build.add_argument('--out', default=INDEX_FILE)
+    parity = sub.add_parser('parity', help='Write reference rankings for the frontend parity test')
+    parity.add_argument('--index', default=INDEX_FILE)
+    parity.add_argument('--out', default=PARITY_FILE)
+    query = sub.add_parser('query', help='Run a query against the built index')
+    query.add_argument('text')
+    query.add_argument('--index', default=INDEX_FILE)
+    query.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        index, changed = write_index(args.errors, args.out)
+        size = os.path.getsize(args.out)
+        print(
+            f"Indexed {len(index['docs'])} errors: {len(index['terms'])} terms, "
+            f"{len(index['synonyms'])} synonym entries, {size / 1024:.1f} KB"
+            + ('' if changed else ' (unchanged)')
+        )
+        return 0
+
+    if args.command == 'parity':
+        index = load_json(args.index)
+        engine = SearchIndex(index)
+        fixture = {
+            'source': index['source'],
+            'limit': PARITY_LIMIT,
+            'queries': {query: engine.search(query)[:PARITY_LIMIT] for query in PARITY_QUERIES},
+        }
+        changed = write_if_changed(args.out, (json.dumps(fixture, indent=2) + '\n').encode('utf-8'))
+        print(f"Wrote {len(PARITY_QUERIES)} reference queries to {args.out}" + ('' if changed else ' (unchanged)'))
+        return 0
+
+    engine = SearchIndex(load_json(args.index))
+    results = engine.search(args.text)
+    print(f"{len(results)} results for {args.text!r}")
+    for code in results[:args.limit]:
+        print(f"  {code}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
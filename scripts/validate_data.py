@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Schema validation and integrity checks for every data file.
+
+Checks:
+    schema            each record against the declared schema below
+    duplicate-id      ids (and error codes) are unique within a dataset
+    metadata-count    example_count / term_count / message_count match
+    chunk-manifest    chunks/index.json totals, per-chunk counts and files
+                      match the chunk contents and errors.json
+
+Files are validated across a process pool, one task per dataset and per
+chunk file, so each file is parsed once, by the worker that checks it. Findings are machine-readable JSON;
+with --cache, files whose content hash is unchanged reuse their previous
+findings, so incremental runs only revalidate what changed.
+
+Usage:
+    python scripts/validate_data.py [--json] [--out findings.json]
+    python scripts/validate_data.py --cache .cache/validate.json --workers 8
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from datasets import CHUNKS_DIR, DATASETS, REPO_ROOT, dataset_path, load_json, read_header
+
+
+class Optional:
+    def __init__(self, spec):
+        self.spec = spec
+
+
+class AnyOf:
+    def __init__(self, *specs):
+        self.specs = specs
+
+
+class Enum:
+    def __init__(self, *values):
+        self.values = values
+
+
+class MapOf:
+    """Free-form object whose values all match spec."""
+
+    def __init__(self, spec):
+        self.spec = spec
+
+
+ANY = object()
+
+ERROR_SCHEMA = {
+    'id': str,
+    'code': str,
+    'name': str,
+    'category': str,
+    'severity': Enum('fatal', 'temporary', 'warning'),
+    'message_types': [str],
+    'description': {'short': str, 'detailed': str},
+    'common_causes': [str],
+    'how_to_fix': {'steps': [str], 'prevention': str},
+    'xpath_locations': [str],
+    'related_codes': [str],
+    'market_practices': [str],
+    'resources': [{'title': str, 'url': str, 'type': str}],
+    'metadata': {'added_date': str, 'last_verified': str, 'contributor': str, 'confidence': str},
+}
+
+MESSAGE_SCHEMA = {
+    'id': str,
+    'full_id': Optional(str),
+    'name': str,
+    'business_area': str,
+    'business_area_name': str,
+    'purpose': str,
+    'usage': Optional(str),
+    'mt_equivalent': AnyOf([str], str, None),
+    'real_world_use_cases': [str],
+    'when_used': str,
+    'used_in_systems': [str],
+    'key_elements': AnyOf(MapOf(str), [ANY]),
+    'sample_xml': str,
+    'sources': Optional([ANY]),
+    'documentation_url': Optional(str),
+}
+
+BRANCH_SCHEMA = {'condition': str, 'next_step': int}
+
+EXAMPLE_SCHEMA = {
+    'id': str,
+    'title': str,
+    'difficulty': Enum('beginner', 'intermediate', 'advanced'),
+    'category': str,
+    'characters': MapOf({'name': str, 'role': str, 'country': str, 'bank': str}),
+    'scenario': str,
+    'steps': [{
+        'step': int,
+        'actor': str,
+        'target': Optional(str),
+        'action': str,
+        'description': str,
+        'technical': str,
+        'message_type': str,
+        'key_fields': [str],
+        'decision_point': Optional(bool),
+        'decision_question': Optional(str),
+        'branches': Optional({'success': BRANCH_SCHEMA, 'failure': BRANCH_SCHEMA}),
+        'branch_type': Optional(Enum('success', 'failure', 'main')),
+        'branch_label': Optional(str),
+    }],
+    'possible_errors': [{'error_code': str, 'scenario': str, 'result': str, 'message_type': str}],
+    'related_messages': [str],
+    'related_terms': [str],
+    'key_takeaways': [str],
+    'has_branches': Optional(bool),
+}
+
+TERM_SCHEMA = {
+    'id': str,
+    'display_name': str,
+    'aliases': [str],
+    'category': str,
+    'explanations': {'business': str, 'technical': str, 'simple': str},
+    'also_known_as': MapOf(str),
+    'related_terms': [str],
+    'appears_in': [str],
+}
+
+SCHEMAS = {
+    'errors': ERROR_SCHEMA,
+    'messages': MESSAGE_SCHEMA,
+    'examples': EXAMPLE_SCHEMA,
+    'glossary': TERM_SCHEMA,
+}
+
+# Extra fields that must be unique besides the dataset id field.
+UNIQUE_FIELDS = {'errors': ['id']}
+
+
+def describe(spec):
+    if spec is None:
+        return 'null'
+    if isinstance(spec, type):
+        return spec.__name__
+    if isinstance(spec, list):
+        return 'list'
+    if isinstance(spec, (dict, MapOf)):
+        return 'object'
+    if isinstance(spec, Enum):
+        return 'one of ' + '/'.join(spec.values)
+    if isinstance(spec, AnyOf):
+        return ' or '.join(describe(option) for option in spec.specs)
+    return 'any'
+
+
+def check(value, spec, path):
+    """Yield (path, message) for every mismatch between value and spec."""
+    if spec is ANY:
+        return
+    if isinstance(spec, Optional):
+        yield from check(value, spec.spec, path)
+    elif spec is None:
+        if value is not None:
+            yield path, f'expected null, got {type(value).__name__}'
+    elif isinstance(spec, AnyOf):
+        if not any(not list(check(value, option, path)) for option in spec.specs):
+            yield path, f'expected {describe(spec)}, got {type(value).__name__}'
+    elif isinstance(spec, Enum):
+        if value not in spec.values:
+            yield path, f'expected {describe(spec)}, got {value!r}'
+    elif isinstance(spec, list):
+        if not isinstance(value, list):
+            yield path, f'expected list, got {type(value).__name__}'
+            return
+        for i, item in enumerate(value):
+            yield from check(item, spec[0], f'{path}[{i}]')
+    elif isinstance(spec, MapOf):
+        if not isinstance(value, dict):
+            yield path, f'expected object, got {type(value).__name__}'
+            return
+        for key, item in value.items():
+            yield from check(item, spec.spec, f'{path}.{key}')
+    elif isinstance(spec, dict):
+        if not isinstance(value, dict):
+            yield path, f'expected object, got {type(value).__name__}'
+            return
+        for key, field_spec in spec.items():
+            if key in value:
+                yield from check(value[key], field_spec, f'{path}.{key}' if path else key)
+            elif not isinstance(field_spec, Optional):
+                yield (f'{path}.{key}' if path else key), 'missing required field'
+        for key in value:
+            if key not in spec:
+                yield (f'{path}.{key}' if path else key), 'unexpected field'
+    elif spec is int:
+        # bool is an int subclass; never accept it for a numeric field.
+        if not isinstance(value, int) or isinstance(value, bool):
+            yield path, f'expected int, got {type(value).__name__}'
+    elif not isinstance(value, spec):
+        yield path, f'expected {spec.__name__}, got {type(value).__name__}'
+
+
+def relpath(path):
+    return os.path.relpath(path, REPO_ROOT)
+
+
+def finding(path, rule, message, record=None, field=None):
+    return {'file': relpath(path), 'rule': rule, 'record': record, 'field': field, 'message': message}
+
+
+def validate_file(dataset, path, key):
+    """Worker: schema-check every record of one file; returns (findings, ids)."""
+    spec = DATASETS[dataset]
+    schema = SCHEMAS[dataset]
+    id_fields = [spec['id_field']] + UNIQUE_FIELDS.get(dataset, [])
+    findings = []
+    ids = {field: [] for field in id_fields}
+    for index, record in enumerate(load_json(path)[key]):
+        label = record.get(spec['id_field'], f'#{index}') if isinstance(record, dict) else f'#{index}'
+        for field, message in check(record, schema, ''):
+            findings.append(finding(path, 'schema', message, label, field))
+        for field in id_fields:
+            if isinstance(record, dict) and field in record:
+                ids[field].append(record[field])
+    return findings, ids
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def plan_tasks(cache):
+    """Return (targets, tasks, reused, hashes); reused maps file -> cached result."""
+    tasks = []
+    reused = {}
+    targets = [(name, dataset_path(name), DATASETS[name]['key']) for name in DATASETS]
+    manifest_path = os.path.join(CHUNKS_DIR, 'index.json')
+    if os.path.exists(manifest_path):
+        for entry in load_json(manifest_path).get('chunks', []):
+            chunk_path = os.path.join(CHUNKS_DIR, entry['file'])
+            if os.path.exists(chunk_path):
+                targets.append(('errors', chunk_path, 'errors'))
+
+    hashes = {}
+    for dataset, path, key in targets:
+        hashes[path] = file_hash(path)
+        cached = cache.get(relpath(path))
+        if cached and cached['hash'] == hashes[path]:
+            reused[path] = cached
+            continue
+        tasks.append((dataset, path, key))
+    return targets, tasks, reused, hashes
+
+
+def duplicates(values):
+    seen = set()
+    dupes = []
+    for value in values:
+        if value in seen and value not in dupes:
+            dupes.append(value)
+        seen.add(value)
+    return dupes
+
+
+def check_integrity(per_file):
+    """Cross-record checks on merged per-file results."""
+    findings = []
+    for name, spec in DATASETS.items():
+        path = dataset_path(name)
+        ids = per_file[path]['ids']
+        for field, values in ids.items():
+            for value in duplicates(values):
+                findings.append(finding(path, 'duplicate-id', f'duplicate {field} {value!r}', value, field))
+
+        count_field = spec['count_field']
+        if count_field:
+            metadata = read_header(path, spec['key']).get('metadata') or {}
+            actual = len(ids[spec['id_field']])
+            if metadata.get(count_field) != actual:
+                findings.append(finding(
+                    path, 'metadata-count',
+                    f'metadata.{count_field} is {metadata.get(count_field)!r}, records: {actual}',
+                    field=f'metadata.{count_field}',
+                ))
+
+    manifest_path = os.path.join(CHUNKS_DIR, 'index.json')
+    if not os.path.exists(manifest_path):
+        return findings
+    manifest = load_json(manifest_path)
+    chunk_codes = []
+    for entry in manifest.get('chunks', []):
+        chunk_path = os.path.join(CHUNKS_DIR, entry['file'])
+        if chunk_path not in per_file:
+            findings.append(finding(manifest_path, 'chunk-manifest', f"missing chunk file {entry['file']}"))
+            continue
+        codes = per_file[chunk_path]['ids']['code']
+        chunk_codes.extend(codes)
+        if entry.get('count') != len(codes):
+            findings.append(finding(
+                manifest_path, 'chunk-manifest',
+                f"{entry['file']} count is {entry.get('count')}, records: {len(codes)}",
+            ))
+
+    error_codes = per_file[dataset_path('errors')]['ids']['code']
+    if manifest.get('total_errors') != len(error_codes):
+        findings.append(finding(
+            manifest_path, 'chunk-manifest',
+            f"total_errors is {manifest.get('total_errors')}, errors.json has {len(error_codes)}",
+            field='total_errors',
+        ))
+    if sorted(chunk_codes) != sorted(error_codes):
+        findings.append(finding(manifest_path, 'chunk-manifest', 'chunks do not cover errors.json exactly'))
+    return findings
+
+
+def validate(workers=None, cache_file=None):
+    """Run every check; returns the list of findings."""
+    cache = load_json(cache_file) if cache_file and os.path.exists(cache_file) else {}
+    targets, tasks, reused, hashes = plan_tasks(cache)
+
+    per_file = {path: dict(result) for path, result in reused.items()}
+    if tasks:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(task[1], pool.submit(validate_file, *task)) for task in tasks]
+            for path, future in futures:
+                file_findings, ids = future.result()
+                per_file[path] = {'hash': hashes[path], 'findings': file_findings, 'ids': ids}
+
+    findings = []
+    for _, path, _ in targets:
+        findings.extend(per_file[path]['findings'])
+    findings.extend(check_integrity(per_file))
+
+    if cache_file:
+        os.makedirs(os.path.dirname(os.path.abspath(cache_file)), exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump({relpath(path): result for path, result in per_file.items()}, f)
+    return findings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, help='Process pool size (default: CPU count)')
+    parser.add_argument('--cache', help='Reuse findings for unchanged files via this cache file')
+    parser.add_argument('--json', action='store_true', help='Print findings as JSON')
+    parser.add_argument('--out', help='Also write findings JSON to this file')
+    args = parser.parse_args()
+
+    findings = validate(args.workers, args.cache)
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(findings, f, indent=2)
+
+    if args.json:
+        print(json.dumps(findings, indent=2))
+    else:
+        for item in findings:
+            where = ' '.join(str(part) for part in (item['record'], item['field']) if part is not None)
+            print(f"{item['file']}: [{item['rule']}] {where + ': ' if where else ''}{item['message']}")
+        print(f"{len(findings)} finding(s)")
+    return 1 if findings else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())